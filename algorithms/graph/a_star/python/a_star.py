@@ -6,51 +6,121 @@ Time Complexity:
 - With a good heuristic: much faster in practice.
 
 Space Complexity:
-- O(V) where V = number of vertices (for storing scores and open set).
+- O(V) where V = number of vertices (for storing scores and open set);
+  only nodes reached by the search are stored.
+
+The graph may also be passed as a CSRGraph
+(data_structures/Graph/python/csr_graph.py); the heuristic still receives
+node labels and the returned path is made of labels.
 """
 
 import heapq
+from array import array
+
+from data_structures.Graph.python.csr_graph import CSRGraph
 
+INF = float('inf')
 
-def a_star(start, goal, graph, heuristic):
+
+def a_star(start, goal, graph, heuristic, consistent=False):
     """
     A* Search Algorithm
 
+    Score maps are filled lazily as nodes are reached (so a short search on a
+    huge graph only touches the nodes it explores), heuristic(node, goal) is
+    evaluated at most once per node, and among open nodes with equal f-score
+    the one with the higher g-score (closer to the goal) is expanded first.
+
     :param start: Starting node
     :param goal: Goal node
     :param graph: Adjacency list with edge costs
                   Example: {'A': {'B': 1, 'C': 4}, 'B': {'C': 2, 'D': 5}, ...}
     :param heuristic: Function estimating cost from a node to the goal
+    :param consistent: pass True if the heuristic is consistent
+                       (h(u) <= cost(u, v) + h(v) for every edge, e.g.
+                       Manhattan distance on a grid): expanded nodes are then
+                       final and kept in a closed set, which skips all
+                       re-expansion work. With the default False the
+                       heuristic only needs to be admissible, and a node is
+                       re-expanded when a cheaper path to it is found.
     :return: Shortest path as a list of nodes, or None if no path exists
     """
-    open_set = []
-    heapq.heappush(open_set, (heuristic(start, goal), start))  # (f_score, node)
+    if isinstance(graph, CSRGraph):
+        return _a_star_csr(start, goal, graph, heuristic, consistent)
 
+    h_cache = {start: heuristic(start, goal)}
+    g_score = {start: 0}
     came_from = {}  # Path reconstruction map
+    closed = set()
 
-    g_score = {node: float('inf') for node in graph}
-    g_score[start] = 0
-
-    f_score = {node: float('inf') for node in graph}
-    f_score[start] = heuristic(start, goal)
+    # (f_score, -g_score, node): ties on f prefer the deeper node
+    open_set = [(h_cache[start], 0, start)]
 
     while open_set:
-        # Get node with lowest f-score efficiently
-        _, current = heapq.heappop(open_set)
+        _, neg_g, current = heapq.heappop(open_set)
+        if -neg_g > g_score[current] or current in closed:
+            continue  # stale entry
 
         if current == goal:
             return reconstruct_path(came_from, current)
+        if consistent:
+            closed.add(current)
+
+        current_g = -neg_g
+        for neighbor, cost in graph.get(current, {}).items():
+            if neighbor in closed:
+                continue
+            tentative_g = current_g + cost
+            if tentative_g < g_score.get(neighbor, INF):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                h = h_cache.get(neighbor)
+                if h is None:
+                    h = h_cache[neighbor] = heuristic(neighbor, goal)
+                heapq.heappush(open_set, (tentative_g + h, -tentative_g, neighbor))
 
-        for neighbor, cost in graph[current].items():
-            tentative_g = g_score[current] + cost
+    return None
+
+
+def _a_star_csr(start, goal, graph, heuristic, consistent):
+    """A* over a CSRGraph with array-backed g-scores, parents and closed set."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    label = graph.label_of
+    source, target = graph.index_of(start), graph.index_of(goal)
 
+    g_score = array('d', [INF]) * graph.num_nodes
+    came_from = array('i', [-1]) * graph.num_nodes
+    closed = bytearray(graph.num_nodes)
+    h_cache = {}
+    g_score[source] = 0
+    open_set = [(heuristic(start, goal), 0, source)]
+
+    while open_set:
+        _, neg_g, current = heapq.heappop(open_set)
+        if -neg_g > g_score[current] or closed[current]:
+            continue
+
+        if current == target:
+            path = [current]
+            while came_from[current] != -1:
+                current = came_from[current]
+                path.append(current)
+            return [label(node) for node in reversed(path)]
+        if consistent:
+            closed[current] = 1
+
+        for i in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[i]
+            if closed[neighbor]:
+                continue
+            tentative_g = g_score[current] + weights[i]
             if tentative_g < g_score[neighbor]:
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
-
-                # Push new state into the heap
-                heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                h = h_cache.get(neighbor)
+                if h is None:
+                    h = h_cache[neighbor] = heuristic(label(neighbor), goal)
+                heapq.heappush(open_set, (tentative_g + h, -tentative_g, neighbor))
 
     return None
 
@@ -127,5 +127,58 @@ class TestAStarSearch(unittest.TestCase):
         self.assertEqual(path,['S','A','B','C','G'])
 
 
+def grid_graph(side):
+    """Open side x side 4-connected grid with unit costs."""
+    graph = {}
+    for r in range(side):
+        for c in range(side):
+            graph[(r, c)] = {
+                (r + dr, c + dc): 1
+                for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                if 0 <= r + dr < side and 0 <= c + dc < side
+            }
+    return graph
+
+
+class TestAStarEfficiency(unittest.TestCase):
+    """heuristic caching, closed set and tie-breaking"""
+
+    def setUp(self):
+        self.calls = []
+
+        def manhattan(node, goal):
+            self.calls.append(node)
+            return abs(node[0] - goal[0]) + abs(node[1] - goal[1])
+
+        self.manhattan = manhattan
+
+    def test_heuristic_evaluated_once_per_node(self):
+        """each node's heuristic is computed at most once"""
+        graph = grid_graph(15)
+        a_star((0, 0), (14, 14), graph, self.manhattan, consistent=True)
+        self.assertEqual(len(self.calls), len(set(self.calls)))
+
+    def test_tie_breaking_follows_one_path(self):
+        """
+        on an open grid every node on a shortest path has the same f-score;
+        preferring higher g walks straight to the goal instead of flooding
+        the whole rectangle between start and goal
+        """
+        graph = grid_graph(40)
+        path = a_star((0, 0), (39, 39), graph, self.manhattan, consistent=True)
+        self.assertEqual(len(path), 79)
+        self.assertLess(len(self.calls), 4 * len(path))
+
+    def test_consistent_mode_is_optimal(self):
+        """the closed set keeps results optimal for a consistent heuristic"""
+        graph = grid_graph(12)
+        del graph[(5, 5)]
+        for node in graph.values():
+            node.pop((5, 5), None)
+        for consistent in (True, False):
+            path = a_star((5, 0), (5, 11), graph, self.manhattan, consistent)
+            self.assertEqual(len(path), 14)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,264 @@
+"""
+Batch Many-to-Many Shortest-Path Queries
+
+Description:
+Answers large batches of (source, target) queries against one static graph
+with as few searches as possible:
+
+1. Queries are grouped by source, and one Dijkstra run per source answers
+   every target of its group. The run stops as soon as all of the group's
+   targets are settled (`dijkstra_csr(..., targets=...)`).
+2. Each run's shortest-path tree (distance and predecessor arrays plus
+   which nodes were settled) is kept in an LRU cache keyed by source, so a
+   later group with the same source is answered without searching, as long
+   as the cached tree covers its targets.
+3. With `processes > 1` the groups missing from the cache are spread over a
+   multiprocessing Pool. The pool is started on first use and kept on the
+   engine for later batches (release it with `close()` or a `with` block).
+   The graph is converted to a CSRGraph once and handed to each worker when
+   it starts (shared read-only, never re-sent per task). Workers send back
+   only the trees that will stay in the LRU (the batch's last `cache_size`
+   groups), so the cache ends up as it would in a single process without
+   pickling trees that would be evicted straight away.
+4. Given a heuristic, groups with a single target (and no usable cached
+   tree) run `a_star` instead, which usually explores far less than a full
+   Dijkstra towards one goal.
+
+Every answer is (distance, path) like `bidirectional_dijkstra`, or
+(float('inf'), None) when the target is unreachable.
+
+Time Complexity: O(S * (V + E) log V) for S distinct sources in the
+                 worst case; early stopping and cache hits cut this down
+Space Complexity: O(V + E) for the graph plus O(V) per cached tree
+"""
+
+from collections import OrderedDict
+from multiprocessing import Pool
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from algorithms.graph.a_star.python.a_star import a_star
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra_csr
+
+INF = float("inf")
+
+
+class BatchShortestPaths:
+    """
+    Groups shortest-path queries by source and caches search trees.
+
+    Usable as a context manager; leaving the block closes the worker pool.
+    """
+
+    def __init__(self, graph, cache_size=64, heuristic=None):
+        """
+        :param graph: dict-of-dicts, Graph or CSRGraph with non-negative weights
+        :param cache_size: number of shortest-path trees kept (0 disables
+                           caching)
+        :param heuristic: optional admissible heuristic(node, goal) enabling
+                          A* for single-target groups; must be a module-level
+                          function to be used with a process pool
+        """
+        self.graph = CSRGraph.from_graph(graph)
+        self.cache_size = cache_size
+        self.heuristic = heuristic
+        self._cache = OrderedDict()  # source id -> (dist, pred, done, complete)
+        self.hits = 0
+        self.misses = 0
+        self._pool = None
+        self._pool_processes = None
+
+    def query(self, source, target, with_path=True):
+        """Answer a single query: (distance, path)."""
+        return self.run([(source, target)], with_path=with_path)[0]
+
+    def run(self, queries, processes=1, with_path=True):
+        """
+        Answer a batch of queries.
+
+        :param queries: iterable of (source, target) node pairs
+        :param processes: 1 answers every group in this process; a larger
+                          number (or None for one per CPU) uses the engine's
+                          Pool, started on first use and reused until
+                          `close()` (a different count restarts it)
+        :param with_path: if False, paths are not built (returned as None)
+        :return: list of (distance, path), in the order of `queries`
+        """
+        index = self.graph.index_of
+        pairs = [(index(s), index(t)) for s, t in queries]
+        groups = {}
+        for s, t in pairs:
+            groups.setdefault(s, set()).add(t)
+
+        answers = {}
+        missing = []
+        for s, targets in groups.items():
+            tree = self._cached_tree(s, targets)
+            if tree is not None:
+                answers[s] = self._tree_answers(tree, targets, with_path)
+            else:
+                missing.append((s, tuple(targets), with_path))
+
+        # Trees are stored in order, so only the last cache_size survive
+        first_kept = max(len(missing) - self.cache_size, 0)
+        tasks = [(*task, i >= first_kept) for i, task in enumerate(missing)]
+        if processes == 1 or not missing:
+            results = [_solve_task(self, *task) for task in tasks]
+        else:
+            pool = self._get_pool(processes)
+            results = pool.starmap(_worker_solve_group, tasks, chunksize=8)
+        for (s, _, _), (group_answers, tree) in zip(missing, results):
+            answers[s] = group_answers
+            if tree is not None:
+                self._store_tree(s, tree)
+
+        return [answers[s][t] for s, t in pairs]
+
+    def _solve_group(self, source, targets, with_path):
+        """
+        Search for one uncached source: ({target_id: (distance, path)}, tree),
+        where tree is None when the single target was answered by A*.
+        """
+        if self.heuristic is not None and len(targets) == 1:
+            (target,) = targets
+            return {target: self._a_star(source, target, with_path)}, None
+        tree = self._search(source, targets)
+        return self._tree_answers(tree, targets, with_path), tree
+
+    def _tree_answers(self, tree, targets, with_path):
+        """Return {target_id: (distance, path)} read off a shortest-path tree."""
+        dist, pred, done, _ = tree
+        label = self.graph.label_of
+        answers = {}
+        for t in targets:
+            if not done[t]:
+                answers[t] = (INF, None)
+                continue
+            path = None
+            if with_path:
+                path = [t]
+                while pred[path[-1]] != -1:
+                    path.append(pred[path[-1]])
+                path = [label(node) for node in reversed(path)]
+            answers[t] = (dist[t], path)
+        return answers
+
+    def _cached_tree(self, source, targets):
+        """Cached tree for `source` if it answers every target, else None."""
+        tree = self._cache.get(source)
+        if tree is not None:
+            done, complete = tree[2], tree[3]
+            if complete or all(done[t] for t in targets):
+                self._cache.move_to_end(source)
+                self.hits += 1
+                return tree
+        self.misses += 1
+        return None
+
+    def _search(self, source, targets):
+        """Run Dijkstra until all targets settle; return its tree."""
+        dist, pred, settled = dijkstra_csr(
+            self.graph, {source: 0}, targets=set(targets)
+        )
+        done = bytearray(self.graph.num_nodes)
+        for u in settled:
+            done[u] = 1
+        # An unsettled target means the search ran out of reachable nodes,
+        # so the tree is complete; otherwise it may have stopped early.
+        complete = not all(done[t] for t in targets)
+        return dist, pred, done, complete
+
+    def _store_tree(self, source, tree):
+        """Cache `tree` for `source`, evicting the least recently used."""
+        if self.cache_size > 0:
+            self._cache[source] = tree
+            self._cache.move_to_end(source)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _a_star(self, source, target, with_path):
+        """Single-target query through a_star; distance summed along the path."""
+        graph = self.graph
+        path = a_star(
+            graph.label_of(source), graph.label_of(target), graph, self.heuristic
+        )
+        if path is None:
+            return INF, None
+        ids = [graph.index_of(node) for node in path]
+        distance = 0
+        for u, v in zip(ids, ids[1:]):
+            distance += min(w for x, w in graph.neighbors(u) if x == v)
+        return distance, path if with_path else None
+
+    def _get_pool(self, processes):
+        """The engine's worker pool, (re)started for `processes` workers."""
+        if self._pool is not None and self._pool_processes != processes:
+            self.close()
+        if self._pool is None:
+            init_args = (self.graph, self.heuristic)
+            self._pool = Pool(processes, _init_worker, init_args)
+            self._pool_processes = processes
+        return self._pool
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_processes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def cached_sources(self):
+        """Labels of the sources with a cached tree, least recently used first."""
+        return [self.graph.label_of(s) for s in self._cache]
+
+
+# Per-worker engine, created once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(graph, heuristic):
+    # The parent owns the cache; workers only search
+    _WORKER["engine"] = BatchShortestPaths(graph, cache_size=0, heuristic=heuristic)
+
+
+def _solve_task(engine, source, targets, with_path, keep_tree):
+    """Solve one group, dropping its tree unless the cache will keep it."""
+    answers, tree = engine._solve_group(source, targets, with_path)
+    return answers, tree if keep_tree else None
+
+
+def _worker_solve_group(source, targets, with_path, keep_tree):
+    return _solve_task(_WORKER["engine"], source, targets, with_path, keep_tree)
+
+
+# Example runnable block
+if __name__ == "__main__":
+    road = {
+        "A": {"B": 4, "C": 2},
+        "B": {"A": 4, "C": 1, "D": 5},
+        "C": {"A": 2, "B": 1, "D": 8, "E": 10},
+        "D": {"B": 5, "C": 8, "E": 2, "Z": 6},
+        "E": {"C": 10, "D": 2, "Z": 3},
+        "Z": {"D": 6, "E": 3},
+    }
+    queries = [("A", "Z"), ("A", "E"), ("B", "Z"), ("A", "D"), ("Z", "A")]
+    with BatchShortestPaths(road, cache_size=4) as engine:
+        for (source, target), (distance, path) in zip(queries, engine.run(queries)):
+            print(f"{source} -> {target}: distance {distance}, path {path}")
+
+        engine.run([("A", "B"), ("A", "C")])
+        print(f"Cache hits: {engine.hits}, misses: {engine.misses}")
+        print("Cached sources:", engine.cached_sources())
+
+        engine.clear_cache()
+        answers = engine.run(queries, processes=2, with_path=False)
+        print("With 2 processes:", answers)
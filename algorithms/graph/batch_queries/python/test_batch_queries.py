@@ -0,0 +1,128 @@
+"""
+Unit tests for batch many-to-many shortest-path queries.
+
+Tests cover:
+- Answers matching dijkstra() for random query batches
+- Grouping by source (one search per source) and LRU cache behaviour
+- The A* path for single-target groups
+- The persistent process pool and which trees it sends back
+- Unreachable targets
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from algorithms.graph.batch_queries.python.batch_queries import BatchShortestPaths
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+
+INF = float("inf")
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(1, 20)
+    return graph
+
+
+def zero_heuristic(node, goal):
+    return 0
+
+
+def path_length(graph, path):
+    return sum(graph[u][v] for u, v in zip(path, path[1:]))
+
+
+class TestBatchShortestPaths(unittest.TestCase):
+    """Test cases for BatchShortestPaths."""
+
+    def setUp(self):
+        self.graph = random_graph(80, 240, seed=3)
+        rng = random.Random(4)
+        self.queries = [(rng.randrange(10), rng.randrange(80)) for _ in range(100)]
+
+    def check(self, answers):
+        for (s, t), (distance, path) in zip(self.queries, answers):
+            expected = dijkstra(self.graph, s)[t]
+            self.assertEqual(distance, expected)
+            if expected == INF:
+                self.assertIsNone(path)
+            else:
+                self.assertEqual((path[0], path[-1]), (s, t))
+                self.assertEqual(path_length(self.graph, path), expected)
+
+    def test_matches_dijkstra(self):
+        engine = BatchShortestPaths(self.graph)
+        self.check(engine.run(self.queries))
+        # One search per distinct source
+        self.assertEqual(engine.misses, len({s for s, _ in self.queries}))
+
+    def test_cache_hits_and_eviction(self):
+        engine = BatchShortestPaths(self.graph, cache_size=2)
+        engine.run([(0, t) for t in range(80)])  # complete tree for 0
+        engine.run([(1, 5), (2, 5)])
+        self.assertEqual(engine.cached_sources(), [1, 2])  # 0 evicted
+        misses = engine.misses
+        engine.query(2, 5)
+        self.assertEqual(engine.misses, misses)
+        self.assertEqual(engine.hits, 1)
+
+        engine = BatchShortestPaths(self.graph, cache_size=0)
+        engine.query(0, 5)
+        engine.query(0, 5)
+        self.assertEqual((engine.hits, engine.misses), (0, 2))
+
+    def test_a_star_single_targets(self):
+        engine = BatchShortestPaths(self.graph, heuristic=zero_heuristic)
+        self.check(engine.run(self.queries))
+
+    def test_process_pool(self):
+        with BatchShortestPaths(self.graph, heuristic=zero_heuristic) as engine:
+            self.check(engine.run(self.queries, processes=2))
+
+    def test_process_pool_fills_cache(self):
+        with BatchShortestPaths(self.graph) as engine:
+            self.check(engine.run(self.queries, processes=2))
+            sources = {s for s, _ in self.queries}
+            self.assertEqual(set(engine.cached_sources()), sources)
+            self.assertEqual((engine.hits, engine.misses), (0, len(sources)))
+            self.check(engine.run(self.queries, processes=2))
+            self.assertEqual((engine.hits, engine.misses), (len(sources), len(sources)))
+
+    def test_pool_is_reused_until_closed(self):
+        engine = BatchShortestPaths(self.graph, cache_size=0)
+        with engine:
+            engine.run(self.queries[:50], processes=2)
+            pool = engine._pool
+            self.check(engine.run(self.queries, processes=2))
+            self.assertIs(engine._pool, pool)
+            engine.run(self.queries, processes=3)
+            self.assertIsNot(engine._pool, pool)
+        self.assertIsNone(engine._pool)
+        engine.close()  # closing twice is harmless
+
+    def test_only_kept_trees_are_returned(self):
+        sources = list(dict.fromkeys(s for s, _ in self.queries))
+        for processes in (1, 2):
+            with BatchShortestPaths(self.graph, cache_size=3) as engine:
+                with mock.patch.object(
+                    engine, "_store_tree", wraps=engine._store_tree
+                ) as store:
+                    self.check(engine.run(self.queries, processes=processes))
+                self.assertEqual(store.call_count, 3)
+                self.assertEqual(engine.cached_sources(), sources[-3:])
+
+    def test_unreachable_and_labels(self):
+        graph = {"a": {"b": 1}, "b": {}, "c": {"a": 2}}
+        engine = BatchShortestPaths(graph)
+        self.assertEqual(engine.query("a", "c"), (INF, None))
+        self.assertEqual(engine.query("c", "b"), (3, ["c", "a", "b"]))
+        self.assertEqual(engine.query("a", "a", with_path=False), (0, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
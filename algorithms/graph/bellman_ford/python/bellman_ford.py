@@ -19,39 +19,314 @@ Key Steps:
 2. Relax all edges V-1 times (V = number of vertices).
 3. Check for negative weight cycles — if a shorter path is still found after V-1 iterations,
    it means a negative cycle exists.
+
+Variants in this module:
+- `bellman_ford` stops early once a full pass relaxes no edge.
+- `spfa` only re-scans vertices whose distance changed (queue-based).
+- `find_negative_cycle` returns the vertices of a negative cycle, and
+  `NegativeCycleError.cycle` carries the one reachable from the source.
 """
 
-def bellman_ford(graph, source):
+from collections import deque
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only bellman_ford_arrays needs it.
+    np = None
+
+INF = float('inf')
+
+
+class NegativeCycleError(ValueError):
+    """
+    Raised when a negative weight cycle is reachable from the source.
+    `cycle` lists the cycle's vertices in edge order (the last one has an
+    edge back to the first).
+    """
+
+    def __init__(self, cycle):
+        super().__init__("Graph contains a negative weight cycle")
+        self.cycle = cycle
+
+
+def bellman_ford(graph, source, vertices=None):
     """
     graph: list of edges, where each edge is a tuple (u, v, w)
-           representing an edge from u → v with weight w.
+           representing an edge from u → v with weight w,
+           or a CSRGraph (all of its vertices are included in the result).
     source: starting vertex
+    vertices: optional iterable of every vertex, to skip scanning the edge
+              list for them (vertices without edges are then included too)
+
+    Passes stop as soon as one of them relaxes nothing, so graphs whose
+    shortest paths have few edges finish in a handful of passes.
+    Raises NegativeCycleError (a ValueError) with the offending cycle.
     """
-    # Extract all vertices
-    vertices = set()
-    for u, v, _ in graph:
-        vertices.add(u)
-        vertices.add(v)
-    V = len(vertices)
+    if isinstance(graph, CSRGraph):
+        return _bellman_ford_csr(graph, source)
 
-    # Step 1: Initialize distances
-    distance = {v: float('inf') for v in vertices}
+    if vertices is None:
+        vertices = set()
+        for u, v, _ in graph:
+            vertices.add(u)
+            vertices.add(v)
+    distance = {v: INF for v in vertices}
     distance[source] = 0
+    predecessor = {source: None}
 
-    # Step 2: Relax edges V-1 times
-    for _ in range(V - 1):
-        for u, v, w in graph:
-            if distance[u] != float('inf') and distance[u] + w < distance[v]:
-                distance[v] = distance[u] + w
+    last = _relax_passes(graph, distance, predecessor, len(distance))
+    if last is not None:
+        raise NegativeCycleError(_trace_cycle(predecessor, last, len(distance)))
+    return distance
 
-    # Step 3: Check for negative weight cycles
-    for u, v, w in graph:
-        if distance[u] != float('inf') and distance[u] + w < distance[v]:
-            raise ValueError("Graph contains a negative weight cycle")
 
+def _bellman_ford_csr(graph, source):
+    """Bellman-Ford over a CSRGraph's integer edge arrays."""
+    V = graph.num_nodes
+    distance = [INF] * V
+    predecessor = [None] * V
+    distance[graph.index_of(source)] = 0
+
+    last = _relax_passes(list(graph.edges()), distance, predecessor, V)
+    if last is not None:
+        cycle = _trace_cycle(predecessor, last, V)
+        raise NegativeCycleError([graph.label_of(v) for v in cycle])
+    return {graph.label_of(v): d for v, d in enumerate(distance)}
+
+
+def _relax_passes(edges, distance, predecessor, V):
+    """
+    Relax every edge up to V times, stopping after the first pass that
+    changes nothing. V-1 passes always suffice without a negative cycle, so
+    if the V-th pass still relaxes an edge, its head is returned (it leads
+    into a negative cycle through `predecessor`). Otherwise returns None.
+    """
+    for _ in range(V):
+        last = None
+        for u, v, w in edges:
+            du = distance[u]
+            if du != INF and du + w < distance[v]:
+                distance[v] = du + w
+                predecessor[v] = u
+                last = v
+        if last is None:
+            return None
+    return last
+
+
+def _trace_cycle(predecessor, node, V):
+    """
+    Walk V predecessor links back from `node`, which lands on a cycle of the
+    predecessor graph (always a negative one), then collect that cycle.
+    Returns None if the walk reaches a vertex without a predecessor.
+    """
+    for _ in range(V):
+        node = predecessor[node]
+        if node is None:
+            return None
+    cycle = [node]
+    u = predecessor[node]
+    while u != node:
+        cycle.append(u)
+        u = predecessor[u]
+    cycle.reverse()
+    return cycle
+
+
+def find_negative_cycle(graph, vertices=None):
+    """
+    Return the vertices of some negative weight cycle in edge order, or None.
+
+    Unlike `bellman_ford`, cycles anywhere in the graph are found, not only
+    those reachable from a source: every vertex starts at distance 0, as if a
+    virtual source had a 0-weight edge to each of them.
+
+    graph: list of (u, v, w) edges or a CSRGraph
+    vertices: optional iterable of every vertex of an edge list
+    """
+    if isinstance(graph, CSRGraph):
+        V = graph.num_nodes
+        distance = [0] * V
+        predecessor = [None] * V
+        last = _relax_passes(list(graph.edges()), distance, predecessor, V)
+        if last is None:
+            return None
+        return [graph.label_of(v) for v in _trace_cycle(predecessor, last, V)]
+
+    if vertices is None:
+        vertices = {u for u, _, _ in graph} | {v for _, v, _ in graph}
+    distance = dict.fromkeys(vertices, 0)
+    predecessor = dict.fromkeys(distance)
+    last = _relax_passes(graph, distance, predecessor, len(distance))
+    if last is None:
+        return None
+    return _trace_cycle(predecessor, last, len(distance))
+
+
+def spfa(graph, source, vertices=None):
+    """
+    Queue-based Bellman-Ford (Shortest Path Faster Algorithm).
+
+    Only vertices whose distance just improved are re-scanned, and the
+    small-label-first (SLF) heuristic puts a vertex at the front of the queue
+    when its distance is below the current front's. Worst case is still
+    O(V * E), but typical graphs need far fewer relaxations than full passes.
+
+    graph: list of (u, v, w) edges or a CSRGraph
+    source: starting vertex
+    vertices: optional iterable of every vertex of an edge list
+    Returns the same distances as `bellman_ford`, and likewise raises
+    NegativeCycleError when a negative cycle is reachable from `source`.
+    """
+    if isinstance(graph, CSRGraph):
+        V = graph.num_nodes
+        distance = [INF] * V
+        predecessor = [None] * V
+        s = graph.index_of(source)
+        last = _spfa(graph.neighbors, s, distance, predecessor, V)
+        if last is not None:
+            cycle = _trace_cycle(predecessor, last, V) or find_negative_cycle(graph)
+            raise NegativeCycleError([graph.label_of(v) for v in cycle])
+        return {graph.label_of(v): d for v, d in enumerate(distance)}
+
+    adjacency = {}
+    if vertices is not None:
+        for v in vertices:
+            adjacency[v] = []
+    for u, v, w in graph:
+        adjacency.setdefault(u, []).append((v, w))
+        adjacency.setdefault(v, [])
+    adjacency.setdefault(source, [])  # an isolated source is still at distance 0
+    distance = dict.fromkeys(adjacency, INF)
+    predecessor = {source: None}
+    last = _spfa(adjacency.__getitem__, source, distance, predecessor, len(adjacency))
+    if last is not None:
+        cycle = _trace_cycle(predecessor, last, len(adjacency))
+        raise NegativeCycleError(cycle or find_negative_cycle(graph))
     return distance
 
 
+def _spfa(neighbors, source, distance, predecessor, V):
+    """
+    SPFA core over `neighbors(u) -> [(v, w), ...]`. Tracks the edge count of
+    every tentative path: one reaching V edges must repeat a vertex, so a
+    negative cycle exists and the vertex is returned. Otherwise None.
+    """
+    distance[source] = 0
+    hops = {source: 0}
+    queue = deque([source])
+    queued = {source}
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        du = distance[u]
+        for v, w in neighbors(u):
+            if du + w < distance[v]:
+                distance[v] = du + w
+                predecessor[v] = u
+                hops[v] = hops[u] + 1
+                if hops[v] >= V:
+                    return v
+                if v not in queued:
+                    queued.add(v)
+                    if queue and distance[v] < distance[queue[0]]:
+                        queue.appendleft(v)  # small label first
+                    else:
+                        queue.append(v)
+    return None
+
+
+def edge_arrays(graph):
+    """
+    Convert a CSRGraph or a list of integer (u, v, w) edges into the
+    (src, dst, weight) NumPy arrays taken by `bellman_ford_arrays`.
+    A CSRGraph's node ids are used, so map labels with `index_of`.
+    """
+    if np is None:
+        raise ImportError("edge_arrays() requires NumPy")
+    if isinstance(graph, CSRGraph):
+        offsets, targets, weights = graph.to_numpy()
+        src = np.repeat(np.arange(graph.num_nodes, dtype=np.int64), np.diff(offsets))
+        return src, targets, weights
+    edges = np.array(graph, dtype=np.float64).reshape(-1, 3)
+    return (
+        edges[:, 0].astype(np.int64),
+        edges[:, 1].astype(np.int64),
+        np.ascontiguousarray(edges[:, 2]),
+    )
+
+
+def bellman_ford_arrays(src, dst, weight, source, num_nodes=None,
+                        return_predecessors=False):
+    """
+    Vectorized Bellman-Ford over edges given as three parallel NumPy arrays.
+
+    Edges are sorted by head once; every pass then computes all candidate
+    distances dist[src] + weight at once and reduces them per head vertex
+    with `np.minimum.reduceat` (a sorted segment minimum). Passes stop early
+    once nothing improves, as in `bellman_ford`.
+
+    src, dst: integer arrays of node ids in [0, num_nodes)
+    weight: float array of edge weights
+    source: id of the starting node
+    num_nodes: number of nodes (default: largest id + 1)
+    return_predecessors: also return the predecessor id array (-1 for the
+                         source and unreachable nodes)
+    Returns a float64 distance array indexed by node id (inf if unreachable),
+    or (distances, predecessors).
+    Raises NegativeCycleError if a negative cycle is reachable from source.
+    """
+    if np is None:
+        raise ImportError("bellman_ford_arrays() requires NumPy")
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weight = np.asarray(weight, dtype=np.float64)
+    if not len(src) == len(dst) == len(weight):
+        raise ValueError("src, dst and weight must have the same length")
+    if num_nodes is None:
+        num_nodes = int(max(src.max(initial=-1), dst.max(initial=-1), source)) + 1
+
+    order = np.argsort(dst, kind="stable")
+    src, dst, weight = src[order], dst[order], weight[order]
+    heads, starts = np.unique(dst, return_index=True)
+    segment = np.repeat(np.arange(len(heads)), np.diff(np.append(starts, len(dst))))
+
+    dist = np.full(num_nodes, INF)
+    dist[source] = 0.0
+    pred = np.full(num_nodes, -1, dtype=np.int64)
+    for _ in range(num_nodes):
+        if not len(heads):
+            break
+        candidate = dist[src] + weight
+        best = np.minimum.reduceat(candidate, starts)
+        improved = best < dist[heads]
+        if not improved.any():
+            break
+        # First edge reaching each improved segment's minimum is the new parent
+        hit = np.flatnonzero(improved[segment] & (candidate == best[segment]))
+        _, first = np.unique(segment[hit], return_index=True)
+        hit = hit[first]
+        dist[dst[hit]] = candidate[hit]
+        pred[dst[hit]] = src[hit]
+    else:
+        raise NegativeCycleError(_array_cycle(src, dst, weight, pred, dst[hit[0]]))
+
+    if return_predecessors:
+        return dist, pred
+    return dist
+
+
+def _array_cycle(src, dst, weight, pred, node):
+    """Negative cycle through the predecessor array, as a list of node ids."""
+    predecessor = [None if p < 0 else p for p in pred.tolist()]
+    cycle = _trace_cycle(predecessor, int(node), len(predecessor))
+    if cycle is None:
+        cycle = find_negative_cycle(list(zip(src.tolist(), dst.tolist(), weight.tolist())))
+    return cycle
+
+
 # Example runs
 if __name__ == "__main__":
     print("Example 1: Simple Graph")
@@ -89,5 +364,19 @@ if __name__ == "__main__":
     ]
     try:
         print("Shortest distances from A:", bellman_ford(graph3, 'A'))
-    except ValueError as e:
-        print("Error:", e)
+    except NegativeCycleError as e:
+        print("Error:", e, "->", e.cycle)
+    print()
+
+    print("Example 4: SPFA and negative cycle detection")
+    print("SPFA distances from S:", spfa(graph2, 'S'))
+    print("Negative cycle in graph2:", find_negative_cycle(graph2))
+    print("Negative cycle in graph3:", find_negative_cycle(graph3))
+
+    if np is not None:
+        print()
+        print("Example 5: Vectorized passes over NumPy edge arrays")
+        csr = CSRGraph.from_edges(graph2)
+        src, dst, weight = edge_arrays(csr)
+        dist = bellman_ford_arrays(src, dst, weight, csr.index_of('S'), csr.num_nodes)
+        print("Distances from S:", {csr.label_of(v): d for v, d in enumerate(dist.tolist())})
@@ -0,0 +1,189 @@
+"""
+Unit tests for Bellman-Ford, SPFA and negative cycle extraction.
+
+Tests cover:
+- Distances with negative edges, unreachable and isolated vertices
+- SPFA agreeing with Bellman-Ford on random graphs and CSR input
+- NegativeCycleError carrying a real negative cycle
+- find_negative_cycle on reachable and unreachable cycles
+- The vectorized NumPy edge-array backend (skipped without NumPy)
+"""
+
+import random
+import unittest
+from math import log
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from algorithms.graph.bellman_ford.python.bellman_ford import (
+    NegativeCycleError,
+    bellman_ford,
+    bellman_ford_arrays,
+    edge_arrays,
+    find_negative_cycle,
+    np,
+    spfa,
+)
+
+EDGES = [
+    ("S", "A", 4),
+    ("S", "E", 5),
+    ("A", "C", 6),
+    ("B", "A", 3),
+    ("C", "B", -2),
+    ("D", "C", 3),
+    ("E", "D", -1),
+]
+EXPECTED = {"S": 0, "A": 4, "B": 5, "C": 7, "D": 4, "E": 5}
+
+
+def random_edges(n, m, seed):
+    """Random edges with some negative weights but no negative cycle."""
+    rng = random.Random(seed)
+    potential = [rng.randint(0, 20) for _ in range(n)]
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        # w + p(u) - p(v) >= 0 keeps every cycle non-negative
+        edges.append((u, v, rng.randint(0, 10) - potential[u] + potential[v]))
+    return edges
+
+
+def cycle_weight(edges, cycle):
+    weight = {(u, v): w for u, v, w in edges}
+    return sum(weight[u, v] for u, v in zip(cycle, cycle[1:] + cycle[:1]))
+
+
+class TestBellmanFord(unittest.TestCase):
+    """Test cases for the pass-based and queue-based variants."""
+
+    def test_negative_edges(self):
+        self.assertEqual(bellman_ford(EDGES, "S"), EXPECTED)
+        self.assertEqual(spfa(EDGES, "S"), EXPECTED)
+
+    def test_vertices_include_isolated(self):
+        result = bellman_ford(EDGES, "S", vertices=list(EXPECTED) + ["Z"])
+        self.assertEqual(result["Z"], float("inf"))
+        self.assertEqual(spfa(EDGES, "S", vertices=["Z"])["Z"], float("inf"))
+
+    def test_unreachable(self):
+        result = bellman_ford(EDGES, "D")
+        self.assertEqual(result["S"], float("inf"))
+        self.assertEqual(result, spfa(EDGES, "D"))
+
+    def test_isolated_source(self):
+        self.assertEqual(bellman_ford([], "S"), {"S": 0})
+        self.assertEqual(spfa([], "S"), {"S": 0})
+        self.assertEqual(spfa(EDGES, "Z")["Z"], 0)
+
+    def test_spfa_matches_bellman_ford(self):
+        for seed in range(5):
+            edges = random_edges(40, 160, seed)
+            expected = bellman_ford(edges, 0)
+            self.assertEqual(spfa(edges, 0), expected)
+            csr = CSRGraph.from_edges(edges)
+            self.assertEqual(bellman_ford(csr, 0), expected)
+            self.assertEqual(spfa(csr, 0), expected)
+
+
+class TestNegativeCycles(unittest.TestCase):
+    """Test cases for negative cycle reporting."""
+
+    def setUp(self):
+        self.edges = [
+            ("X", "A", 1),
+            ("A", "B", 1),
+            ("B", "C", -1),
+            ("C", "A", -1),
+            ("C", "D", 2),
+        ]
+
+    def assertNegativeCycle(self, edges, cycle):
+        self.assertIsNotNone(cycle)
+        self.assertEqual(len(set(cycle)), len(cycle))
+        self.assertLess(cycle_weight(edges, cycle), 0)
+
+    def test_error_carries_cycle(self):
+        for run in (bellman_ford, spfa):
+            with self.assertRaises(NegativeCycleError) as ctx:
+                run(self.edges, "X")
+            self.assertEqual(sorted(ctx.exception.cycle), ["A", "B", "C"])
+            self.assertNegativeCycle(self.edges, ctx.exception.cycle)
+
+    def test_error_is_value_error(self):
+        with self.assertRaises(ValueError):
+            bellman_ford(CSRGraph.from_edges(self.edges), "X")
+
+    def test_unreachable_cycle_is_ignored_by_source_search(self):
+        self.assertEqual(
+            bellman_ford(self.edges, "D"),
+            {
+                "X": float("inf"),
+                "A": float("inf"),
+                "B": float("inf"),
+                "C": float("inf"),
+                "D": 0,
+            },
+        )
+        self.assertNegativeCycle(self.edges, find_negative_cycle(self.edges))
+
+    def test_find_negative_cycle(self):
+        self.assertIsNone(find_negative_cycle(EDGES))
+        csr = CSRGraph.from_edges(self.edges)
+        self.assertNegativeCycle(self.edges, find_negative_cycle(csr))
+
+    def test_arbitrage(self):
+        # -log exchange rates: a profitable loop is a negative cycle
+        rates = {
+            ("USD", "EUR"): 0.9,
+            ("EUR", "GBP"): 0.9,
+            ("GBP", "USD"): 1.3,
+            ("USD", "JPY"): 150.0,
+            ("JPY", "USD"): 0.0066,
+        }
+        edges = [(u, v, -log(r)) for (u, v), r in rates.items()]
+        cycle = find_negative_cycle(edges)
+        self.assertEqual(sorted(cycle), ["EUR", "GBP", "USD"])
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestBellmanFordArrays(unittest.TestCase):
+    """Test cases for the vectorized edge-array backend."""
+
+    def test_matches_bellman_ford(self):
+        for seed in range(5):
+            edges = random_edges(60, 300, seed)
+            expected = bellman_ford(edges, 0, vertices=range(60))
+            dist = bellman_ford_arrays(*edge_arrays(edges), 0, num_nodes=60)
+            self.assertEqual(dist.tolist(), [expected[v] for v in range(60)])
+
+    def test_csr_edge_arrays_and_predecessors(self):
+        csr = CSRGraph.from_edges(EDGES)
+        dist, pred = bellman_ford_arrays(
+            *edge_arrays(csr),
+            csr.index_of("S"),
+            csr.num_nodes,
+            return_predecessors=True,
+        )
+        self.assertEqual(
+            {csr.label_of(v): d for v, d in enumerate(dist.tolist())}, EXPECTED
+        )
+        # Every predecessor edge is tight
+        weights = {(csr.index_of(u), csr.index_of(v)): w for u, v, w in EDGES}
+        for v, u in enumerate(pred.tolist()):
+            if u >= 0:
+                self.assertEqual(dist[v], dist[u] + weights[u, v])
+        self.assertEqual(pred[csr.index_of("S")], -1)
+
+    def test_negative_cycle(self):
+        edges = [(0, 1, 1), (1, 2, -1), (2, 1, -1), (2, 3, 2)]
+        with self.assertRaises(NegativeCycleError) as ctx:
+            bellman_ford_arrays(*edge_arrays(edges), 0)
+        self.assertEqual(sorted(ctx.exception.cycle), [1, 2])
+
+    def test_no_edges(self):
+        dist = bellman_ford_arrays([], [], [], 1, num_nodes=3)
+        self.assertEqual(dist.tolist(), [float("inf"), 0.0, float("inf")])
+
+
+if __name__ == "__main__":
+    unittest.main()
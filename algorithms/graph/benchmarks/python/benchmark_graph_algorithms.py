@@ -0,0 +1,327 @@
+"""
+Benchmark Suite for the Graph Algorithms
+
+Description:
+Times dijkstra, bellman_ford, floyd_warshall, prims_mst, kruskal, a_star and
+bfs_traversal on the seeded generators in `generators.py` (Erdos-Renyi,
+grid, Barabasi-Albert, road-like) across a range of sizes.
+
+For every (generator, size, algorithm) the input is converted to the shape
+that algorithm expects outside the timed region. The call is then timed
+`repeat` times (the minimum is the headline number, the mean is kept too)
+and run once more under `tracemalloc` to record the peak memory it
+allocates. Tracing slows Python down, so that run is never timed.
+Throughput is work per second, where work is the number of edges (V^3 for
+floyd_warshall).
+
+Results are written as JSON together with the commit and the environment.
+Passing `--compare` with an earlier results file flags every entry that got
+slower by more than `--tolerance` and exits with status 1, so the suite can
+gate a deploy.
+
+Usage (from the repository root):
+    python -m algorithms.graph.benchmarks.python.benchmark_graph_algorithms
+    python -m algorithms.graph.benchmarks.python.benchmark_graph_algorithms \
+        --sizes 1000 10000 --generators grid road_like --output after.json \
+        --compare before.json --tolerance 0.15
+
+Time Complexity: the sum of the benchmarked algorithms' costs times `repeat`
+Space Complexity: O(V + E) per graph (O(V^2) for the floyd_warshall matrix)
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from algorithms.graph.a_star.python.a_star import a_star
+from algorithms.graph.bellman_ford.python.bellman_ford import bellman_ford
+from algorithms.graph.benchmarks.python.generators import GENERATORS
+from algorithms.graph.bfs.python.bfs import bfs_traversal
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+from algorithms.graph.floyd_warshall.floyd_warshall import floyd_warshall
+from algorithms.graph.kruskal_mst.python.kruskal import kruskal
+from algorithms.graph.prims_mst.python.prims import prims_mst
+
+FORMAT_VERSION = 1
+
+# prepare(case) -> args (untimed); run(*args) is timed; work(case) -> amount
+# of work per call. Sizes above max_nodes are skipped (None: no limit).
+Algorithm = namedtuple("Algorithm", ["prepare", "run", "work", "max_nodes"])
+
+
+def _weighted_adjacency(case):
+    graph = {u: {} for u in range(case.num_nodes)}
+    for u, v, w in case.edges:
+        graph[u][v] = w
+        graph[v][u] = w
+    return graph
+
+
+def _pair_list_adjacency(case):
+    graph = {u: [] for u in range(case.num_nodes)}
+    for u, v, w in case.edges:
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    return graph
+
+
+def _neighbor_lists(case):
+    graph = {u: [] for u in range(case.num_nodes)}
+    for u, v, _ in case.edges:
+        graph[u].append(v)
+        graph[v].append(u)
+    return graph
+
+
+def _directed_edges(case):
+    return [(u, v, w) for u, v, w in case.edges] + [(v, u, w) for u, v, w in case.edges]
+
+
+def _matrix(case):
+    matrix = [[None] * case.num_nodes for _ in range(case.num_nodes)]
+    for u in range(case.num_nodes):
+        matrix[u][u] = 0
+    for u, v, w in case.edges:
+        matrix[u][v] = matrix[v][u] = w
+    return matrix
+
+
+def _heuristic(case):
+    """Admissible A* heuristic from the coordinates, or zero without them."""
+    if case.coords is None:
+        return lambda node, goal: 0
+    coords = case.coords
+    if case.name == "grid":
+
+        def manhattan(node, goal):
+            (r1, c1), (r2, c2) = coords[node], coords[goal]
+            return abs(r1 - r2) + abs(c1 - c2)
+
+        return manhattan
+    return lambda node, goal: math.dist(coords[node], coords[goal])
+
+
+def _edge_count(case):
+    return len(case.edges)
+
+
+ALGORITHMS = {
+    "dijkstra": Algorithm(
+        lambda case: (_weighted_adjacency(case), 0), dijkstra, _edge_count, None
+    ),
+    "bellman_ford": Algorithm(
+        lambda case: (_directed_edges(case), 0, range(case.num_nodes)),
+        bellman_ford,
+        _edge_count,
+        20_000,
+    ),
+    "floyd_warshall": Algorithm(
+        lambda case: (_matrix(case),),
+        floyd_warshall,
+        lambda case: case.num_nodes**3,
+        300,
+    ),
+    "prims_mst": Algorithm(
+        lambda case: (_pair_list_adjacency(case), 0), prims_mst, _edge_count, None
+    ),
+    # kruskal sorts its edge list in place, so a fresh list is built per call
+    "kruskal": Algorithm(
+        lambda case: (case.num_nodes, [(w, u, v) for u, v, w in case.edges]),
+        kruskal,
+        _edge_count,
+        None,
+    ),
+    "a_star": Algorithm(
+        lambda case: (
+            0,
+            case.num_nodes - 1,
+            _weighted_adjacency(case),
+            _heuristic(case),
+        ),
+        a_star,
+        _edge_count,
+        None,
+    ),
+    "bfs_traversal": Algorithm(
+        lambda case: (_neighbor_lists(case), 0), bfs_traversal, _edge_count, None
+    ),
+}
+
+
+def measure(algorithm, case, repeat=3):
+    """
+    Time `algorithm` on `case` and record its peak traced allocation.
+
+    :return: dict with min/mean seconds, throughput and peak_bytes
+    """
+    times = []
+    for _ in range(repeat):
+        args = algorithm.prepare(case)
+        start = time.perf_counter()
+        algorithm.run(*args)
+        times.append(time.perf_counter() - start)
+
+    args = algorithm.prepare(case)
+    tracemalloc.start()
+    try:
+        algorithm.run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    work = algorithm.work(case)
+    return {
+        "seconds": best,
+        "mean_seconds": sum(times) / len(times),
+        "repeat": repeat,
+        "work": work,
+        "throughput": work / best if best > 0 else None,
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(sizes, generators=None, algorithms=None, repeat=3, seed=0, log=None):
+    """
+    Run every selected algorithm on every selected generator and size.
+
+    :param sizes: iterable of requested node counts
+    :param generators: names from GENERATORS (default: all)
+    :param algorithms: names from ALGORITHMS (default: all)
+    :param log: optional callable receiving one line of text per result
+    :return: JSON-serializable dict with metadata and a "results" list
+    """
+    generators = list(generators or GENERATORS)
+    algorithms = list(algorithms or ALGORITHMS)
+    for name in generators:
+        if name not in GENERATORS:
+            raise ValueError(f"Unknown generator {name!r}")
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {name!r}")
+
+    results = []
+    for generator in generators:
+        for size in sizes:
+            case = GENERATORS[generator](size, seed=seed)
+            for name in algorithms:
+                algorithm = ALGORITHMS[name]
+                max_nodes = algorithm.max_nodes
+                if max_nodes is not None and case.num_nodes > max_nodes:
+                    continue
+                entry = {
+                    "generator": generator,
+                    "size": size,
+                    "nodes": case.num_nodes,
+                    "edges": len(case.edges),
+                    "algorithm": name,
+                }
+                entry.update(measure(algorithm, case, repeat))
+                results.append(entry)
+                if log is not None:
+                    log(_format(entry))
+
+    return {
+        "format": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(baseline, current, tolerance=0.10):
+    """
+    List the entries of `current` that are slower than the matching entry of
+    `baseline` by more than `tolerance` (0.10 = 10%).
+
+    :return: list of (key, baseline_seconds, current_seconds) tuples, where
+             key is (generator, size, algorithm)
+    """
+    before = {_key(entry): entry["seconds"] for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        old = before.get(_key(entry))
+        if old is not None and entry["seconds"] > old * (1 + tolerance):
+            regressions.append((_key(entry), old, entry["seconds"]))
+    return regressions
+
+
+def _key(entry):
+    return entry["generator"], entry["size"], entry["algorithm"]
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format(entry):
+    throughput = entry["throughput"]
+    rate = f"{throughput:12.0f}/s" if throughput is not None else f"{'-':>12}  "
+    return (
+        f"{entry['generator']:<16} V={entry['nodes']:<7} E={entry['edges']:<8} "
+        f"{entry['algorithm']:<15} {1e3 * entry['seconds']:10.2f}ms "
+        f"{rate} peak={entry['peak_bytes'] / 2 ** 20:8.2f}MiB"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS))
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="earlier JSON results to check against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="allowed slowdown before an entry counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.sizes, args.generators, args.algorithms, args.repeat, args.seed, log=print
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.tolerance)
+        for (generator, size, name), old, new in regressions:
+            print(
+                f"REGRESSION {name} on {generator} size {size}: "
+                f"{1e3 * old:.2f}ms -> {1e3 * new:.2f}ms"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
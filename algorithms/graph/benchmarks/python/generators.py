@@ -0,0 +1,136 @@
+"""
+Seeded Graph Generators for Benchmarks
+
+Description:
+Every generator builds an undirected weighted graph on the nodes 0..n-1 and
+returns a GraphCase holding its edge list (each edge stored once as
+(u, v, weight)) plus optional 2D node coordinates. A graph depends only on
+its arguments and the seed, so results stay comparable between runs and
+commits. Every generated graph is connected, so MST and single-source
+results cover the whole graph.
+
+- erdos_renyi: uniform random edges (a random spanning tree is added first
+  to make the graph connected), weights 1..100.
+- grid: side x side 4-connected lattice with weights 1..10; coordinates are
+  the cell positions, so Manhattan distance is an admissible A* heuristic.
+- barabasi_albert: preferential attachment, each new node linking to m
+  existing nodes picked with probability proportional to their degree -
+  a scale-free graph with a few heavy hubs. Weights 1..100.
+- road_like: a planar road-network stand-in. Points are jittered on a
+  lattice, linked to their lattice neighbors and joined by at most one
+  diagonal per cell. Weights are the Euclidean length times a random
+  "slowness" factor in [1, 2), so straight-line distance is an admissible
+  heuristic.
+
+Time Complexity: O(n + m) per generator (m = number of edges)
+Space Complexity: O(n + m)
+"""
+
+import math
+import random
+from collections import namedtuple
+
+GraphCase = namedtuple("GraphCase", ["name", "num_nodes", "edges", "coords"])
+
+
+def erdos_renyi(n, avg_degree=4, seed=0):
+    """Connected G(n, m) random graph with about n * avg_degree / 2 edges."""
+    rng = random.Random(seed)
+    order = list(range(n))
+    rng.shuffle(order)
+    pairs = set()
+    for i in range(1, n):
+        u, v = order[i], order[rng.randrange(i)]
+        pairs.add((min(u, v), max(u, v)))
+    target = max(n - 1, n * avg_degree // 2)
+    if n > 1:
+        target = min(target, n * (n - 1) // 2)
+    while len(pairs) < target:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            pairs.add((min(u, v), max(u, v)))
+    edges = [(u, v, rng.randint(1, 100)) for u, v in sorted(pairs)]
+    return GraphCase(f"erdos_renyi(d={avg_degree})", n, edges, None)
+
+
+def grid(n, seed=0):
+    """4-connected square grid with about n nodes (side = round(sqrt(n)))."""
+    rng = random.Random(seed)
+    side = max(1, round(math.sqrt(n)))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                edges.append((u, u + 1, rng.randint(1, 10)))
+            if r + 1 < side:
+                edges.append((u, u + side, rng.randint(1, 10)))
+    coords = [(r, c) for r in range(side) for c in range(side)]
+    return GraphCase("grid", side * side, edges, coords)
+
+
+def barabasi_albert(n, m=3, seed=0):
+    """Preferential attachment: a star on nodes 0..m, then m edges per new node."""
+    rng = random.Random(seed)
+    m = max(1, min(m, n - 1)) if n > 1 else 1
+    # Every edge endpoint is appended once, so a uniform pick from this list
+    # is a degree-proportional pick of a node.
+    endpoints = []
+    edges = []
+    for u in range(1, min(m + 1, n)):  # seed star on nodes 0..m
+        edges.append((0, u, rng.randint(1, 100)))
+        endpoints += (0, u)
+    for u in range(m + 1, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(endpoints))
+        for v in sorted(chosen):
+            edges.append((v, u, rng.randint(1, 100)))
+            endpoints += (v, u)
+    return GraphCase(f"barabasi_albert(m={m})", n, edges, None)
+
+
+def road_like(n, seed=0):
+    """Planar jittered lattice with Euclidean-based weights and coordinates."""
+    rng = random.Random(seed)
+    side = max(1, round(math.sqrt(n)))
+    coords = [
+        (r + rng.uniform(-0.3, 0.3), c + rng.uniform(-0.3, 0.3))
+        for r in range(side)
+        for c in range(side)
+    ]
+
+    def link(u, v):
+        length = math.dist(coords[u], coords[v])
+        edges.append((u, v, length * rng.uniform(1.0, 2.0)))
+
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            if c + 1 < side:
+                link(u, u + 1)
+            if r + 1 < side:
+                link(u, u + side)
+            if r + 1 < side and c + 1 < side and rng.random() < 0.3:
+                # one diagonal per cell keeps the graph planar
+                if rng.random() < 0.5:
+                    link(u, u + side + 1)
+                else:
+                    link(u + 1, u + side)
+    return GraphCase("road_like", side * side, edges, coords)
+
+
+GENERATORS = {
+    "erdos_renyi": erdos_renyi,
+    "grid": grid,
+    "barabasi_albert": barabasi_albert,
+    "road_like": road_like,
+}
+
+
+# Example runnable block
+if __name__ == "__main__":
+    for name, generate in GENERATORS.items():
+        case = generate(100, seed=1)
+        print(f"{name:<16} {case.name:<22} V={case.num_nodes} E={len(case.edges)}")
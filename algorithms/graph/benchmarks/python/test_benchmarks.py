@@ -0,0 +1,132 @@
+"""
+Unit tests for the benchmark generators and harness.
+
+Tests cover:
+- Generators being deterministic per seed, simple and connected
+- Road-like weights never undercutting the straight-line heuristic
+- run_benchmarks producing JSON-serializable, well-formed results
+- Size limits and unknown names
+- Regression detection with compare()
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+import unittest
+
+from algorithms.graph.benchmarks.python.benchmark_graph_algorithms import (
+    ALGORITHMS,
+    compare,
+    main,
+    run_benchmarks,
+)
+from algorithms.graph.benchmarks.python.generators import GENERATORS, road_like
+from data_structures.UnionFind.python.union_find import UnionFind
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_deterministic_simple_and_connected(self):
+        for name, generate in GENERATORS.items():
+            with self.subTest(generator=name):
+                case = generate(150, seed=3)
+                self.assertEqual(case, generate(150, seed=3))
+                self.assertNotEqual(case.edges, generate(150, seed=4).edges)
+
+                pairs = [frozenset((u, v)) for u, v, _ in case.edges]
+                self.assertEqual(len(pairs), len(set(pairs)))
+                self.assertTrue(all(len(p) == 2 for p in pairs))
+
+                components = UnionFind(case.num_nodes)
+                components.union_many((u, v) for u, v, _ in case.edges)
+                self.assertEqual(components.num_components, 1)
+
+    def test_sizes(self):
+        self.assertEqual(GENERATORS["grid"](1000).num_nodes, 1024)
+        case = GENERATORS["erdos_renyi"](500, avg_degree=6)
+        self.assertEqual(len(case.edges), 1500)
+        self.assertEqual(
+            len(GENERATORS["barabasi_albert"](500, m=2).edges), 2 * (500 - 2)
+        )
+
+    def test_road_like_weights_are_admissible(self):
+        case = road_like(400, seed=1)
+        for u, v, w in case.edges:
+            self.assertGreaterEqual(w, math.dist(case.coords[u], case.coords[v]))
+
+
+class TestHarness(unittest.TestCase):
+
+    def test_results_are_well_formed(self):
+        report = run_benchmarks(
+            [30], generators=["grid", "road_like"], repeat=2, seed=1
+        )
+        report = json.loads(json.dumps(report))
+        self.assertEqual(len(report["results"]), 2 * len(ALGORITHMS))
+        for entry in report["results"]:
+            self.assertEqual(entry["repeat"], 2)
+            self.assertLessEqual(entry["seconds"], entry["mean_seconds"])
+            self.assertGreaterEqual(entry["peak_bytes"], 0)
+            self.assertGreater(entry["work"], 0)
+        self.assertIn("python", report)
+
+    def test_size_limits_skip_expensive_algorithms(self):
+        limit = ALGORITHMS["floyd_warshall"].max_nodes
+        report = run_benchmarks(
+            [limit + 100],
+            generators=["erdos_renyi"],
+            algorithms=["floyd_warshall", "bfs_traversal"],
+            repeat=1,
+        )
+        self.assertEqual([e["algorithm"] for e in report["results"]], ["bfs_traversal"])
+
+    def test_unknown_names(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks([10], generators=["torus"])
+        with self.assertRaises(ValueError):
+            run_benchmarks([10], algorithms=["quicksort"])
+
+    def test_compare_flags_slowdowns(self):
+        def report(seconds):
+            return {
+                "results": [
+                    {"generator": "grid", "size": 10, "algorithm": name, "seconds": s}
+                    for name, s in seconds.items()
+                ]
+            }
+
+        baseline = report({"dijkstra": 1.0, "kruskal": 1.0, "a_star": 1.0})
+        current = report({"dijkstra": 1.05, "kruskal": 1.5, "bfs_traversal": 9.0})
+        self.assertEqual(
+            compare(baseline, current, tolerance=0.1),
+            [(("grid", 10, "kruskal"), 1.0, 1.5)],
+        )
+
+    def test_main_exit_status(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            args = [
+                "--sizes",
+                "16",
+                "--generators",
+                "grid",
+                "--algorithms",
+                "dijkstra",
+                "--repeat",
+                "1",
+            ]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(args + ["--output", path]), 0)
+                with open(path) as f:
+                    saved = json.load(f)
+                saved["results"][0]["seconds"] = 0.0
+                with open(path, "w") as f:
+                    json.dump(saved, f)
+                self.assertEqual(main(args + ["--compare", path]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,10 +11,39 @@ Space Complexity:
 -----------------
 O(V) for storing visited nodes and queue.
 
+Every function also accepts a CSRGraph
+(data_structures/Graph/python/csr_graph.py); visited state is then kept in
+a bytearray indexed by integer node id.
+
+`bfs_levels` is a level-synchronous BFS over CSR arrays: the whole frontier
+is expanded at once into the next frontier array, with a bitmap for the
+visited set (vectorized with NumPy when it is installed). Its
+direction-optimizing mode (Beamer et al.) switches to "bottom-up" steps
+while the frontier is large: instead of pushing from every frontier node,
+each unvisited node looks for any parent in the frontier and stops at the
+first one, which skips most edge checks on low-diameter graphs.
+
+`iter_bfs` / `iter_dfs` are lazy generators yielding (node, depth, parent)
+one node at a time, so a caller that stops early (first match, depth or
+node budget) only pays for the part of the graph it actually explored.
+
+`multi_source_bfs` computes the distance to the nearest of many seeds in a
+single pass, and `zero_one_bfs` finds shortest paths when every edge weighs
+0 or 1 in O(V + E) with a double-ended queue (0-edges go to the front,
+1-edges to the back), replacing Dijkstra's heap on such graphs.
 """
 
+from array import array
 from collections import deque
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from data_structures.Deque.python.deque import Deque
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bfs_levels falls back to bytearrays.
+    np = None
 
 
 # SIMPLE BFS TRAVERSAL
@@ -35,6 +64,8 @@ def bfs_traversal(graph: dict, start_node) -> List[Any]:
     list
         A list containing the nodes in the order they were visited.
     """
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, start_node)[0]
 
     visited = set()          # Keep track of visited nodes
     queue = deque([start_node])  # Initialize queue with the start node
@@ -68,6 +99,9 @@ def bfs_with_levels(graph: Dict[Any, List[Any]], start_node: Any) -> Dict[Any, i
     Time Complexity: O(V + E)
     Space Complexity: O(V)
     """
+    if isinstance(graph, CSRGraph):
+        order, levels = _bfs_csr(graph, start_node)
+        return dict(zip(order, levels))
    
     visited = set()
     queue = deque([(start_node, 0)])  # Store (node, level) tuples
@@ -87,6 +121,456 @@ def bfs_with_levels(graph: Dict[Any, List[Any]], start_node: Any) -> Dict[Any, i
     return levels
 
 
+def _bfs_csr(graph: CSRGraph, start_node: Any):
+    """
+    BFS over a CSRGraph. Returns the visit order (as labels) and the level of
+    each visited node, in the same order.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)
+    source = graph.index_of(start_node)
+    visited[source] = 1
+    order = [source]
+    levels = [0]
+
+    head = 0
+    while head < len(order):
+        node, level = order[head], levels[head]
+        head += 1
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                order.append(neighbor)
+                levels.append(level + 1)
+
+    label = graph.label_of
+    return [label(node) for node in order], levels
+
+
+def iter_bfs(
+    graph,
+    start_node: Any,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    prune: Optional[Callable[[Any, int, Any], bool]] = None,
+) -> Iterator[Tuple[Any, int, Any]]:
+    """
+    Lazily traverse the graph breadth-first.
+
+    Args:
+        graph: adjacency dict (neighbor lists or dicts) or CSRGraph
+        start_node: node to start from (yielded first, with parent None)
+        max_depth: do not go further than this many edges from start_node
+        max_nodes: stop after yielding this many nodes
+        prune: optional predicate(node, depth, parent); when it returns True
+               the node is neither yielded nor expanded (and not revisited)
+
+    Yields:
+        (node, depth, parent) tuples in BFS order.
+
+    Time Complexity: O(V + E) for a full traversal, less when stopped early
+    Space Complexity: O(V)
+    """
+    neighbors, label, start = _traversal_view(graph, start_node)
+    if max_nodes is not None and max_nodes <= 0:
+        return
+    yield label(start), 0, None
+    yielded = 1
+    visited = {start}
+    queue = deque([(start, 0)])
+
+    while queue:
+        node, depth = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        node_label = label(node)
+        for neighbor in neighbors(node):
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            neighbor_label = label(neighbor)
+            if prune is not None and prune(neighbor_label, depth + 1, node_label):
+                continue
+            yield neighbor_label, depth + 1, node_label
+            yielded += 1
+            if max_nodes is not None and yielded >= max_nodes:
+                return
+            queue.append((neighbor, depth + 1))
+
+
+def iter_dfs(
+    graph,
+    start_node: Any,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    prune: Optional[Callable[[Any, int, Any], bool]] = None,
+) -> Iterator[Tuple[Any, int, Any]]:
+    """
+    Lazily traverse the graph depth-first (preorder, same order as the
+    recursive DFS), using an explicit stack of neighbor iterators so deep
+    graphs cannot hit the recursion limit.
+
+    Arguments are the same as for `iter_bfs`; depth is the length of the
+    DFS tree path, not the shortest distance.
+
+    Yields:
+        (node, depth, parent) tuples in DFS preorder.
+    """
+    neighbors, label, start = _traversal_view(graph, start_node)
+    if max_nodes is not None and max_nodes <= 0:
+        return
+    yield label(start), 0, None
+    yielded = 1
+    visited = {start}
+    stack = []
+    if max_depth is None or max_depth > 0:
+        stack.append((start, 0, iter(neighbors(start))))
+
+    while stack:
+        node, depth, pending = stack[-1]
+        for neighbor in pending:
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            neighbor_label = label(neighbor)
+            if prune is not None and prune(neighbor_label, depth + 1, label(node)):
+                continue
+            yield neighbor_label, depth + 1, label(node)
+            yielded += 1
+            if max_nodes is not None and yielded >= max_nodes:
+                return
+            if max_depth is None or depth + 1 < max_depth:
+                stack.append((neighbor, depth + 1, iter(neighbors(neighbor))))
+            break
+        else:
+            stack.pop()
+
+
+def multi_source_bfs(graph, sources, max_depth: Optional[int] = None):
+    """
+    BFS from many seeds at once: distance (in edges) from every reachable
+    node to its nearest seed, and which seed that is.
+
+    Args:
+        graph: adjacency dict (neighbor lists or dicts) or CSRGraph
+        sources: iterable of seed nodes (all at distance 0)
+        max_depth: optional limit; farther nodes are not reached
+
+    Returns:
+        (distances, origins) dicts covering the reached nodes only, like
+        bfs_with_levels. Ties between equally near seeds go to the seed
+        listed first.
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    seeds = list(dict.fromkeys(sources))
+    if isinstance(graph, CSRGraph):
+        ids = [graph.index_of(seed) for seed in seeds]
+        offsets, targets = graph.offsets, graph.targets
+
+        def neighbors(node):
+            return targets[offsets[node]:offsets[node + 1]]
+
+        distances, origins = _multi_source_bfs(neighbors, ids, max_depth)
+        label = graph.label_of
+        return (
+            {label(u): d for u, d in distances.items()},
+            {label(u): label(o) for u, o in origins.items()},
+        )
+
+    def dict_neighbors(node):
+        return graph.get(node, [])
+
+    return _multi_source_bfs(dict_neighbors, seeds, max_depth)
+
+
+def _multi_source_bfs(neighbors, seeds, max_depth):
+    distances = dict.fromkeys(seeds, 0)
+    origins = {seed: seed for seed in seeds}
+    queue = Deque()
+    for seed in seeds:
+        queue.add_rear(seed)
+
+    while not queue.is_empty():
+        node = queue.remove_front()
+        depth = distances[node]
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbor in neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = depth + 1
+                origins[neighbor] = origins[node]
+                queue.add_rear(neighbor)
+    return distances, origins
+
+
+def zero_one_bfs(graph, start_node: Any) -> Dict[Any, float]:
+    """
+    Shortest paths on a graph whose edge weights are all 0 or 1.
+
+    A node reached over a 0-edge is as far as the current node, so it goes
+    to the front of the deque; over a 1-edge it goes to the back. The deque
+    therefore stays sorted by distance (holding at most two distinct values)
+    without a heap.
+
+    Args:
+        graph: dict-of-dicts {u: {v: weight}} or CSRGraph, weights 0 or 1
+        start_node: node to start from
+
+    Returns:
+        Distances for every node like dijkstra() (inf if unreachable).
+
+    Raises:
+        ValueError: if an edge weight other than 0 or 1 is encountered.
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    if isinstance(graph, CSRGraph):
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        def neighbors(node):
+            start, end = offsets[node], offsets[node + 1]
+            return zip(targets[start:end], weights[start:end])
+
+        dist = _zero_one_bfs(neighbors, graph.index_of(start_node))
+        label = graph.label_of
+        return {
+            label(u): dist.get(u, float('inf')) for u in range(graph.num_nodes)
+        }
+
+    def dict_neighbors(node):
+        return graph.get(node, {}).items()
+
+    dist = _zero_one_bfs(dict_neighbors, start_node)
+    return {node: dist.get(node, float('inf')) for node in graph}
+
+
+def _zero_one_bfs(neighbors, start):
+    dist = {start: 0}
+    queue = Deque()
+    queue.add_rear((start, 0))
+    while not queue.is_empty():
+        node, d = queue.remove_front()
+        if d > dist[node]:
+            continue  # stale: node was reached more cheaply since
+        for neighbor, weight in neighbors(node):
+            if weight != 0 and weight != 1:
+                raise ValueError(f"Edge weight {weight} is not 0 or 1")
+            nd = d + weight
+            if nd < dist.get(neighbor, float('inf')):
+                dist[neighbor] = nd
+                if weight == 0:
+                    queue.add_front((neighbor, nd))
+                else:
+                    queue.add_rear((neighbor, nd))
+    return dist
+
+
+def _traversal_view(graph, start_node):
+    """(neighbors(node), label(node), start) for dict or CSR traversal."""
+    if isinstance(graph, CSRGraph):
+        offsets, targets = graph.offsets, graph.targets
+
+        def csr_neighbors(node):
+            return targets[offsets[node]:offsets[node + 1]]
+
+        return csr_neighbors, graph.label_of, graph.index_of(start_node)
+
+    def dict_neighbors(node):
+        return graph.get(node, [])
+
+    return dict_neighbors, _identity, start_node
+
+
+def _identity(node):
+    return node
+
+
+def bfs_levels(graph, start_node, direction_optimizing=False, use_numpy=None,
+               alpha=14, beta=24):
+    """
+    Level-synchronous BFS returning the level of every node.
+
+    Args:
+        graph: CSRGraph, or any adjacency accepted by CSRGraph.from_graph
+        start_node: label of the node to start from
+        direction_optimizing: switch between top-down and bottom-up steps
+                              (bottom-up steps scan in-edges, so the first
+                              call builds csr.reverse(), cached afterwards)
+        use_numpy: force (True) or disable (False) the NumPy steps;
+                   default: use NumPy if installed
+        alpha: go bottom-up once the frontier's out-edges exceed
+               1/alpha of the edges of still unvisited nodes
+        beta: go back top-down once the frontier holds fewer than
+              1/beta of all nodes
+
+    Returns:
+        Levels indexed by node id, -1 for unreachable nodes: a NumPy int32
+        array on the NumPy path, otherwise an array('i'). Map ids to labels
+        with `CSRGraph.label_of` (for a non-CSR input, use
+        `CSRGraph.from_graph(graph)` once and pass that instead).
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V) — 1 byte (visited) + 4 bytes (level) per node
+    """
+    csr = CSRGraph.from_graph(graph)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("bfs_levels(use_numpy=True) requires NumPy")
+    steps = _NumpySteps(csr) if use_numpy else _ArraySteps(csr)
+
+    source = csr.index_of(start_node)
+    steps.visit([source], 0)
+    frontier = steps.frontier([source])
+    unexplored_edges = csr.num_edges - steps.out_edges(frontier)
+    bottom_up = False
+    depth = 0
+    while len(frontier):
+        depth += 1
+        if direction_optimizing:
+            frontier_edges = steps.out_edges(frontier)
+            if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < csr.num_nodes / beta:
+                bottom_up = False
+        if bottom_up:
+            frontier = steps.bottom_up(frontier, depth)
+        else:
+            frontier = steps.top_down(frontier, depth)
+        unexplored_edges -= steps.out_edges(frontier)
+    return steps.levels
+
+
+class _ArraySteps:
+    """bfs_levels steps over the CSR arrays with a bytearray visited bitmap."""
+
+    def __init__(self, csr):
+        self.csr = csr
+        self.visited = bytearray(csr.num_nodes)
+        self.levels = array('i', [-1]) * csr.num_nodes
+
+    def frontier(self, nodes):
+        return array('i', nodes)
+
+    def visit(self, nodes, depth):
+        for node in nodes:
+            self.visited[node] = 1
+            self.levels[node] = depth
+
+    def out_edges(self, frontier):
+        offsets = self.csr.offsets
+        return sum(offsets[u + 1] - offsets[u] for u in frontier)
+
+    def top_down(self, frontier, depth):
+        """Push from every frontier node to its unvisited out-neighbors."""
+        offsets, targets = self.csr.offsets, self.csr.targets
+        visited, levels = self.visited, self.levels
+        next_frontier = array('i')
+        for u in frontier:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    levels[v] = depth
+                    next_frontier.append(v)
+        return next_frontier
+
+    def bottom_up(self, frontier, depth):
+        """Every unvisited node adopts its first in-neighbor in the frontier."""
+        reverse = self.csr.reverse()
+        offsets, sources = reverse.offsets, reverse.targets
+        in_frontier = bytearray(self.csr.num_nodes)
+        for u in frontier:
+            in_frontier[u] = 1
+        visited, levels = self.visited, self.levels
+        next_frontier = array('i')
+        v = visited.find(0)  # jump between unvisited nodes at C speed
+        while v != -1:
+            for u in sources[offsets[v]:offsets[v + 1]]:
+                if in_frontier[u]:
+                    next_frontier.append(v)
+                    break
+            v = visited.find(0, v + 1)
+        for v in next_frontier:
+            visited[v] = 1
+            levels[v] = depth
+        return next_frontier
+
+
+class _NumpySteps:
+    """bfs_levels steps as whole-frontier NumPy gathers over the CSR arrays."""
+
+    # Bottom-up steps test the in-edges of every unvisited node one position
+    # per round, for this many rounds, before scanning what is left in bulk
+    first_hit_rounds = 8
+
+    def __init__(self, csr):
+        self.csr = csr
+        self.offsets, self.targets, _ = csr.to_numpy()
+        self.degree = np.diff(self.offsets)
+        self.levels = np.full(csr.num_nodes, -1, dtype=np.int32)
+
+    def frontier(self, nodes):
+        return np.asarray(nodes, dtype=np.int64)
+
+    def visit(self, nodes, depth):
+        self.levels[nodes] = depth
+
+    def out_edges(self, frontier):
+        return int(self.degree[frontier].sum())
+
+    def top_down(self, frontier, depth):
+        neighbors, _ = _gather(self.offsets, self.targets, frontier)
+        new = np.unique(neighbors[self.levels[neighbors] < 0])
+        self.levels[new] = depth
+        return new
+
+    def bottom_up(self, frontier, depth):
+        """
+        Every unvisited node stops at its first in-neighbor in the frontier.
+        Round i checks the i-th in-edge of all nodes still searching at once
+        and drops the nodes that hit; the few nodes with long in-edge lists
+        left after `first_hit_rounds` rounds have the rest scanned in bulk.
+        """
+        offsets, sources, _ = self.csr.reverse().to_numpy()
+        in_frontier = np.zeros(self.csr.num_nodes, dtype=bool)
+        in_frontier[frontier] = True
+        nodes = np.flatnonzero(self.levels < 0)
+        position, end = offsets[nodes], offsets[nodes + 1]
+        found = []
+        for _ in range(self.first_hit_rounds):
+            searching = position < end
+            nodes, position, end = nodes[searching], position[searching], end[searching]
+            if not len(nodes):
+                break
+            hit = in_frontier[sources[position]]
+            found.append(nodes[hit])
+            miss = ~hit
+            nodes, position, end = nodes[miss], position[miss] + 1, end[miss]
+        if len(nodes):
+            parents, counts = _gather_ranges(sources, position, end)
+            found.append(np.unique(np.repeat(nodes, counts)[in_frontier[parents]]))
+        new = np.sort(np.concatenate(found)) if found else nodes
+        self.levels[new] = depth
+        return new
+
+
+def _gather(offsets, targets, nodes):
+    """Concatenate the CSR neighbor slices of `nodes` without a Python loop."""
+    return _gather_ranges(targets, offsets[nodes], offsets[nodes + 1])
+
+
+def _gather_ranges(targets, starts, ends):
+    """Concatenate targets[starts[i]:ends[i]] for every i; also return lengths."""
+    counts = ends - starts
+    total = int(counts.sum())
+    # Position of every gathered edge: its range's start + index within it
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return targets[shift + np.arange(total)], counts
+
+
 def bfs_main(graph: Dict[Any, List[Any]], start_node: Any,is_withLevel:bool=False) ->   List[Any] | Dict[Any, int] :
      if start_node not in graph:
         raise KeyError(f"Start node '{start_node}' not found in graph")
@@ -110,3 +594,21 @@ if __name__ == "__main__":
     print("Graph adjacency list:", graph_example)
     print(f"BFS traversal starting from '{start_node}':", bfs_main(graph_example, 'A'))
     print(f"BFS with levels from '{start_node}':", bfs_main(graph_example, 'A', is_withLevel=True))
+
+    csr = CSRGraph.from_graph(graph_example)
+    levels = bfs_levels(csr, 'A', direction_optimizing=True)
+    # Lazy traversal: stop as soon as 'E' is reached within 2 hops
+    for node, depth, parent in iter_bfs(graph_example, 'A', max_depth=2):
+        if node == 'E':
+            print(f"Found E at depth {depth} via {parent}")
+            break
+    print("DFS preorder:", [node for node, _, _ in iter_dfs(graph_example, 'A')])
+
+    distances, origins = multi_source_bfs(graph_example, ['D', 'F'])
+    print("Nearest of D/F:", {node: (distances[node], origins[node]) for node in distances})
+
+    # Edges of weight 0 are free (e.g. moving within the same zone)
+    binary = {'A': {'B': 0, 'C': 1}, 'B': {'D': 1}, 'C': {'D': 0}, 'D': {}}
+    print("0-1 BFS from A:", zero_one_bfs(binary, 'A'))
+
+    print("Frontier BFS levels:", {csr.label_of(v): int(lvl) for v, lvl in enumerate(levels)})
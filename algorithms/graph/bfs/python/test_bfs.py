@@ -0,0 +1,197 @@
+"""
+Unit tests for the BFS traversals.
+
+Tests cover:
+- bfs_traversal / bfs_with_levels on a small graph
+- bfs_levels (frontier-based) agreeing with bfs_with_levels in every mode:
+  array or NumPy steps, with and without direction optimization
+- iter_bfs / iter_dfs laziness, limits and pruning
+- multi_source_bfs and zero_one_bfs against brute force and dijkstra
+"""
+
+import random
+import unittest
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+from algorithms.graph.bfs.python.bfs import (
+    bfs_levels,
+    bfs_traversal,
+    bfs_with_levels,
+    iter_bfs,
+    iter_dfs,
+    multi_source_bfs,
+    np,
+    zero_one_bfs,
+)
+
+GRAPH = {
+    "A": ["B", "C"],
+    "B": ["A", "D", "E"],
+    "C": ["A", "F"],
+    "D": ["B"],
+    "E": ["B", "F"],
+    "F": ["C", "E"],
+}
+
+
+def random_graph(n, m, seed):
+    """Directed random graph as an adjacency dict of neighbor lists."""
+    rng = random.Random(seed)
+    graph = {u: [] for u in range(n)}
+    for _ in range(m):
+        graph[rng.randrange(n)].append(rng.randrange(n))
+    return graph
+
+
+class TestBFS(unittest.TestCase):
+    """Test cases for the queue-based traversals."""
+
+    def test_traversal_order(self):
+        self.assertEqual(bfs_traversal(GRAPH, "A"), ["A", "B", "C", "D", "E", "F"])
+
+    def test_levels(self):
+        self.assertEqual(
+            bfs_with_levels(GRAPH, "A"),
+            {"A": 0, "B": 1, "C": 1, "D": 2, "E": 2, "F": 2},
+        )
+
+
+class TestBFSLevels(unittest.TestCase):
+    """bfs_levels must match bfs_with_levels in every mode."""
+
+    def modes(self):
+        yield from ((False, False), (False, True))
+        if np is not None:
+            yield from ((True, False), (True, True))
+
+    def test_matches_queue_bfs(self):
+        for seed, (n, m) in enumerate([(50, 60), (300, 3000), (500, 700), (200, 8000)]):
+            graph = random_graph(n, m, seed)
+            csr = CSRGraph.from_adjacency(graph)
+            expected = bfs_with_levels(graph, 0)
+            for use_numpy, direction_optimizing in self.modes():
+                levels = bfs_levels(csr, 0, direction_optimizing, use_numpy)
+                got = {
+                    csr.label_of(v): int(lvl)
+                    for v, lvl in enumerate(levels)
+                    if lvl >= 0
+                }
+                self.assertEqual(got, expected, (seed, use_numpy, direction_optimizing))
+
+    def test_labels_and_unreachable(self):
+        graph = dict(GRAPH, G=[])
+        csr = CSRGraph.from_graph(graph)
+        for use_numpy, direction_optimizing in self.modes():
+            levels = bfs_levels(csr, "D", direction_optimizing, use_numpy)
+            self.assertEqual(levels[csr.index_of("F")], 3)
+            self.assertEqual(levels[csr.index_of("G")], -1)
+
+    def test_dict_input(self):
+        levels = bfs_levels(GRAPH, "A", use_numpy=False)
+        self.assertEqual(list(levels), [0, 1, 1, 2, 2, 2])
+
+
+class TestLazyTraversal(unittest.TestCase):
+    """Test cases for the iter_bfs / iter_dfs generators."""
+
+    def test_bfs_matches_levels(self):
+        graph = random_graph(200, 600, seed=5)
+        visits = list(iter_bfs(graph, 0))
+        self.assertEqual([node for node, _, _ in visits], bfs_traversal(graph, 0))
+        self.assertEqual(
+            {node: depth for node, depth, _ in visits}, bfs_with_levels(graph, 0)
+        )
+        for node, depth, parent in visits[1:]:
+            self.assertIn(node, graph[parent])
+
+    def test_dfs_preorder(self):
+        self.assertEqual(
+            list(iter_dfs(GRAPH, "A")),
+            [
+                ("A", 0, None),
+                ("B", 1, "A"),
+                ("D", 2, "B"),
+                ("E", 2, "B"),
+                ("F", 3, "E"),
+                ("C", 4, "F"),
+            ],
+        )
+
+    def test_csr_input(self):
+        csr = CSRGraph.from_graph(GRAPH)
+        self.assertEqual(list(iter_bfs(csr, "A")), list(iter_bfs(GRAPH, "A")))
+        self.assertEqual(list(iter_dfs(csr, "A")), list(iter_dfs(GRAPH, "A")))
+
+    def test_limits(self):
+        for traverse in (iter_bfs, iter_dfs):
+            within = [node for node, _, _ in traverse(GRAPH, "A", max_depth=1)]
+            self.assertEqual(sorted(within), ["A", "B", "C"])
+            self.assertEqual(len(list(traverse(GRAPH, "A", max_nodes=4))), 4)
+            self.assertEqual(list(traverse(GRAPH, "A", max_depth=0)), [("A", 0, None)])
+            self.assertEqual(list(traverse(GRAPH, "A", max_nodes=0)), [])
+
+    def test_prune(self):
+        def skip_b(node, depth, parent):
+            return node == "B"
+
+        for traverse in (iter_bfs, iter_dfs):
+            nodes = {node for node, _, _ in traverse(GRAPH, "A", prune=skip_b)}
+            self.assertEqual(nodes, {"A", "C", "F", "E"})
+
+    def test_is_lazy(self):
+        expanded = []
+
+        class Spy(dict):
+            def get(self, node, default=None):
+                expanded.append(node)
+                return super().get(node, default)
+
+        chain = Spy({i: [i + 1] for i in range(10_000)})
+        for traverse in (iter_bfs, iter_dfs):
+            expanded.clear()
+            walker = traverse(chain, 0)
+            self.assertEqual([next(walker)[0] for _ in range(3)], [0, 1, 2])
+            self.assertLessEqual(len(expanded), 3)
+
+
+class TestMultiSourceAndZeroOneBFS(unittest.TestCase):
+    """Test cases for multi_source_bfs and zero_one_bfs."""
+
+    def test_multi_source_matches_nearest_seed(self):
+        graph = random_graph(300, 900, seed=8)
+        seeds = [0, 17, 150]
+        distances, origins = multi_source_bfs(graph, seeds)
+        per_seed = {seed: bfs_with_levels(graph, seed) for seed in seeds}
+        for node, distance in distances.items():
+            self.assertEqual(
+                distance, min(lv.get(node, 10**9) for lv in per_seed.values())
+            )
+            self.assertEqual(per_seed[origins[node]][node], distance)
+        reachable = set().union(*per_seed.values())
+        self.assertEqual(set(distances), reachable)
+
+        csr = CSRGraph.from_adjacency(graph)
+        self.assertEqual(multi_source_bfs(csr, seeds), (distances, origins))
+
+    def test_multi_source_max_depth(self):
+        distances, origins = multi_source_bfs(GRAPH, ["D", "F"], max_depth=1)
+        self.assertEqual(distances, {"D": 0, "F": 0, "B": 1, "C": 1, "E": 1})
+        self.assertEqual(origins["E"], "F")
+
+    def test_zero_one_matches_dijkstra(self):
+        rng = random.Random(9)
+        graph = {u: {} for u in range(200)}
+        for _ in range(800):
+            graph[rng.randrange(200)][rng.randrange(200)] = rng.randint(0, 1)
+        expected = dijkstra(graph, 0)
+        self.assertEqual(zero_one_bfs(graph, 0), expected)
+        self.assertEqual(zero_one_bfs(CSRGraph.from_adjacency(graph), 0), expected)
+
+    def test_zero_one_rejects_other_weights(self):
+        with self.assertRaises(ValueError):
+            zero_one_bfs({"a": {"b": 2}, "b": {}}, "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
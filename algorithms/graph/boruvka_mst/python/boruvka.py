@@ -0,0 +1,165 @@
+"""
+Borůvka's Algorithm Implementation in Python
+
+Finds the Minimum Spanning Tree (MST) of an undirected, weighted graph in
+rounds. In every round each component picks its cheapest edge leaving the
+component, and all of those edges are added at once (merging components
+with a Union-Find). Every round at least halves the number of components,
+so there are at most log2(V) rounds.
+
+Finding the cheapest edges is independent per edge, so a round can be split
+over a process pool: every worker scans one slice of the edge list against
+the current component labels, and the per-slice winners are merged. The
+edge list is handed to the workers once, the labels live in shared memory,
+and each worker drops the edges of a slice that fall inside one component,
+so later rounds only rescan edges that can still be chosen.
+
+Edges are compared as (weight, u, v) tuples, which breaks weight ties the
+same way `kruskal` does and guarantees no cycle is formed within a round.
+
+Time Complexity: O(E log V)
+Space Complexity: O(V + E)
+"""
+
+from multiprocessing import Pool, cpu_count
+from multiprocessing.sharedctypes import RawArray
+
+from data_structures.UnionFind.python.union_find import UnionFind
+
+
+def boruvka(n, edges, processes=1):
+    """
+    Borůvka's Algorithm to find Minimum Spanning Tree (MST)
+
+    Parameters:
+        n (int): Number of vertices (0-indexed: 0 to n-1)
+        edges (list of tuples): Each edge as (weight, u, v)
+        processes (int): 1 scans edges in this process (dropping edges
+                         inside a component after every round); more, or
+                         None for one per CPU, scans slices in a Pool
+
+    Returns:
+        mst (list of tuples): Edges in the MST (u, v, weight)
+        total_weight (int/float): Total weight of the MST
+    """
+    uf = UnionFind(n)
+    mst = []
+    total_weight = 0
+
+    if processes == 1:
+        remaining = list(edges)
+        while uf.num_components > 1:
+            labels = uf.find_many(range(n))
+            remaining = [e for e in remaining if labels[e[1]] != labels[e[2]]]
+            cheapest = _cheapest_edges(remaining, labels)
+            if not cheapest:
+                break
+            total_weight += _add_edges(uf, cheapest.values(), mst)
+    else:
+        edges = list(edges)
+        workers = processes or cpu_count()
+        step = max(1, -(-len(edges) // (4 * workers)))
+        slices = [(lo, min(lo + step, len(edges))) for lo in range(0, len(edges), step)]
+        shared_labels = RawArray("i", n)
+        labels = _int_view(shared_labels)
+        with Pool(workers, _init_worker, (edges, shared_labels)) as pool:
+            while uf.num_components > 1:
+                labels[:] = uf.find_many(range(n))
+                cheapest = {}
+                for partial in pool.imap_unordered(_worker_cheapest_edges, slices):
+                    _merge_cheapest(cheapest, partial)
+                if not cheapest:
+                    break
+                total_weight += _add_edges(uf, cheapest.values(), mst)
+
+    if len(mst) != n - 1:
+        print("Warning: The graph is not connected; MST may not include all vertices.")
+
+    return mst, total_weight
+
+
+def _cheapest_edges(edges, labels):
+    """Map each component label to its cheapest (weight, u, v) leaving edge."""
+    cheapest = {}
+    for edge in edges:
+        cu, cv = labels[edge[1]], labels[edge[2]]
+        if cu == cv:
+            continue
+        best = cheapest.get(cu)
+        if best is None or edge < best:
+            cheapest[cu] = edge
+        best = cheapest.get(cv)
+        if best is None or edge < best:
+            cheapest[cv] = edge
+    return cheapest
+
+
+def _merge_cheapest(cheapest, partial):
+    for component, edge in partial.items():
+        best = cheapest.get(component)
+        if best is None or edge < best:
+            cheapest[component] = edge
+
+
+def _add_edges(uf, candidates, mst):
+    """Union the round's chosen edges (an edge may be chosen by both sides)."""
+    added = 0
+    for weight, u, v in candidates:
+        if uf.union(u, v):
+            mst.append((u, v, weight))
+            added += weight
+    return added
+
+
+def _int_view(shared):
+    """Index a shared RawArray("i") at memoryview rather than ctypes speed."""
+    return memoryview(shared).cast("B").cast("i")
+
+
+# Edge list and shared labels of each pool worker, set once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(edges, shared_labels):
+    _WORKER["edges"] = edges
+    _WORKER["labels"] = _int_view(shared_labels)
+    _WORKER["remaining"] = {}
+
+
+def _worker_cheapest_edges(bounds):
+    """
+    Cheapest edges of one slice under the labels of the current round. The
+    slice's edges that still join two components are kept for the next
+    round; components only ever merge, so a slice this worker filtered in
+    any earlier round is still a valid starting point.
+    """
+    labels = _WORKER["labels"]
+    remaining = _WORKER["remaining"].get(bounds)
+    if remaining is None:
+        lo, hi = bounds
+        remaining = _WORKER["edges"][lo:hi]
+    remaining = [e for e in remaining if labels[e[1]] != labels[e[2]]]
+    _WORKER["remaining"][bounds] = remaining
+    return _cheapest_edges(remaining, labels)
+
+
+if __name__ == "__main__":
+    edges = [
+        (1, 0, 1),
+        (3, 0, 2),
+        (3, 1, 2),
+        (6, 1, 3),
+        (2, 2, 3),
+        (4, 3, 4),
+        (5, 2, 4),
+    ]
+    n = 5
+
+    mst, total_weight = boruvka(n, edges)
+    print("Edges in MST:")
+    for u, v, w in mst:
+        print(f"{u} -- {v} == {w}")
+    print("Total weight of MST:", total_weight)
+
+    _, parallel_weight = boruvka(n, edges, processes=2)
+    print("Total weight with 2 processes:", parallel_weight)
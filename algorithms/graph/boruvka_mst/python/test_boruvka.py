@@ -0,0 +1,50 @@
+"""
+Unit tests for Borůvka's MST.
+
+Tests cover:
+- The same tree as kruskal on random graphs, including tied weights
+- The process-pool variant agreeing with the single-process one
+- Disconnected graphs producing a spanning forest
+"""
+
+import random
+import unittest
+
+from algorithms.graph.boruvka_mst.python.boruvka import boruvka
+from algorithms.graph.kruskal_mst.python.kruskal import kruskal
+
+
+def random_edges(n, m, seed, max_weight=100):
+    rng = random.Random(seed)
+    return [
+        (rng.randint(1, max_weight), rng.randrange(n), rng.randrange(n))
+        for _ in range(m)
+    ]
+
+
+class TestBoruvka(unittest.TestCase):
+    """Test cases for Borůvka's algorithm."""
+
+    def test_matches_kruskal(self):
+        for seed, max_weight in ((0, 100), (1, 3)):
+            edges = random_edges(200, 1200, seed, max_weight)
+            expected_mst, expected_total = kruskal(200, list(edges))
+            mst, total = boruvka(200, edges)
+            self.assertEqual(sorted(mst), sorted(expected_mst))
+            self.assertEqual(total, expected_total)
+
+    def test_process_pool(self):
+        edges = random_edges(150, 900, seed=2, max_weight=5)
+        self.assertEqual(
+            sorted(boruvka(150, edges, processes=2)[0]), sorted(boruvka(150, edges)[0])
+        )
+
+    def test_disconnected(self):
+        edges = [(1, 0, 1), (2, 1, 2), (5, 3, 4)]
+        mst, total = boruvka(6, edges)
+        self.assertEqual(sorted(mst), [(0, 1, 1), (1, 2, 2), (3, 4, 5)])
+        self.assertEqual(total, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: Contraction Hierarchies vs plain Dijkstra
+
+Description:
+Builds a contraction hierarchy for generated grid and random graphs, then
+times the same random point-to-point queries with `ContractionHierarchy.query`
+and with `dijkstra(graph, s, target=t)`, checking both give equal distances.
+
+Usage (from the repository root):
+    python -m algorithms.graph.contraction_hierarchies.python.benchmark_contraction_hierarchies
+    python -m algorithms.graph.contraction_hierarchies.python.benchmark_contraction_hierarchies \
+        --grid 30 60 --random 1000 5000 --queries 500
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.graph.contraction_hierarchies.python.contraction_hierarchies import (
+    ContractionHierarchy,
+)
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+
+
+def grid_graph(side, rng):
+    """Undirected side x side 4-connected grid with random weights 1..10."""
+    graph = {(r, c): {} for r in range(side) for c in range(side)}
+    for r in range(side):
+        for c in range(side):
+            for nr, nc in ((r + 1, c), (r, c + 1)):
+                if nr < side and nc < side:
+                    w = rng.randint(1, 10)
+                    graph[(r, c)][(nr, nc)] = w
+                    graph[(nr, nc)][(r, c)] = w
+    return graph
+
+
+def random_graph(n, rng, avg_degree=4):
+    """Directed random graph with about n * avg_degree edges, weights 1..100."""
+    graph = {u: {} for u in range(n)}
+    for _ in range(n * avg_degree):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(1, 100)
+    return graph
+
+
+def run_case(name, graph, num_queries, rng):
+    """Preprocess `graph`, time the query batch and print one result row."""
+    nodes = list(graph)
+    queries = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(num_queries)]
+
+    start = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ch_results = [ch.query(s, t)[0] for s, t in queries]
+    ch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dijkstra_results = [
+        dijkstra(graph, s, target=t).get(t, float("inf")) for s, t in queries
+    ]
+    dijkstra_time = time.perf_counter() - start
+
+    if ch_results != dijkstra_results:
+        raise AssertionError(f"{name}: CH and Dijkstra distances differ")
+
+    edges = sum(len(neighbors) for neighbors in graph.values())
+    print(
+        f"{name:<18} V={len(graph):<7} E={edges:<8} "
+        f"build={build_time:8.2f}s shortcuts={ch.num_shortcuts:<8} "
+        f"ch={1e6 * ch_time / num_queries:9.1f}us/query "
+        f"dijkstra={1e6 * dijkstra_time / num_queries:9.1f}us/query "
+        f"speedup={dijkstra_time / ch_time:6.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--grid", type=int, nargs="*", default=[20, 40], help="grid side lengths"
+    )
+    parser.add_argument(
+        "--random", type=int, nargs="*", default=[500, 1000], help="random graph sizes"
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for side in args.grid:
+        run_case(f"grid {side}x{side}", grid_graph(side, rng), args.queries, rng)
+    for n in args.random:
+        run_case(f"random n={n}", random_graph(n, rng), args.queries, rng)
+
+
+if __name__ == "__main__":
+    main()
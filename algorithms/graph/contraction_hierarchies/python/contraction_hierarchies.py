@@ -0,0 +1,369 @@
+"""
+Contraction Hierarchies (CH) for Repeated Shortest-Path Queries
+
+Description:
+Contraction hierarchies preprocess a static weighted graph once so that
+point-to-point shortest-path queries only explore a tiny part of it.
+
+Preprocessing:
+1. Nodes are ordered by importance using a lazily updated priority
+   (edge difference + number of already contracted neighbors).
+2. Nodes are contracted in that order. Contracting v removes it from the
+   remaining graph; for every pair u -> v -> w whose path through v is the
+   only shortest one (checked with a bounded "witness" Dijkstra search that
+   avoids v), a shortcut edge u -> w remembering v as its middle node is added.
+3. Every edge ends up stored at its lower-ranked endpoint: edges that go "up"
+   in rank form the forward search graph, reversed edges coming "down" form
+   the backward search graph. Both are packed into flat CSR arrays.
+
+Query:
+A bidirectional Dijkstra where both searches only move to higher-ranked
+nodes. The best meeting node gives the distance; shortcut edges are unpacked
+recursively through their middle nodes to recover the full path.
+
+A built hierarchy can be saved to disk with `save()` and reopened with
+`ContractionHierarchy.load()` without preprocessing again.
+
+Time Complexity:
+- Preprocessing: roughly O(V * witness search cost); depends on the graph
+  (near-linear on road-like graphs, worse on dense random graphs)
+- Query: proportional to the (small) upward search spaces, typically a few
+  hundred nodes even on large road networks
+
+Space Complexity: O(V + E + S) where S is the number of shortcuts.
+"""
+
+import heapq
+import pickle
+from array import array
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+INF = float("inf")
+
+
+class ContractionHierarchy:
+    """Preprocessed graph answering shortest-path queries via upward searches."""
+
+    def __init__(self, labels, rank, forward, backward):
+        """
+        Wrap already-built hierarchy arrays. Use `build()` or `load()` to
+        obtain an instance.
+
+        :param labels: list of node labels by id, or None for ids 0..V-1
+        :param rank: array of contraction order positions by node id
+        :param forward: (offsets, targets, weights, middles) of upward edges
+        :param backward: (offsets, targets, weights, middles) of reversed
+                         downward edges
+        """
+        self.labels = labels
+        self.rank = rank
+        self.forward = forward
+        self.backward = backward
+        self._index = (
+            {label: i for i, label in enumerate(labels)} if labels is not None else None
+        )
+
+    # ------------------------------------------------------------------
+    # Preprocessing
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        """
+        Contract every node of `graph` and return the resulting hierarchy.
+
+        :param graph: dict-of-dicts, Graph or CSRGraph with non-negative weights
+        :param witness_limit: max nodes settled per witness search; lower is
+                              faster to build but may add redundant shortcuts
+        """
+        csr = CSRGraph.from_graph(graph)
+        n = csr.num_nodes
+
+        # Dynamic adjacency over the not-yet-contracted nodes:
+        # out_edges[u][v] = (weight, middle) with middle -1 for original edges
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u, v, w in csr.edges():
+            if u != v and w < out_edges[u].get(v, (INF,))[0]:
+                out_edges[u][v] = (w, -1)
+                in_edges[v][u] = (w, -1)
+
+        contractor = _Contractor(out_edges, in_edges, witness_limit)
+        rank = array("i", [0]) * n
+        up = [None] * n
+        down = [None] * n
+
+        queue = [(contractor.priority(v)[0], v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: recompute and re-queue if v is no longer the minimum
+            priority, shortcuts = contractor.priority(v)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, v))
+                continue
+            rank[v] = order
+            order += 1
+            up[v] = list(out_edges[v].items())
+            down[v] = list(in_edges[v].items())
+            contractor.contract(v, shortcuts)
+
+        labels = None if csr.labels is None else list(csr.labels)
+        return cls(labels, rank, _pack(up), _pack(down))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(self, source, target, unpack=True):
+        """
+        Shortest path from `source` to `target`.
+
+        :param unpack: if False, skip path unpacking and return path None
+        :return: (distance, path) or (float('inf'), None) if unreachable,
+                 matching bidirectional_dijkstra()
+        """
+        s, t = self._id(source), self._id(target)
+        if s == t:
+            return 0, [source]
+
+        best, meeting, parent = self._upward_search(s, t)
+        if meeting < 0:
+            return INF, None
+        if not unpack:
+            return best, None
+        return best, [self._label(node) for node in self._unpack(parent, meeting)]
+
+    def _upward_search(self, s, t):
+        """
+        Alternate the forward and backward upward searches. Returns the best
+        distance, the meeting node (-1 if none) and both parent maps.
+        """
+        dist = ({s: 0}, {t: 0})
+        parent = ({s: -1}, {t: -1})
+        heaps = ([(0, s)], [(0, t)])
+        graphs = (self.forward, self.backward)
+        best, meeting = INF, -1
+
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                d, u = heapq.heappop(heap)
+                if d > dist[side][u]:
+                    continue
+                if d >= best:
+                    heap.clear()  # this direction can no longer improve
+                    continue
+                other = dist[1 - side].get(u)
+                if other is not None and d + other < best:
+                    best, meeting = d + other, u
+                _relax(graphs[side], u, d, dist[side], parent[side], heap)
+
+        return best, meeting, parent
+
+    def distance(self, source, target):
+        """Shortest-path distance only (no path unpacking)."""
+        return self.query(source, target, unpack=False)[0]
+
+    def _unpack(self, parent, meeting):
+        """Expand the up-down search tree path into original graph nodes."""
+        hops = []
+        node = meeting
+        while parent[0][node] != -1:
+            hops.append((parent[0][node], node))
+            node = parent[0][node]
+        hops.reverse()
+        node = meeting
+        while parent[1][node] != -1:
+            hops.append((node, parent[1][node]))
+            node = parent[1][node]
+
+        path = [hops[0][0]] if hops else [meeting]
+        for u, v in hops:
+            # Depth-first expansion of shortcuts, without recursion
+            stack = [(u, v)]
+            while stack:
+                a, b = stack.pop()
+                middle = self._middle(a, b)
+                if middle < 0:
+                    path.append(b)
+                else:
+                    stack.append((middle, b))
+                    stack.append((a, middle))
+        return path
+
+    def _middle(self, a, b):
+        """Middle node of the stored edge a -> b (-1 for an original edge)."""
+        if self.rank[a] < self.rank[b]:
+            offsets, targets, _, middles = self.forward
+            owner, other = a, b
+        else:
+            offsets, targets, _, middles = self.backward
+            owner, other = b, a
+        for i in range(offsets[owner], offsets[owner + 1]):
+            if targets[i] == other:
+                return middles[i]
+        raise KeyError((a, b))
+
+    def _id(self, label):
+        if self._index is not None:
+            return self._index[label]
+        if not 0 <= label < len(self.rank):
+            raise KeyError(label)
+        return label
+
+    def _label(self, node_id):
+        return self.labels[node_id] if self.labels is not None else node_id
+
+    @property
+    def num_shortcuts(self):
+        """Number of shortcut edges added during preprocessing."""
+        return sum(1 for m in self.forward[3] if m >= 0) + sum(
+            1 for m in self.backward[3] if m >= 0
+        )
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def save(self, path):
+        """Write the hierarchy to `path` (typed arrays are stored as raw bytes)."""
+        state = {
+            "labels": self.labels,
+            "rank": self.rank,
+            "forward": self.forward,
+            "backward": self.backward,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Reopen a hierarchy written by `save()` (only load trusted files)."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        return cls(state["labels"], state["rank"], state["forward"], state["backward"])
+
+
+class _Contractor:
+    """Shortcut computation over the shrinking dynamic adjacency."""
+
+    def __init__(self, out_edges, in_edges, witness_limit):
+        self.out_edges = out_edges
+        self.in_edges = in_edges
+        self.witness_limit = witness_limit
+        self.deleted_neighbors = [0] * len(out_edges)
+        self.level = [0] * len(out_edges)
+
+    def shortcuts(self, v):
+        """List the shortcuts (u, w, weight) needed to contract v."""
+        out_v = self.out_edges[v]
+        needed = []
+        for u, (w_uv, _) in self.in_edges[v].items():
+            goals = {w: w_uv + w_vw for w, (w_vw, _) in out_v.items() if w != u}
+            if not goals:
+                continue
+            witness = self._witness_search(u, v, goals)
+            for w, via_v in goals.items():
+                if witness.get(w, INF) > via_v:
+                    needed.append((u, w, via_v))
+        return needed
+
+    def priority(self, v):
+        """
+        Edge difference + contracted-neighbor count + hierarchy level, and the
+        shortcuts. The last two terms spread contraction evenly over the graph,
+        which keeps upward search spaces small.
+        """
+        shortcuts = self.shortcuts(v)
+        removed = len(self.out_edges[v]) + len(self.in_edges[v])
+        priority = len(shortcuts) - removed + self.deleted_neighbors[v] + self.level[v]
+        return priority, shortcuts
+
+    def contract(self, v, shortcuts):
+        """Remove v from the remaining graph and insert its shortcuts."""
+        level = self.level[v] + 1
+        for w in self.out_edges[v]:
+            del self.in_edges[w][v]
+            self.deleted_neighbors[w] += 1
+            self.level[w] = max(self.level[w], level)
+        for u in self.in_edges[v]:
+            del self.out_edges[u][v]
+            self.deleted_neighbors[u] += 1
+            self.level[u] = max(self.level[u], level)
+        for u, w, weight in shortcuts:
+            if weight < self.out_edges[u].get(w, (INF,))[0]:
+                self.out_edges[u][w] = (weight, v)
+                self.in_edges[w][u] = (weight, v)
+
+    def _witness_search(self, source, skip, goals):
+        """Bounded Dijkstra from `source` avoiding `skip`."""
+        limit = max(goals.values())
+        remaining = len(goals)
+        dist = {source: 0}
+        heap = [(0, source)]
+        settled = 0
+        while heap and settled < self.witness_limit:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d > limit:
+                break
+            settled += 1
+            if u in goals:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            for v, (w, _) in self.out_edges[u].items():
+                if v == skip:
+                    continue
+                nd = d + w
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist
+
+
+def _relax(graph, u, d, dist, parent, heap):
+    """Relax the upward edges of u in one search direction."""
+    offsets, targets, weights, _ = graph
+    for i in range(offsets[u], offsets[u + 1]):
+        v = targets[i]
+        nd = d + weights[i]
+        if nd < dist.get(v, INF):
+            dist[v] = nd
+            parent[v] = u
+            heapq.heappush(heap, (nd, v))
+
+
+def _pack(adjacency):
+    """Pack per-node [(neighbor, (weight, middle)), ...] lists into CSR arrays."""
+    offsets = array("q", [0])
+    targets = array("i")
+    weights = array("d")
+    middles = array("i")
+    for edges in adjacency:
+        for v, (w, middle) in edges:
+            targets.append(v)
+            weights.append(w)
+            middles.append(middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+
+# Example runnable block
+if __name__ == "__main__":
+    road = {
+        "A": {"B": 4, "C": 2},
+        "B": {"A": 4, "C": 1, "D": 5},
+        "C": {"A": 2, "B": 1, "D": 8, "E": 10},
+        "D": {"B": 5, "C": 8, "E": 2, "Z": 6},
+        "E": {"C": 10, "D": 2, "Z": 3},
+        "Z": {"D": 6, "E": 3},
+    }
+    ch = ContractionHierarchy.build(road)
+    print("Shortcuts added:", ch.num_shortcuts)
+    for source, target in [("A", "Z"), ("Z", "A"), ("B", "E")]:
+        distance, path = ch.query(source, target)
+        print(f"{source} -> {target}: distance {distance}, path {path}")
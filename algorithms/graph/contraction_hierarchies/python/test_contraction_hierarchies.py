@@ -0,0 +1,83 @@
+"""
+Unit tests for Contraction Hierarchies.
+
+Tests cover:
+- Query distances and paths matching plain Dijkstra on random graphs
+- Directed graphs and unreachable pairs
+- Saving to and loading from disk
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from contraction_hierarchies import ContractionHierarchy
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+
+
+def random_graph(n, m, seed, directed=True):
+    """Random dict-of-dicts graph with integer weights."""
+    rng = random.Random(seed)
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            w = rng.randint(1, 30)
+            graph[u][v] = w
+            if not directed:
+                graph[v][u] = w
+    return graph
+
+
+def path_length(graph, path):
+    return sum(graph[u][v] for u, v in zip(path, path[1:]))
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    """Test cases for ContractionHierarchy build and query."""
+
+    def check_against_dijkstra(self, graph, ch, sources):
+        for s in sources:
+            expected = dijkstra(graph, s)
+            for t in graph:
+                distance, path = ch.query(s, t)
+                self.assertEqual(distance, expected[t], (s, t))
+                if path is None:
+                    self.assertEqual(expected[t], float("inf"))
+                    continue
+                self.assertEqual((path[0], path[-1]), (s, t))
+                self.assertEqual(path_length(graph, path), distance)
+
+    def test_directed_random_graphs(self):
+        for seed in range(4):
+            graph = random_graph(60, 200, seed)
+            ch = ContractionHierarchy.build(graph)
+            self.check_against_dijkstra(graph, ch, [0, 7, 31])
+
+    def test_undirected_graph_with_small_witness_limit(self):
+        graph = random_graph(80, 200, 99, directed=False)
+        ch = ContractionHierarchy.build(graph, witness_limit=3)
+        self.check_against_dijkstra(graph, ch, [1, 50])
+
+    def test_labels_and_unreachable(self):
+        graph = {"A": {"B": 1}, "B": {"C": 2}, "C": {}, "D": {"A": 1}}
+        ch = ContractionHierarchy.build(graph)
+        self.assertEqual(ch.query("D", "C"), (4, ["D", "A", "B", "C"]))
+        self.assertEqual(ch.query("C", "A"), (float("inf"), None))
+        self.assertEqual(ch.query("B", "B"), (0, ["B"]))
+        self.assertEqual(ch.distance("A", "C"), 3)
+
+    def test_save_and_load(self):
+        graph = random_graph(40, 150, 5)
+        ch = ContractionHierarchy.build(graph)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.ch")
+            ch.save(path)
+            loaded = ContractionHierarchy.load(path)
+        self.assertEqual(loaded.num_shortcuts, ch.num_shortcuts)
+        self.check_against_dijkstra(graph, loaded, [0, 20])
+
+
+if __name__ == "__main__":
+    unittest.main()
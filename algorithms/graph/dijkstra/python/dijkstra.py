@@ -2,9 +2,10 @@
 Dijkstra's Algorithm Implementation in Python
 
 Time Complexity:
-- Using Priority Queue (heapq): O((V + E) log V)
+- Using an indexed d-ary heap with decrease-key: O((V + E) log V)
   where V = number of vertices, E = number of edges
-- Each edge relaxation takes O(log V) due to the priority queue.
+- Each edge relaxation takes O(log V) due to the priority queue, and the
+  heap never holds more than one entry per vertex (no stale duplicates).
 
 Space Complexity:
 - O(V) for distance and visited tracking
@@ -12,42 +13,335 @@ Space Complexity:
 
 This algorithm finds the shortest path from a single source
 to all other vertices in a weighted graph with non-negative edge weights.
+Given a `target` or `max_distance` it stops as soon as the target (or every
+node within the radius) is settled, so point-to-point queries only touch
+the part of the graph closer than the answer.
+
+Variants built on the same heap:
+- bidirectional_dijkstra: single-pair queries searching from both ends and
+  stopping when the two frontiers meet (roughly halves the explored radius).
+- multi_source_dijkstra: one search seeded with many start nodes (optionally
+  with per-source offsets), giving each node its distance to the nearest
+  source and which source that is.
+
+The graph may be given as a dict-of-dicts or as a CSRGraph
+(data_structures/Graph/python/csr_graph.py), in which case the search runs
+over integer ids and flat arrays instead of hashing node labels.
 """
 
-import heapq
+from array import array
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.heap.python.min_heap import IndexedMinHeap
+
+INF = float("inf")
 
 
-def dijkstra(graph, start):
+def dijkstra(graph, start, target=None, max_distance=None, return_predecessors=False):
     """
     Dijkstra's Algorithm for shortest paths from a source node.
 
     :param graph: Adjacency list representation of the graph
                   Example: {'A': {'B': 4, 'C': 2}, 'B': {'C': 5, 'D': 10}, ...}
+                  or a CSRGraph.
     :param start: The starting node
+    :param target: Optional node; the search stops once it is settled
+    :param max_distance: Optional radius; nodes farther than this are not settled
+    :param return_predecessors: If True, also return the predecessor map
     :return: Dictionary of shortest distances from start to all nodes
+             (float('inf') if unreachable). When `target` or `max_distance`
+             is given, only the nodes settled before stopping are included.
+             With `return_predecessors` a tuple (distances, predecessors) is
+             returned, where predecessors maps each settled node to the node
+             before it on its shortest path (None for start).
     """
-    # Initialize distances to infinity, except for the start node
-    distances = {node: float("inf") for node in graph}
-    distances[start] = 0
+    early_exit = target is not None or max_distance is not None
 
-    # Priority queue for exploring nodes (distance, node)
-    pq = [(0, start)]
+    if isinstance(graph, CSRGraph):
+        targets = None if target is None else {graph.index_of(target)}
+        dist, pred, settled = dijkstra_csr(
+            graph, {graph.index_of(start): 0}, targets, max_distance
+        )
+        label = graph.label_of
+        nodes = settled if early_exit else range(graph.num_nodes)
+        distances = {label(u): dist[u] for u in nodes}
+        if not return_predecessors:
+            return distances
+        predecessors = {
+            label(u): None if pred[u] < 0 else label(pred[u]) for u in settled
+        }
+        return distances, predecessors
+
+    targets = None if target is None else {target}
+    distances, predecessors = _dijkstra_dict(graph, {start: 0}, targets, max_distance)
+    if not early_exit:
+        # Keep the classic contract: every node present, inf if unreachable
+        distances = {node: distances.get(node, INF) for node in graph}
+    if return_predecessors:
+        return distances, predecessors
+    return distances
 
-    while pq:
-        current_dist, current_node = heapq.heappop(pq)
 
-        # Skip if we already found a better path
-        if current_dist > distances[current_node]:
-            continue
+def _dijkstra_dict(graph, seeds, targets=None, max_distance=None):
+    """
+    Core search over a dict-of-dicts graph.
 
-        # Explore neighbors
-        for neighbor, weight in graph[current_node].items():
+    :param seeds: dict {node: initial distance} of start nodes
+    :param targets: optional set of nodes; stop once all of them are settled
+    :param max_distance: optional radius beyond which nodes are not settled
+    :return: (settled distances, predecessors) dicts, in settling order
+    """
+    heap = IndexedMinHeap()
+    best = {}  # tentative distances of discovered nodes
+    parent = {}
+    for node, distance in seeds.items():
+        if distance < best.get(node, INF):
+            best[node] = distance
+            parent[node] = None
+            heap.insert(node, distance)
+
+    remaining = len(targets) if targets else 0
+    settled = {}
+    predecessors = {}
+    while heap:
+        node, current_dist = heap.extract_min()
+        if max_distance is not None and current_dist > max_distance:
+            break
+        settled[node] = current_dist
+        predecessors[node] = parent[node]
+        if targets and node in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+
+        # Relax edges; heap.insert lowers the key in place if already queued
+        for neighbor, weight in graph.get(node, {}).items():
+            if neighbor in settled:
+                continue
             distance = current_dist + weight
-            if distance < distances[neighbor]:
-                distances[neighbor] = distance
-                heapq.heappush(pq, (distance, neighbor))
+            if distance < best.get(neighbor, INF):
+                best[neighbor] = distance
+                parent[neighbor] = node
+                heap.insert(neighbor, distance)
 
-    return distances
+    return settled, predecessors
+
+
+def dijkstra_csr(graph, seeds, targets=None, max_distance=None):
+    """
+    Array-native Dijkstra over a CSRGraph, for callers working in node ids.
+
+    :param graph: CSRGraph
+    :param seeds: dict {node_id: initial distance} of start nodes
+    :param targets: optional set of node ids; stop once all are settled
+    :param max_distance: optional radius beyond which nodes are not settled
+    :return: (dist, pred, settled) where dist is an array('d') of distances
+             (exact for settled ids), pred an array('i') of predecessor ids
+             (-1 for seeds / unreached) and settled the list of ids in the
+             order they were settled
+    """
+    offsets, targets_arr, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.num_nodes
+    dist = array("d", [INF]) * n
+    pred = array("i", [-1]) * n
+    done = bytearray(n)
+
+    heap = IndexedMinHeap()
+    for node, distance in seeds.items():
+        if distance < dist[node]:
+            dist[node] = distance
+            heap.insert(node, distance)
+
+    remaining = len(targets) if targets else 0
+    settled = []
+    while heap:
+        u, current_dist = heap.extract_min()
+        if max_distance is not None and current_dist > max_distance:
+            break
+        done[u] = 1
+        settled.append(u)
+        if targets and u in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets_arr[i]
+            if done[v]:
+                continue
+            distance = current_dist + weights[i]
+            if distance < dist[v]:
+                dist[v] = distance
+                pred[v] = u
+                heap.insert(v, distance)
+
+    return dist, pred, settled
+
+
+def reconstruct_path(predecessors, target):
+    """
+    Rebuild the path to `target` from a predecessor map returned by
+    dijkstra(..., return_predecessors=True). Returns None if `target` was
+    not settled.
+    """
+    if target not in predecessors:
+        return None
+    path = [target]
+    while predecessors[path[-1]] is not None:
+        path.append(predecessors[path[-1]])
+    return path[::-1]
+
+
+def reverse_graph(graph):
+    """
+    Return the reverse of a dict-of-dicts graph (every edge u -> v becomes
+    v -> u). Build it once and pass it to bidirectional_dijkstra when issuing
+    many queries against the same graph.
+    """
+    reverse = {node: {} for node in graph}
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            edges = reverse.setdefault(v, {})
+            if weight < edges.get(u, INF):
+                edges[u] = weight
+    return reverse
+
+
+def bidirectional_dijkstra(graph, source, target, reverse=None):
+    """
+    Shortest path between a single pair of nodes, searching forward from
+    `source` and backward from `target` at the same time.
+
+    The smaller frontier is expanded at each step. Every time an edge reaches
+    a node already labelled by the opposite search, the path through it is a
+    candidate; the search stops once the two heap minima add up to at least
+    the best candidate, which is then optimal.
+
+    :param graph: dict-of-dicts or CSRGraph with non-negative weights
+    :param source: start node
+    :param target: destination node
+    :param reverse: optional precomputed reverse_graph(graph) for dict graphs
+                    (a CSRGraph caches its own reverse)
+    :return: (distance, path) or (float('inf'), None) if unreachable
+    """
+    if isinstance(graph, CSRGraph):
+        distance, path = _bidirectional_search(
+            graph.neighbors,
+            graph.reverse().neighbors,
+            graph.index_of(source),
+            graph.index_of(target),
+        )
+        if path is not None:
+            path = [graph.label_of(node) for node in path]
+        return distance, path
+
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    empty = {}
+    return _bidirectional_search(
+        lambda node: graph.get(node, empty).items(),
+        lambda node: reverse.get(node, empty).items(),
+        source,
+        target,
+    )
+
+
+def _bidirectional_search(forward, backward, source, target):
+    """
+    Bidirectional Dijkstra over neighbor accessors returning (node, weight)
+    pairs. Index 0 holds the forward search state, index 1 the backward one.
+    """
+    if source == target:
+        return 0, [source]
+
+    expand = (forward, backward)
+    dist = ({source: 0}, {target: 0})
+    parent = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = (IndexedMinHeap(), IndexedMinHeap())
+    heaps[0].insert(source, 0)
+    heaps[1].insert(target, 0)
+
+    best, meeting = INF, None
+    while heaps[0] and heaps[1]:
+        if heaps[0].get_min()[1] + heaps[1].get_min()[1] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        node, current_dist = heaps[side].extract_min()
+        settled[side].add(node)
+        own, other = dist[side], dist[1 - side]
+
+        for neighbor, weight in expand[side](node):
+            if neighbor in settled[side]:
+                continue
+            distance = current_dist + weight
+            if distance < own.get(neighbor, INF):
+                own[neighbor] = distance
+                parent[side][neighbor] = node
+                heaps[side].insert(neighbor, distance)
+            # Candidate path through a node the opposite search has labelled
+            if neighbor in other and own[neighbor] + other[neighbor] < best:
+                best = own[neighbor] + other[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return INF, None
+    return best, _stitch_path(parent, meeting)
+
+
+def _stitch_path(parent, meeting):
+    """Join source -> meeting (forward parents) with meeting -> target."""
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = parent[0][node]
+    path.reverse()
+    node = parent[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = parent[1][node]
+    return path
+
+
+def multi_source_dijkstra(graph, sources, max_distance=None):
+    """
+    Distance from every node to its nearest source, in a single search.
+
+    :param graph: dict-of-dicts or CSRGraph with non-negative weights
+    :param sources: iterable of start nodes (all at distance 0), or a dict
+                    {node: offset} giving each source its own start distance
+    :param max_distance: optional radius beyond which nodes are not settled
+    :return: (distances, origins) dicts. origins maps each reached node to the
+             source it is closest to. Without `max_distance` every node is
+             present in distances (inf and origin None if unreachable), like
+             dijkstra(); with it only settled nodes are included.
+    """
+    seeds = dict(sources) if isinstance(sources, dict) else dict.fromkeys(sources, 0)
+
+    if isinstance(graph, CSRGraph):
+        dist, pred, settled = dijkstra_csr(
+            graph,
+            {graph.index_of(node): offset for node, offset in seeds.items()},
+            max_distance=max_distance,
+        )
+        origin = {}
+        for u in settled:  # predecessors are always settled first
+            origin[u] = u if pred[u] < 0 else origin[pred[u]]
+        label = graph.label_of
+        nodes = settled if max_distance is not None else range(graph.num_nodes)
+        distances = {label(u): dist[u] for u in nodes}
+        origins = {label(u): label(origin[u]) if u in origin else None for u in nodes}
+        return distances, origins
+
+    settled, predecessors = _dijkstra_dict(graph, seeds, max_distance=max_distance)
+    origins = {}
+    for node, previous in predecessors.items():  # in settling order
+        origins[node] = node if previous is None else origins[previous]
+    if max_distance is None:
+        settled = {node: settled.get(node, INF) for node in graph}
+        origins = {node: origins.get(node) for node in graph}
+    return settled, origins
 
 
 # -------------------------------
@@ -93,3 +387,18 @@ if __name__ == "__main__":
     }
     distances3 = dijkstra(graph3, 'X')
     print("Shortest distances from X:", distances3)
+
+    # -------------------------------
+    # Example 4: Point-to-point query with early exit
+    # -------------------------------
+    print("\nExample 4: Early exit at target T")
+    dist4, pred4 = dijkstra(graph2, 'S', target='T', return_predecessors=True)
+    print("Distance S -> T:", dist4['T'], "Path:", reconstruct_path(pred4, 'T'))
+
+    # -------------------------------
+    # Example 5: Bidirectional and multi-source queries
+    # -------------------------------
+    print("\nExample 5: Bidirectional S -> T:", bidirectional_dijkstra(graph2, 'S', 'T'))
+    depots, nearest = multi_source_dijkstra(graph2, ['S', 'T'])
+    print("Distance to nearest depot:", depots)
+    print("Nearest depot:", nearest)
@@ -0,0 +1,149 @@
+"""
+Unit tests for Dijkstra's algorithm.
+
+Tests cover:
+- Full single-source distances on dict and CSR graphs
+- Early termination at a target and within a radius
+- Predecessor maps and path reconstruction
+- Bidirectional single-pair and multi-source searches
+"""
+
+import random
+import unittest
+
+from dijkstra import (
+    bidirectional_dijkstra,
+    dijkstra,
+    multi_source_dijkstra,
+    reconstruct_path,
+    reverse_graph,
+)
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+GRAPH = {
+    "S": {"A": 7, "B": 2},
+    "A": {"S": 7, "B": 3, "C": 4},
+    "B": {"S": 2, "A": 3, "D": 6},
+    "C": {"A": 4, "D": 5, "E": 6},
+    "D": {"B": 6, "C": 5, "E": 1},
+    "E": {"C": 6, "D": 1, "T": 2},
+    "T": {"E": 2},
+}
+
+
+def random_graph(n, m, seed):
+    """Random directed graph as a dict-of-dicts with integer weights."""
+    rng = random.Random(seed)
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(1, 20)
+    return graph
+
+
+class TestDijkstra(unittest.TestCase):
+    """Test cases for the dijkstra function."""
+
+    def test_full_distances(self):
+        distances = dijkstra(GRAPH, "S")
+        self.assertEqual(
+            distances, {"S": 0, "A": 5, "B": 2, "C": 9, "D": 8, "E": 9, "T": 11}
+        )
+
+    def test_unreachable_nodes_are_inf(self):
+        graph = {"X": {"Y": 3}, "Y": {"X": 3}, "Z": {}}
+        self.assertEqual(dijkstra(graph, "X")["Z"], float("inf"))
+
+    def test_target_stops_early(self):
+        distances, predecessors = dijkstra(
+            GRAPH, "S", target="D", return_predecessors=True
+        )
+        self.assertEqual(distances["D"], 8)
+        self.assertNotIn("T", distances)  # farther than D, never settled
+        self.assertEqual(reconstruct_path(predecessors, "D"), ["S", "B", "D"])
+
+    def test_max_distance_radius(self):
+        distances = dijkstra(GRAPH, "S", max_distance=8)
+        self.assertEqual(distances, {"S": 0, "B": 2, "A": 5, "D": 8})
+
+    def test_reconstruct_path_unsettled(self):
+        _, predecessors = dijkstra(GRAPH, "S", target="B", return_predecessors=True)
+        self.assertIsNone(reconstruct_path(predecessors, "T"))
+
+    def test_matches_on_random_graphs(self):
+        for seed in range(5):
+            graph = random_graph(60, 300, seed)
+            csr = CSRGraph.from_adjacency(graph)
+            full = dijkstra(graph, 0)
+            self.assertEqual(dijkstra(csr, 0), full)
+            for target in (5, 17, 42):
+                distances, predecessors = dijkstra(
+                    csr, 0, target=target, return_predecessors=True
+                )
+                if full[target] == float("inf"):
+                    self.assertNotIn(target, distances)
+                    continue
+                self.assertEqual(distances[target], full[target])
+                path = reconstruct_path(predecessors, target)
+                length = sum(graph[u][v] for u, v in zip(path, path[1:]))
+                self.assertEqual(length, full[target])
+
+
+class TestBidirectionalDijkstra(unittest.TestCase):
+    """Test cases for bidirectional_dijkstra."""
+
+    def test_simple_pair(self):
+        self.assertEqual(
+            bidirectional_dijkstra(GRAPH, "S", "T"), (11, ["S", "B", "D", "E", "T"])
+        )
+        self.assertEqual(bidirectional_dijkstra(GRAPH, "A", "A"), (0, ["A"]))
+
+    def test_unreachable(self):
+        graph = {"X": {"Y": 1}, "Y": {}, "Z": {"X": 1}}
+        self.assertEqual(bidirectional_dijkstra(graph, "X", "Z"), (float("inf"), None))
+
+    def test_matches_dijkstra_on_random_graphs(self):
+        for seed in range(5):
+            graph = random_graph(80, 320, seed)
+            reverse = reverse_graph(graph)
+            csr = CSRGraph.from_adjacency(graph)
+            full = dijkstra(graph, 3)
+            for target in range(0, 80, 7):
+                distance, path = bidirectional_dijkstra(graph, 3, target, reverse)
+                self.assertEqual(distance, full[target])
+                self.assertEqual(bidirectional_dijkstra(csr, 3, target)[0], distance)
+                if path is not None:
+                    self.assertEqual((path[0], path[-1]), (3, target))
+                    length = sum(graph[u][v] for u, v in zip(path, path[1:]))
+                    self.assertEqual(length, distance)
+
+
+class TestMultiSourceDijkstra(unittest.TestCase):
+    """Test cases for multi_source_dijkstra."""
+
+    def test_nearest_source(self):
+        distances, origins = multi_source_dijkstra(GRAPH, ["S", "T"])
+        self.assertEqual(distances["C"], 8)
+        self.assertEqual(origins["C"], "T")
+        self.assertEqual(origins["A"], "S")
+
+    def test_offsets_and_csr(self):
+        graph = random_graph(50, 200, 11)
+        seeds = {0: 0, 10: 5, 20: 3}
+        expected = {
+            node: min(offset + dijkstra(graph, s)[node] for s, offset in seeds.items())
+            for node in graph
+        }
+        for g in (graph, CSRGraph.from_adjacency(graph)):
+            distances, origins = multi_source_dijkstra(g, seeds)
+            self.assertEqual(distances, expected)
+            for node, source in origins.items():
+                if source is not None:
+                    self.assertEqual(
+                        seeds[source] + dijkstra(graph, source)[node], expected[node]
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
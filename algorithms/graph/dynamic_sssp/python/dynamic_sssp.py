@@ -0,0 +1,214 @@
+"""
+Dynamic Single-Source Shortest Paths under Edge-Weight Updates
+
+Description:
+Keeps the shortest-path distances and tree from one source up to date while
+edge weights change, repairing only the part of the tree that an update can
+affect instead of rerunning Dijkstra from scratch (in the spirit of
+Ramalingam & Reps' dynamic SSSP and LPA*).
+
+A batch of changes is applied in three steps:
+
+1. Invalidate: an edge u -> v that got heavier (or was removed) only
+   matters if it is the tree edge into v. Then every node in v's subtree
+   may have lost its shortest path, so the subtree is cut off (distance
+   inf, no parent). All other distances are still lengths of existing
+   paths, i.e. valid upper bounds.
+2. Seed: every cut-off node takes its best offer over in-edges from nodes
+   outside the cut, and the head of every edge that got lighter takes the
+   offer over that edge if it improves on its distance.
+3. Repair: a Dijkstra-style propagation from the seeded nodes (using the
+   repo's IndexedMinHeap) fixes distances and parents and stops wherever
+   nothing improves any more.
+
+Nodes outside the cut subtrees and not improved by lighter edges are never
+touched, so small changes cost time proportional to the affected region.
+
+Time Complexity: O(A + E_A log A) per batch, where A is the number of
+                 affected nodes and E_A the edges incident to them
+                 (O((V + E) log V) in the worst case, like a full rerun)
+Space Complexity: O(V + E) for the graph copy, its reverse and the tree
+"""
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.heap.python.min_heap import IndexedMinHeap
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra, reconstruct_path
+
+INF = float("inf")
+
+
+class DynamicShortestPaths:
+    """Shortest-path distances and tree from one source, kept up to date."""
+
+    def __init__(self, graph, source, initial=None):
+        """
+        :param graph: dict-of-dicts {u: {v: weight}} with non-negative
+                      weights, or a CSRGraph. It is copied; later changes go
+                      through `update()`.
+        :param source: the source node
+        :param initial: optional result of
+                        dijkstra(graph, source, return_predecessors=True)
+                        to start from instead of running it again
+        """
+        if isinstance(graph, CSRGraph):
+            graph = graph.to_adjacency()
+        self.source = source
+        self.graph = {u: dict(neighbors) for u, neighbors in graph.items()}
+        self.reverse = {u: {} for u in self.graph}
+        for u, neighbors in self.graph.items():
+            for v, weight in neighbors.items():
+                self.graph.setdefault(v, {})
+                self.reverse.setdefault(v, {})[u] = weight
+
+        if initial is None:
+            initial = dijkstra(self.graph, source, return_predecessors=True)
+        distances, predecessors = initial
+        self.dist = {node: distances.get(node, INF) for node in self.graph}
+        self.parent = dict(predecessors)  # reachable nodes only
+        self.children = {node: set() for node in self.graph}
+        for node, parent in self.parent.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def distance(self, node):
+        """Current shortest distance from the source (inf if unreachable)."""
+        return self.dist.get(node, INF)
+
+    def path(self, target):
+        """Current shortest path to `target`, or None if unreachable."""
+        return reconstruct_path(self.parent, target)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def set_weight(self, u, v, weight):
+        """Change (or add) edge u -> v; shorthand for a one-edge update()."""
+        return self.update([(u, v, weight)])
+
+    def remove_edge(self, u, v):
+        """Delete edge u -> v; shorthand for a one-edge update()."""
+        return self.update([(u, v, None)])
+
+    def update(self, changes):
+        """
+        Apply a batch of edge changes and repair the shortest paths.
+
+        :param changes: iterable of (u, v, weight) setting the weight of edge
+                        u -> v (adding it if new), with weight None removing
+                        the edge
+        :return: dict {node: new distance} of the nodes whose distance changed
+        :raises ValueError: on a negative weight (nothing is applied)
+        """
+        changes = list(changes)
+        for _, _, weight in changes:
+            if weight is not None and weight < 0:
+                raise ValueError("Edge weights must be non-negative")
+
+        old_dist = {}
+        heavier, lighter = [], []
+        for u, v, weight in changes:
+            for node in (u, v):
+                if node not in self.graph:
+                    self.graph[node], self.reverse[node] = {}, {}
+                    self.children[node] = set()
+                    self.dist[node] = INF
+            previous = self.graph[u].get(v)
+            if weight is None:
+                self.graph[u].pop(v, None)
+                self.reverse[v].pop(u, None)
+                weight = INF
+            else:
+                self.graph[u][v] = weight
+                self.reverse[v][u] = weight
+            if previous is not None and weight > previous:
+                heavier.append((u, v))
+            elif previous is None or weight < previous:
+                lighter.append((u, v))
+
+        heap = IndexedMinHeap()
+        cut = self._invalidate(heavier, old_dist)
+        self._seed(cut, lighter, heap, old_dist)
+        self._repair(heap, old_dist)
+        return {
+            node: self.dist[node]
+            for node, before in old_dist.items()
+            if self.dist[node] != before
+        }
+
+    def _invalidate(self, heavier, old_dist):
+        """Cut off the subtrees hanging from tree edges that got heavier."""
+        cut = set()
+        for u, v in heavier:
+            if self.parent.get(v) != u or v in cut:
+                continue
+            self._set_parent(v, None)
+            del self.parent[v]
+            stack = [v]
+            while stack:
+                node = stack.pop()
+                cut.add(node)
+                old_dist.setdefault(node, self.dist[node])
+                self.dist[node] = INF
+                for child in self.children[node]:
+                    del self.parent[child]
+                    stack.append(child)
+                self.children[node] = set()
+        return cut
+
+    def _seed(self, cut, lighter, heap, old_dist):
+        """Queue the cut nodes' best outside offers and improved edge heads."""
+        dist = self.dist
+        for node in cut:
+            for p, weight in self.reverse[node].items():
+                if p not in cut:
+                    self._offer(p, node, dist[p] + weight, heap, old_dist)
+        for u, v in lighter:
+            if v in self.graph[u]:
+                self._offer(u, v, dist[u] + self.graph[u][v], heap, old_dist)
+
+    def _repair(self, heap, old_dist):
+        """Propagate improvements outwards in distance order."""
+        while heap:
+            node, distance = heap.extract_min()
+            for v, weight in self.graph[node].items():
+                self._offer(node, v, distance + weight, heap, old_dist)
+
+    def _offer(self, u, v, distance, heap, old_dist):
+        """Make u the parent of v if `distance` improves v's distance."""
+        if distance < self.dist[v]:
+            old_dist.setdefault(v, self.dist[v])
+            self.dist[v] = distance
+            self._set_parent(v, u)
+            heap.insert(v, distance)
+
+    def _set_parent(self, node, parent):
+        previous = self.parent.get(node)
+        if previous is not None:
+            self.children[previous].discard(node)
+        if parent is not None:
+            self.children[parent].add(node)
+        self.parent[node] = parent
+
+
+# Example runnable block
+if __name__ == "__main__":
+    roads = {
+        "A": {"B": 4, "C": 2},
+        "B": {"C": 5, "D": 10},
+        "C": {"E": 3},
+        "D": {"F": 11},
+        "E": {"D": 4},
+        "F": {},
+    }
+    sp = DynamicShortestPaths(roads, "A")
+    print("Initial:", sp.dist, "path to F:", sp.path("F"))
+
+    changed = sp.update([("C", "E", 9), ("B", "D", 3)])  # traffic jam + new lane
+    print("Changed:", changed)
+    print("Path to F:", sp.path("F"), "distance", sp.distance("F"))
+
+    sp.remove_edge("A", "B")
+    print("Without A -> B:", sp.dist)
@@ -0,0 +1,111 @@
+"""
+Unit tests for dynamic single-source shortest paths.
+
+Tests cover:
+- Random batches of increases, decreases, insertions and deletions matching
+  a fresh dijkstra() run after every batch
+- Consistency of the maintained shortest-path tree
+- Only affected nodes being reported / touched
+"""
+
+import random
+import unittest
+
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+from algorithms.graph.dynamic_sssp.python.dynamic_sssp import DynamicShortestPaths
+
+INF = float("inf")
+
+
+def random_graph(n, m, rng):
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(1, 20)
+    return graph
+
+
+def random_batch(graph, rng, size):
+    n = len(graph)
+    batch = []
+    edges = [(u, v) for u in graph for v in graph[u]]
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.6 and edges:
+            u, v = rng.choice(edges)
+            batch.append((u, v, rng.randint(0, 30)))
+        elif kind < 0.8 and edges:
+            u, v = rng.choice(edges)
+            batch.append((u, v, None))
+        else:
+            batch.append((rng.randrange(n), rng.randrange(n), rng.randint(0, 30)))
+    return [(u, v, w) for u, v, w in batch if u != v]
+
+
+def apply_batch(graph, batch):
+    for u, v, w in batch:
+        if w is None:
+            graph[u].pop(v, None)
+        else:
+            graph[u][v] = w
+
+
+class TestDynamicShortestPaths(unittest.TestCase):
+    """Test cases for DynamicShortestPaths."""
+
+    def assertConsistent(self, sp, graph, source):
+        expected = dijkstra(graph, source)
+        self.assertEqual(sp.dist, expected)
+        for node, distance in sp.dist.items():
+            parent = sp.parent.get(node)
+            if distance == INF:
+                self.assertNotIn(node, sp.parent)
+            elif node == source:
+                self.assertIsNone(parent)
+            else:
+                self.assertEqual(sp.dist[parent] + graph[parent][node], distance)
+                self.assertIn(node, sp.children[parent])
+
+    def test_random_batches(self):
+        rng = random.Random(11)
+        for _ in range(5):
+            graph = random_graph(60, 200, rng)
+            sp = DynamicShortestPaths(graph, 0)
+            for _ in range(15):
+                batch = random_batch(graph, rng, rng.randint(1, 6))
+                before = dict(sp.dist)
+                changed = sp.update(batch)
+                apply_batch(graph, batch)
+                self.assertConsistent(sp, graph, 0)
+                self.assertEqual(
+                    changed, {v: d for v, d in sp.dist.items() if before[v] != d}
+                )
+
+    def test_seeded_from_dijkstra(self):
+        graph = {"a": {"b": 1}, "b": {"c": 1}, "c": {}}
+        initial = dijkstra(graph, "a", return_predecessors=True)
+        sp = DynamicShortestPaths(graph, "a", initial=initial)
+        self.assertEqual(sp.path("c"), ["a", "b", "c"])
+        self.assertEqual(sp.set_weight("a", "c", 1), {"c": 1})
+        self.assertEqual(sp.path("c"), ["a", "c"])
+
+    def test_local_repair(self):
+        # Two independent branches: changing one must not touch the other
+        graph = {"s": {"a": 1, "x": 1}, "a": {"b": 1}, "b": {}, "x": {"y": 1}, "y": {}}
+        sp = DynamicShortestPaths(graph, "s")
+        self.assertEqual(sp.set_weight("s", "a", 5), {"a": 5, "b": 6})
+        self.assertEqual(sp.remove_edge("x", "y"), {"y": INF})
+        self.assertIsNone(sp.path("y"))
+        self.assertEqual(sp.set_weight("b", "y", 0), {"y": 6})
+
+    def test_new_nodes_and_negative_weights(self):
+        sp = DynamicShortestPaths({"s": {}}, "s")
+        self.assertEqual(sp.set_weight("s", "n", 2), {"n": 2})
+        with self.assertRaises(ValueError):
+            sp.set_weight("s", "n", -1)
+        self.assertEqual(sp.distance("n"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,14 +7,149 @@ path reconstruction information.
 
 Time Complexity: O(V^3) where V is the number of vertices.
 Space Complexity: O(V^2) for the distance and next (path reconstruction) matrices.
+
+Backends (selected with `floyd_warshall(..., backend=...)`):
+- "python":  the reference triple loop over lists of lists (default).
+- "numpy":   each k step is one broadcasted `minimum` over the whole matrix,
+             with `next_node` updated through the same improvement mask.
+- "blocked": cache-blocked (tiled) variant: the matrix is split into
+             block_size x block_size tiles and every k-block is processed in
+             three phases (diagonal tile, its row/column tiles, all other
+             tiles) as min-plus tile products, so the working set stays in
+             cache for matrices that do not fit in L2.
+- "parallel": the blocked algorithm with the matrices allocated directly in
+             shared memory (or in the `out_dir` files); within each k-block the
+             row/column tiles and then the remaining block rows are handed to
+             a process pool (tiles written in a phase are disjoint, so workers
+             never race). Intended for 5k-20k vertex tables.
+- "auto":    "numpy" if NumPy is installed, otherwise "python".
+The NumPy backends return ndarrays: float64 distances and int32 successors
+using -1 (instead of None) for "no path".
+
+On-disk results:
+Passing `out_dir=` to a NumPy backend computes into `numpy.memmap` files and
+stores the result with compact dtypes (float32 distances by default, int16
+successors when V < 32768, else int32) next to a small JSON header. The DP
+itself always runs on float64 distances (a scratch file in `out_dir`, cast
+row by row into the compact file at the end), so results and tie-breaking
+match the in-memory backends rather than accumulating float32 rounding. `load_all_pairs()`
+reopens them read-only, so any number of worker processes can serve
+`reconstruct_path` lookups from the same page cache, touching only the rows
+a path actually walks. `save_all_pairs()` writes existing results (including
+the Python backend's lists) in the same format.
 """
 
+import json
+import os
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
 from typing import List, Tuple, Optional
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python backend always works.
+    np = None
+
 INF = float("inf")
+BACKENDS = ("python", "numpy", "blocked", "parallel", "auto")
 
+# File names used inside an `out_dir`
+META_FILE = "meta.json"
+DIST_FILE = "dist.bin"
+NEXT_FILE = "next.bin"
+SCRATCH_FILE = "dist.f64.tmp"
 
-def floyd_warshall(adj_matrix: List[List[Optional[float]]]) -> Tuple[List[List[float]], List[List[Optional[int]]]]:
+
+def floyd_warshall(
+    adj_matrix,
+    backend: str = "python",
+    block_size: int = 64,
+    processes: Optional[int] = None,
+    out_dir: Optional[str] = None,
+    dist_dtype: str = "float32",
+):
+    """
+    Compute all-pairs shortest paths, dispatching to the selected backend.
+
+    Args:
+        adj_matrix: V x V adjacency matrix (list of lists or ndarray). Use a
+                    numeric weight for edges and None or float('inf') for
+                    missing edges.
+        backend: one of "python", "numpy", "blocked", "parallel" or "auto"
+                 (see module doc).
+        block_size: tile size used by the "blocked" and "parallel" backends.
+        processes: worker count for the "parallel" backend (default: all CPUs).
+        out_dir: if given, compute into memory-mapped files in this directory
+                 (NumPy backends only) and return the memmaps.
+        dist_dtype: distance dtype used to store `out_dir` results; the
+                    computation itself is done in float64.
+
+    Returns:
+        (dist, next_node) as described in `_floyd_warshall_python`; NumPy
+        backends return ndarrays with -1 marking a missing successor.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+    if backend == "auto":
+        backend = "python" if np is None else "numpy"
+    if backend == "python":
+        if out_dir is not None:
+            raise ValueError("out_dir requires a NumPy backend")
+        return _floyd_warshall_python(adj_matrix)
+    if np is None:
+        raise ImportError(f"The {backend!r} backend requires NumPy")
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    return _floyd_warshall_ndarray(
+        adj_matrix, backend, block_size, processes, out_dir, dist_dtype
+    )
+
+
+def _floyd_warshall_ndarray(adj_matrix, backend, block_size, processes, out_dir, dist_dtype):
+    """
+    Run a NumPy backend, computing into `out_dir` memmaps when given. Every
+    backend falls through to the single exit below, so memmap results are
+    always flushed to disk before they are returned.
+
+    With `out_dir`, distances are relaxed in a float64 scratch memmap and
+    only cast to `dist_dtype` once the DP has finished: relaxing in float32
+    would round every partial sum and could pick different successors on
+    near-ties than the in-memory backends.
+    """
+    V = len(adj_matrix)
+    out = buffers = scratch_path = None
+    if out_dir is not None:
+        result = _create_all_pairs_files(out_dir, V, dist_dtype)
+        out = result
+        if result[0].dtype != np.float64:
+            scratch_path = os.path.join(out_dir, SCRATCH_FILE)
+            scratch = np.memmap(scratch_path, dtype=np.float64, mode="w+", shape=(V, V))
+            out = (scratch, result[1])
+        buffers = (out[0].filename, out[1].filename)
+    elif backend == "parallel":
+        # Allocated once in shared memory: the workers update these very pages
+        buffers = (RawArray("b", max(8 * V * V, 1)), RawArray("b", max(4 * V * V, 1)))
+        out = (_shared_matrix(buffers[0], V, "f8"), _shared_matrix(buffers[1], V, "i4"))
+    dist, next_node = _to_numpy(adj_matrix, out)
+    if backend == "numpy":
+        _floyd_warshall_numpy(dist, next_node)
+    elif backend == "blocked":
+        _floyd_warshall_blocked(dist, next_node, block_size)
+    else:
+        _floyd_warshall_parallel(dist, next_node, block_size, processes, buffers)
+    if scratch_path is not None:
+        for i in range(V):
+            result[0][i] = dist[i]
+        del dist
+        os.remove(scratch_path)
+        dist = result[0]
+    if out_dir is not None:
+        dist.flush()
+        next_node.flush()
+    return dist, next_node
+
+
+def _floyd_warshall_python(adj_matrix: List[List[Optional[float]]]) -> Tuple[List[List[float]], List[List[Optional[int]]]]:
     """
     Compute all-pairs shortest paths using the Floyd–Warshall dynamic programming approach.
 
@@ -81,6 +216,192 @@ def floyd_warshall(adj_matrix: List[List[Optional[float]]]) -> Tuple[List[List[f
     return dist, next_node
 
 
+def _to_numpy(adj_matrix, out=None):
+    """
+    Fill `dist` and `next_node` matrices from the input, one row at a time so
+    no full-size float64 temporary is needed. Allocates float64 / int32
+    arrays unless `out=(dist, next_node)` provides them (e.g. memmaps).
+    """
+    V = len(adj_matrix)
+    if out is None:
+        dist = np.empty((V, V), dtype=np.float64)
+        next_node = np.empty((V, V), dtype=np.int32)
+    else:
+        dist, next_node = out
+    columns = np.arange(V)
+    for i, row in enumerate(adj_matrix):
+        if not isinstance(row, np.ndarray):
+            row = [INF if w is None else w for w in row]
+        dist[i] = row
+        # next_node[i][j] = j for every direct edge, -1 where there is none
+        next_node[i] = np.where(dist[i] < INF, columns, -1)
+    np.fill_diagonal(dist, 0.0)
+    np.fill_diagonal(next_node, -1)
+    return dist, next_node
+
+
+def _create_all_pairs_files(out_dir, V, dist_dtype):
+    """Write the JSON header and create writable memmaps for a V x V result."""
+    os.makedirs(out_dir, exist_ok=True)
+    next_dtype = np.int16 if V <= np.iinfo(np.int16).max else np.int32
+    meta = {
+        "vertices": V,
+        "dist_dtype": np.dtype(dist_dtype).name,
+        "next_dtype": np.dtype(next_dtype).name,
+    }
+    with open(os.path.join(out_dir, META_FILE), "w") as f:
+        json.dump(meta, f)
+    return _open_all_pairs_files(out_dir, meta, "w+")
+
+
+def _open_all_pairs_files(out_dir, meta, mode):
+    shape = (meta["vertices"], meta["vertices"])
+    dist = np.memmap(
+        os.path.join(out_dir, DIST_FILE), dtype=meta["dist_dtype"], mode=mode, shape=shape
+    )
+    next_node = np.memmap(
+        os.path.join(out_dir, NEXT_FILE), dtype=meta["next_dtype"], mode=mode, shape=shape
+    )
+    return dist, next_node
+
+
+def save_all_pairs(dist, next_node, out_dir: str, dist_dtype: str = "float32"):
+    """
+    Write an existing (dist, next_node) result into `out_dir` as raw binary
+    files with compact dtypes. Accepts the Python backend's nested lists
+    (None successors are stored as -1) or ndarrays.
+    """
+    if np is None:
+        raise ImportError("save_all_pairs requires NumPy")
+    V = len(dist)
+    dist_out, next_out = _create_all_pairs_files(out_dir, V, dist_dtype)
+    for i in range(V):
+        dist_out[i] = dist[i]
+        next_out[i] = [-1 if j is None else j for j in next_node[i]]
+    dist_out.flush()
+    next_out.flush()
+    return dist_out, next_out
+
+
+def load_all_pairs(out_dir: str, mode: str = "r"):
+    """
+    Memory-map a result written with `out_dir=` or `save_all_pairs()`.
+    Nothing is read until rows are accessed; with mode "r" the pages are
+    shared between every process that opens the same directory.
+    """
+    if np is None:
+        raise ImportError("load_all_pairs requires NumPy")
+    with open(os.path.join(out_dir, META_FILE)) as f:
+        meta = json.load(f)
+    return _open_all_pairs_files(out_dir, meta, mode)
+
+
+def _floyd_warshall_numpy(dist, next_node):
+    """
+    In-place Floyd–Warshall where each k step is a broadcasted update:
+    dist = minimum(dist, dist[:, k] + dist[k, :]). Row and column k do not
+    change during step k (no negative cycles), so updating in place is safe.
+    """
+    for k in range(dist.shape[0]):
+        via_k = dist[:, k, None] + dist[None, k, :]
+        improved = via_k < dist
+        np.copyto(dist, via_k, where=improved)
+        # Improved pairs (i, j) now go through k first: next[i][j] = next[i][k]
+        np.copyto(next_node, next_node[:, k, None], where=improved)
+
+
+def _min_plus_update(C, next_C, A, next_A, B):
+    """
+    C = min(C, A (min,+) B) for tiles, one intermediate column m of A at a
+    time so every temporary stays tile-sized. The successor of an improved
+    entry (i, j) becomes next_A[i, m]. A or B may alias C: like the plain
+    k-loop, reading already-improved values only ever yields real paths.
+    """
+    for m in range(A.shape[1]):
+        candidate = A[:, m, None] + B[None, m, :]
+        improved = candidate < C
+        np.copyto(C, candidate, where=improved)
+        np.copyto(next_C, next_A[:, m, None], where=improved)
+
+
+def _floyd_warshall_blocked(dist, next_node, block_size):
+    """
+    In-place tiled Floyd–Warshall. For each diagonal block K:
+      1. close the diagonal tile (K, K) with the plain k-loop;
+      2. update the tiles in block row K and block column K through (K, K);
+      3. update every remaining tile (I, J) with tile (I, K) x tile (K, J).
+    Once (K, K) is closed (zero diagonal), phases 2 and 3 are single min-plus
+    products per tile.
+    """
+    V = dist.shape[0]
+    blocks = [slice(start, min(start + block_size, V)) for start in range(0, V, block_size)]
+    for kb in blocks:
+        _floyd_warshall_numpy(dist[kb, kb], next_node[kb, kb])
+        others = [b for b in blocks if b != kb]
+        for jb in others:
+            _min_plus_update(dist[kb, jb], next_node[kb, jb], dist[kb, kb], next_node[kb, kb], dist[kb, jb])
+            _min_plus_update(dist[jb, kb], next_node[jb, kb], dist[jb, kb], next_node[jb, kb], dist[kb, kb])
+        for ib in others:
+            for jb in others:
+                _min_plus_update(dist[ib, jb], next_node[ib, jb], dist[ib, kb], next_node[ib, kb], dist[kb, jb])
+
+
+# Shared-memory views attached once per worker process by _attach_shared
+_SHARED = {}
+
+
+def _shared_matrix(buffer, V, dtype):
+    """V x V view of a shared RawArray, or of a memmap file given its path."""
+    if isinstance(buffer, str):
+        return np.memmap(buffer, dtype=dtype, mode="r+", shape=(V, V))
+    return np.frombuffer(buffer, dtype=dtype, count=V * V).reshape(V, V)
+
+
+def _attach_shared(dist_buffer, next_buffer, V, dist_dtype, next_dtype):
+    """Pool initializer: map the shared dist / next_node matrices."""
+    _SHARED["dist"] = _shared_matrix(dist_buffer, V, dist_dtype)
+    _SHARED["next"] = _shared_matrix(next_buffer, V, next_dtype)
+
+
+def _row_col_task(args):
+    """Phase 2: update tile (K, J) and tile (J, K) through the closed (K, K)."""
+    kb, jb = (slice(*bounds) for bounds in args)
+    dist, next_node = _SHARED["dist"], _SHARED["next"]
+    _min_plus_update(dist[kb, jb], next_node[kb, jb], dist[kb, kb], next_node[kb, kb], dist[kb, jb])
+    _min_plus_update(dist[jb, kb], next_node[jb, kb], dist[jb, kb], next_node[jb, kb], dist[kb, kb])
+
+
+def _block_row_task(args):
+    """Phase 3: update every tile (I, J), J != K, of block row I."""
+    k_bounds, i_bounds, other_bounds = args
+    kb, ib = slice(*k_bounds), slice(*i_bounds)
+    dist, next_node = _SHARED["dist"], _SHARED["next"]
+    for jb in (slice(*bounds) for bounds in other_bounds):
+        _min_plus_update(dist[ib, jb], next_node[ib, jb], dist[ib, kb], next_node[ib, kb], dist[kb, jb])
+
+
+def _floyd_warshall_parallel(dist, next_node, block_size, processes, buffers):
+    """
+    Blocked Floyd–Warshall with phases 2 and 3 of every k-block spread over a
+    process pool. `dist` and `next_node` already live in the shared `buffers`
+    (RawArrays or memmap file paths), so workers update the tiles in place and
+    only tile coordinates travel through the pool.
+    """
+    V = dist.shape[0]
+    bounds = [(start, min(start + block_size, V)) for start in range(0, V, block_size)]
+    if not bounds:
+        return
+    init_args = (*buffers, V, dist.dtype.str, next_node.dtype.str)
+    with Pool(processes, _attach_shared, init_args) as pool:
+        for k_bounds in bounds:
+            kb = slice(*k_bounds)
+            # Phase 1 is a single small tile: close it in this process
+            _floyd_warshall_numpy(dist[kb, kb], next_node[kb, kb])
+            others = [b for b in bounds if b != k_bounds]
+            pool.map(_row_col_task, [(k_bounds, b) for b in others])
+            pool.map(_block_row_task, [(k_bounds, b, others) for b in others])
+
+
 def reconstruct_path(u: int, v: int, next_node: List[List[Optional[int]]]) -> List[int]:
     """
     Reconstruct the shortest path from u to v using the `next_node` matrix returned by floyd_warshall.
@@ -89,22 +410,24 @@ def reconstruct_path(u: int, v: int, next_node: List[List[Optional[int]]]) -> Li
         u: source vertex index
         v: target vertex index
         next_node: the next matrix (V x V) where next_node[a][b] is the vertex after a on the path to b
+                   (nested lists, an ndarray, or a memmap from `load_all_pairs`)
 
     Returns:
         A list of vertex indices representing the path from u to v (inclusive).
         Returns an empty list if no path exists.
     """
-    if next_node[u][v] is None:
-        return []  # no path
+    if next_node[u][v] is None or next_node[u][v] < 0:
+        return []  # no path (None from the Python backend, -1 from NumPy)
 
     path = [u]
     current = u
     # Walk using next pointers until we reach v
     while current != v:
-        current = next_node[current][v]
-        if current is None:
+        current = next_node[current][v]  # reads one entry (lazy on memmaps)
+        if current is None or current < 0:
             # path broken (shouldn't happen if next_node is consistent), return empty
             return []
+        current = int(current)
         path.append(current)
     return path
 
@@ -135,6 +458,9 @@ if __name__ == "__main__":
     ]
 
     dist_matrix, next_matrix = floyd_warshall(graph)
+    if np is not None:
+        dist_blocked, _ = floyd_warshall(graph, backend="blocked", block_size=2)
+        print("Blocked NumPy backend agrees:", np.array_equal(dist_blocked, dist_matrix))
 
     V = len(graph)
     print("All-pairs shortest distances (INF means no path):")
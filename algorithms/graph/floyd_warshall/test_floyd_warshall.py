@@ -0,0 +1,179 @@
+"""
+Unit tests for the Floyd–Warshall backends.
+
+Tests cover:
+- The reference Python backend on a graph with negative edges
+- NumPy, blocked and parallel (shared memory) backends matching the Python
+  backend
+- Path reconstruction from every backend's successor matrix
+- Memory-mapped on-disk results, computed in float64 before being stored
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from floyd_warshall import (
+    INF,
+    floyd_warshall,
+    load_all_pairs,
+    np,
+    reconstruct_path,
+    save_all_pairs,
+)
+
+GRAPH = [
+    [0, 3, 8, None, -4],
+    [None, 0, None, 1, 7],
+    [None, 4, 0, None, None],
+    [2, None, -5, 0, None],
+    [None, None, None, 6, 0],
+]
+
+
+def random_matrix(n, density, seed):
+    """
+    Random adjacency matrix with negative edges but no negative cycle:
+    weights are w + p[i] - p[j] for w >= 0 and random potentials p.
+    """
+    rng = random.Random(seed)
+    potential = [rng.randint(0, 20) for _ in range(n)]
+    matrix = [[None] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = 0
+        for j in range(n):
+            if i != j and rng.random() < density:
+                matrix[i][j] = rng.randint(0, 30) + potential[i] - potential[j]
+    return matrix
+
+
+def path_length(matrix, path):
+    return sum(matrix[a][b] for a, b in zip(path, path[1:]))
+
+
+class TestFloydWarshallPython(unittest.TestCase):
+    """Test cases for the default pure Python backend."""
+
+    def test_distances(self):
+        dist, _ = floyd_warshall(GRAPH)
+        self.assertEqual(dist[0], [0, 1, -3, 2, -4])
+        self.assertEqual(dist[4], [8, 5, 1, 6, 0])
+
+    def test_paths(self):
+        _, next_node = floyd_warshall(GRAPH)
+        self.assertEqual(reconstruct_path(0, 2, next_node), [0, 4, 3, 2])
+        self.assertEqual(reconstruct_path(1, 1, next_node), [])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            floyd_warshall(GRAPH, backend="gpu")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestFloydWarshallNumPy(unittest.TestCase):
+    """NumPy backends must agree with the Python backend."""
+
+    def check_backend(self, backend, **kwargs):
+        for seed, n in enumerate([1, 7, 30, 45]):
+            matrix = random_matrix(n, 0.15, seed)
+            expected, _ = floyd_warshall(matrix)
+            dist, next_node = floyd_warshall(matrix, backend=backend, **kwargs)
+            self.assertEqual(dist.tolist(), expected)
+            for i in range(n):
+                for j in range(n):
+                    path = reconstruct_path(i, j, next_node)
+                    if i == j or expected[i][j] == INF:
+                        self.assertEqual(path, [])
+                    else:
+                        self.assertEqual(path_length(matrix, path), expected[i][j])
+
+    def test_numpy_backend(self):
+        self.check_backend("numpy")
+
+    def test_blocked_backend(self):
+        self.check_backend("blocked", block_size=8)
+        self.check_backend("blocked", block_size=64)
+
+    def test_parallel_backend(self):
+        self.check_backend("parallel", block_size=8, processes=2)
+
+    def test_auto_backend_accepts_ndarray(self):
+        matrix = np.array(
+            [[INF if w is None else w for w in row] for row in GRAPH], dtype=float
+        )
+        dist, _ = floyd_warshall(matrix, backend="auto")
+        self.assertEqual(dist[0].tolist(), [0, 1, -3, 2, -4])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestFloydWarshallOnDisk(unittest.TestCase):
+    """Results written to memmap files and read back lazily."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.matrix = random_matrix(25, 0.2, 3)
+        self.expected, _ = floyd_warshall(self.matrix)
+
+    def check_loaded(self):
+        dist, next_node = load_all_pairs(self.tmp.name)
+        self.assertEqual(dist.dtype, np.float32)
+        self.assertEqual(next_node.dtype, np.int16)
+        self.assertEqual(dist.tolist(), self.expected)
+        for i in range(25):
+            for j in range(25):
+                path = reconstruct_path(i, j, next_node)
+                if path:
+                    self.assertEqual(
+                        path_length(self.matrix, path), self.expected[i][j]
+                    )
+
+    def test_compute_into_out_dir(self):
+        for backend in ("numpy", "blocked", "parallel"):
+            dist, _ = floyd_warshall(
+                self.matrix,
+                backend=backend,
+                block_size=8,
+                processes=2,
+                out_dir=self.tmp.name,
+            )
+            self.assertIsInstance(dist, np.memmap)
+            self.check_loaded()
+
+    def test_out_dir_matches_in_memory_on_fractional_weights(self):
+        # Near-tied sums around 1e5 differ only below float32 resolution
+        rng = random.Random(5)
+        n = 40
+        matrix = [[None] * n for _ in range(n)]
+        for i in range(n):
+            matrix[i][i] = 0
+            for j in range(n):
+                if i != j and rng.random() < 0.3:
+                    matrix[i][j] = rng.uniform(1e5, 1e5 + 1)
+        dist, next_node = floyd_warshall(matrix, backend="numpy")
+        for backend in ("numpy", "blocked", "parallel"):
+            disk_dist, disk_next = floyd_warshall(
+                matrix,
+                backend=backend,
+                block_size=8,
+                processes=2,
+                out_dir=self.tmp.name,
+            )
+            self.assertTrue((disk_dist == dist.astype(np.float32)).all())
+            self.assertTrue((disk_next == next_node).all())
+            self.assertEqual(
+                sorted(os.listdir(self.tmp.name)), ["dist.bin", "meta.json", "next.bin"]
+            )
+
+    def test_save_python_results(self):
+        save_all_pairs(*floyd_warshall(self.matrix), self.tmp.name)
+        self.check_loaded()
+
+    def test_python_backend_rejects_out_dir(self):
+        with self.assertRaises(ValueError):
+            floyd_warshall(self.matrix, out_dir=self.tmp.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,376 @@
+"""
+Grid Pathfinding: A* and Jump Point Search on Occupancy Grids
+
+Description:
+Pathfinding on 4- or 8-connected occupancy grids without converting them to
+dict-of-dicts graphs. An `OccupancyGrid` stores one byte per cell in a flat
+`bytearray` (0 = free, 1 = blocked) surrounded by a one-cell blocked border,
+so every cell is a flat integer id, neighbors are id +/- 1 and id +/- width,
+and no bounds checks are needed while searching.
+
+Movement rules:
+- 4-connected: up/down/left/right, cost 1.
+- 8-connected: also diagonals, cost sqrt(2), but never cutting a corner
+  (a diagonal step needs both orthogonal cells it passes to be free).
+
+`grid_a_star` is plain A* over cells with the Manhattan (4-connected) or
+octile (8-connected) distance as a consistent heuristic, so a closed set is
+used and ties on f prefer the higher g, as in `a_star`.
+
+`jump_point_search` (Harabor & Grastien) returns the same optimal path
+length, but instead of pushing every neighbor it "jumps" along straight and
+diagonal lines until it reaches a cell where an obstacle forces a new
+branch (a jump point). Only jump points enter the open set, which prunes
+most expansions on open maps. The jumps are loops, not recursion.
+
+Both return the `a_star` result format: a list of (row, col) cells from
+start to goal, or None if no path exists.
+
+Time Complexity: O(N log N) for N free cells (JPS is usually far below that)
+Space Complexity: O(N) bytes for the grid plus the search state
+"""
+
+import heapq
+import math
+from array import array
+
+SQRT2 = math.sqrt(2)
+INF = float("inf")
+
+
+class OccupancyGrid:
+    """rows x cols grid of free/blocked cells addressed by flat ids."""
+
+    def __init__(self, rows, cols, blocked=()):
+        """
+        :param rows: number of rows
+        :param cols: number of columns
+        :param blocked: iterable of (row, col) cells that start blocked
+        """
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.cells = bytearray([1]) * ((rows + 2) * self.width)
+        for r in range(rows):
+            first = (r + 1) * self.width + 1
+            last = first + cols
+            self.cells[first:last] = bytes(cols)
+        for r, c in blocked:
+            self.cells[self.id(r, c)] = 1
+
+    @classmethod
+    def from_rows(cls, rows, blocked_chars="#"):
+        """
+        Build a grid from a sequence of rows: strings (any character in
+        `blocked_chars` is blocked) or sequences of values (truthy = blocked).
+        """
+        rows = list(rows)
+        grid = cls(len(rows), len(rows[0]) if rows else 0)
+        for r, row in enumerate(rows):
+            if len(row) != grid.cols:
+                raise ValueError("All rows must have the same length")
+            for c, value in enumerate(row):
+                if (value in blocked_chars) if isinstance(row, str) else value:
+                    grid.cells[grid.id(r, c)] = 1
+        return grid
+
+    @classmethod
+    def from_numpy(cls, occupancy):
+        """Build a grid from a 2D NumPy array (non-zero = blocked)."""
+        rows, cols = occupancy.shape
+        grid = cls(rows, cols)
+        flags = (occupancy != 0).astype("uint8")
+        for r in range(rows):
+            first = (r + 1) * grid.width + 1
+            last = first + cols
+            grid.cells[first:last] = flags[r].tobytes()
+        return grid
+
+    def id(self, row, col):
+        """Flat id of cell (row, col)."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"Cell {(row, col)} is outside the grid")
+        return (row + 1) * self.width + col + 1
+
+    def coords(self, node):
+        """(row, col) of a flat id."""
+        r, c = divmod(node, self.width)
+        return r - 1, c - 1
+
+    def is_free(self, row, col):
+        return not self.cells[self.id(row, col)]
+
+    def set_blocked(self, row, col, blocked=True):
+        self.cells[self.id(row, col)] = 1 if blocked else 0
+
+    def neighbors(self, node, diagonal=True):
+        """Yield (neighbor id, step cost) for every legal move from `node`."""
+        cells, w = self.cells, self.width
+        for d in (-w, w, -1, 1):
+            if not cells[node + d]:
+                yield node + d, 1
+        if diagonal:
+            for dv in (-w, w):
+                for dh in (-1, 1):
+                    if not (
+                        cells[node + dv] or cells[node + dh] or cells[node + dv + dh]
+                    ):
+                        yield node + dv + dh, SQRT2
+
+    def __str__(self):
+        return "\n".join(
+            "".join("#" if self.cells[self.id(r, c)] else "." for c in range(self.cols))
+            for r in range(self.rows)
+        )
+
+
+def grid_a_star(grid, start, goal, diagonal=True):
+    """
+    A* over the cells of an OccupancyGrid.
+
+    :param grid: OccupancyGrid
+    :param start: (row, col) start cell
+    :param goal: (row, col) goal cell
+    :param diagonal: True for 8-connected moves, False for 4-connected
+    :return: list of (row, col) cells, or None if no path exists
+    """
+    source, target = grid.id(*start), grid.id(*goal)
+    cells = grid.cells
+    if cells[source] or cells[target]:
+        return None
+
+    heuristic = _heuristic(grid, target, diagonal)
+    g_score = array("d", [INF]) * len(cells)
+    came_from = array("i", [-1]) * len(cells)
+    closed = bytearray(len(cells))
+    g_score[source] = 0
+    open_set = [(heuristic(source), 0, source)]
+
+    while open_set:
+        _, neg_g, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue
+        if current == target:
+            path = [current]
+            while came_from[current] != -1:
+                current = came_from[current]
+                path.append(current)
+            return [grid.coords(node) for node in reversed(path)]
+        closed[current] = 1
+
+        for neighbor, cost in grid.neighbors(current, diagonal):
+            tentative_g = -neg_g + cost
+            if not closed[neighbor] and tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                came_from[neighbor] = current
+                f = tentative_g + heuristic(neighbor)
+                heapq.heappush(open_set, (f, -tentative_g, neighbor))
+
+    return None
+
+
+def jump_point_search(grid, start, goal, diagonal=True):
+    """
+    Jump Point Search over an OccupancyGrid.
+
+    Same parameters and result as `grid_a_star`; the returned path lists
+    every cell, not only the jump points.
+    """
+    source, target = grid.id(*start), grid.id(*goal)
+    cells = grid.cells
+    if cells[source] or cells[target]:
+        return None
+
+    jumper = _Jumper(cells, grid.width, target)
+    jump = jumper.jump if diagonal else jumper.jump4
+    heuristic = _heuristic(grid, target, diagonal)
+    g_score = {source: 0}
+    came_from = {source: -1}
+    closed = set()
+    open_set = [(heuristic(source), 0, source)]
+
+    while open_set:
+        _, neg_g, current = heapq.heappop(open_set)
+        if current in closed:
+            continue
+        if current == target:
+            return _expand_path(grid, came_from, current)
+        closed.add(current)
+
+        parent = came_from[current]
+        for dr, dc in _directions(grid, parent, current, diagonal):
+            node = jump(current, dr, dc)
+            if node < 0 or node in closed:
+                continue
+            tentative_g = -neg_g + _distance(grid, current, node)
+            if tentative_g < g_score.get(node, INF):
+                g_score[node] = tentative_g
+                came_from[node] = current
+                heapq.heappush(
+                    open_set, (tentative_g + heuristic(node), -tentative_g, node)
+                )
+
+    return None
+
+
+class _Jumper:
+    """Straight and diagonal jumps over a padded grid's cells."""
+
+    def __init__(self, cells, width, goal):
+        self.cells = cells
+        self.width = width
+        self.goal = goal
+
+    def straight(self, node, d, side):
+        """
+        Step by `d` until blocked (-1), the goal, or a cell with a forced
+        neighbor: a perpendicular (`side`) cell that is free while the cell
+        behind it is blocked, so it can only be reached through this cell.
+        """
+        cells, goal = self.cells, self.goal
+        while True:
+            node += d
+            if cells[node]:
+                return -1
+            if node == goal:
+                return node
+            if (not cells[node + side] and cells[node - d + side]) or (
+                not cells[node - side] and cells[node - d - side]
+            ):
+                return node
+
+    def jump(self, node, dr, dc):
+        """8-connected jump from `node` in direction (dr, dc)."""
+        w = self.width
+        if dr == 0:
+            return self.straight(node, dc, w)
+        if dc == 0:
+            return self.straight(node, dr * w, 1)
+
+        cells, goal = self.cells, self.goal
+        dv, dh = dr * w, dc
+        while True:
+            if cells[node + dv] or cells[node + dh]:
+                return -1  # diagonal step would cut a corner
+            node += dv + dh
+            if cells[node]:
+                return -1
+            if node == goal:
+                return node
+            # A jump point if a straight jump from here finds one
+            if self.straight(node, dh, w) >= 0 or self.straight(node, dv, 1) >= 0:
+                return node
+
+    def jump4(self, node, dr, dc):
+        """4-connected jump; vertical moves also probe horizontally."""
+        w = self.width
+        if dr == 0:
+            return self.straight(node, dc, w)
+
+        cells, goal = self.cells, self.goal
+        d = dr * w
+        while True:
+            node += d
+            if cells[node]:
+                return -1
+            if node == goal:
+                return node
+            if (not cells[node + 1] and cells[node - d + 1]) or (
+                not cells[node - 1] and cells[node - d - 1]
+            ):
+                return node
+            if self.straight(node, 1, w) >= 0 or self.straight(node, -1, w) >= 0:
+                return node
+
+
+ALL_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _directions(grid, parent, node, diagonal):
+    """Pruned set of directions to jump in, given the direction of arrival."""
+    if parent < 0:
+        return ALL_DIRECTIONS if diagonal else ALL_DIRECTIONS[:4]
+    pr, pc = grid.coords(parent)
+    r, c = grid.coords(node)
+    dr = (r > pr) - (r < pr)
+    dc = (c > pc) - (c < pc)
+    if not diagonal:
+        if dr == 0:
+            return ((0, dc), (-1, 0), (1, 0))
+        return ((dr, 0), (0, -1), (0, 1))
+    if dr and dc:
+        return ((dr, 0), (0, dc), (dr, dc))
+    if dr == 0:
+        return ((0, dc), (-1, dc), (1, dc), (-1, 0), (1, 0))
+    return ((dr, 0), (dr, -1), (dr, 1), (0, -1), (0, 1))
+
+
+def _heuristic(grid, target, diagonal):
+    """Manhattan (4-connected) or octile (8-connected) distance to target."""
+    tr, tc = grid.coords(target)
+    width = grid.width
+
+    def manhattan(node):
+        r, c = divmod(node, width)
+        return abs(r - 1 - tr) + abs(c - 1 - tc)
+
+    def octile(node):
+        r, c = divmod(node, width)
+        dr, dc = abs(r - 1 - tr), abs(c - 1 - tc)
+        return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+
+    return octile if diagonal else manhattan
+
+
+def _distance(grid, a, b):
+    """Exact cost of the straight or diagonal segment between two cells."""
+    ar, ac = grid.coords(a)
+    br, bc = grid.coords(b)
+    dr, dc = abs(ar - br), abs(ac - bc)
+    return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+
+
+def _expand_path(grid, came_from, node):
+    """Fill in the cells between consecutive jump points."""
+    points = []
+    while node != -1:
+        points.append(grid.coords(node))
+        node = came_from[node]
+    points.reverse()
+
+    path = [points[0]]
+    for (r, c), (nr, nc) in zip(points, points[1:]):
+        dr = (nr > r) - (nr < r)
+        dc = (nc > c) - (nc < c)
+        while (r, c) != (nr, nc):
+            r, c = r + dr, c + dc
+            path.append((r, c))
+    return path
+
+
+def path_cost(path):
+    """Total cost of a cell path (1 per straight step, sqrt(2) per diagonal)."""
+    return sum(
+        SQRT2 if r != nr and c != nc else 1 for (r, c), (nr, nc) in zip(path, path[1:])
+    )
+
+
+# Example runnable block
+if __name__ == "__main__":
+    grid = OccupancyGrid.from_rows(
+        [
+            "..........",
+            "....#.....",
+            "....#.....",
+            "....#####.",
+            "..........",
+            ".######...",
+            "..........",
+        ]
+    )
+    print(grid)
+    for diagonal in (True, False):
+        kind = "8-connected" if diagonal else "4-connected"
+        for search in (grid_a_star, jump_point_search):
+            path = search(grid, (0, 0), (6, 9), diagonal=diagonal)
+            print(f"{search.__name__} ({kind}): cost {path_cost(path):.3f}, {path}")
@@ -0,0 +1,139 @@
+"""
+Unit tests for grid A* and Jump Point Search.
+
+Tests cover:
+- Grid construction from strings, lists and NumPy arrays
+- Both searches finding equally short, legal paths on random grids
+  (4- and 8-connected, no corner cutting)
+- Agreement with the generic a_star on the equivalent dict graph
+- Blocked and unreachable endpoints
+"""
+
+import math
+import random
+import unittest
+
+from algorithms.graph.a_star.python.a_star import a_star
+from algorithms.graph.grid_pathfinding.python.grid_pathfinding import (
+    OccupancyGrid,
+    grid_a_star,
+    jump_point_search,
+    path_cost,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAP = [
+    "..........",
+    "....#.....",
+    "....#.....",
+    "....#####.",
+    "..........",
+    ".######...",
+    "..........",
+]
+
+
+def random_grid(seed):
+    rng = random.Random(seed)
+    rows, cols = rng.randint(5, 25), rng.randint(5, 25)
+    density = rng.choice([0.1, 0.25, 0.4])
+    blocked = [
+        (r, c) for r in range(rows) for c in range(cols) if rng.random() < density
+    ]
+    return OccupancyGrid(rows, cols, blocked), rng
+
+
+def to_dict_graph(grid, diagonal):
+    graph = {}
+    for r in range(grid.rows):
+        for c in range(grid.cols):
+            if grid.is_free(r, c):
+                node = grid.id(r, c)
+                graph[(r, c)] = {
+                    grid.coords(v): cost for v, cost in grid.neighbors(node, diagonal)
+                }
+    return graph
+
+
+class TestOccupancyGrid(unittest.TestCase):
+    """Test cases for building grids."""
+
+    def test_from_rows(self):
+        grid = OccupancyGrid.from_rows(MAP)
+        self.assertEqual((grid.rows, grid.cols), (7, 10))
+        self.assertFalse(grid.is_free(1, 4))
+        self.assertTrue(grid.is_free(0, 0))
+        self.assertEqual(str(grid), "\n".join(MAP))
+        self.assertEqual(grid.coords(grid.id(3, 7)), (3, 7))
+        with self.assertRaises(IndexError):
+            grid.id(7, 0)
+
+    def test_from_lists_and_numpy(self):
+        rows = [[0, 1, 0], [0, 0, 0]]
+        grid = OccupancyGrid.from_rows(rows)
+        self.assertEqual(str(grid), ".#.\n...")
+        if np is not None:
+            self.assertEqual(str(OccupancyGrid.from_numpy(np.array(rows))), str(grid))
+
+
+class TestGridSearch(unittest.TestCase):
+    """Test cases for grid_a_star and jump_point_search."""
+
+    def assertLegalPath(self, grid, path, start, goal, diagonal):
+        self.assertEqual((path[0], path[-1]), (start, goal))
+        for (r, c), (nr, nc) in zip(path, path[1:]):
+            self.assertTrue(grid.is_free(nr, nc))
+            if diagonal:
+                self.assertEqual(max(abs(r - nr), abs(c - nc)), 1)
+                if r != nr and c != nc:  # no corner cutting
+                    self.assertTrue(grid.is_free(r, nc) and grid.is_free(nr, c))
+            else:
+                self.assertEqual(abs(r - nr) + abs(c - nc), 1)
+
+    def test_random_grids(self):
+        for seed in range(40):
+            grid, rng = random_grid(seed)
+            for _ in range(3):
+                start = (rng.randrange(grid.rows), rng.randrange(grid.cols))
+                goal = (rng.randrange(grid.rows), rng.randrange(grid.cols))
+                for diagonal in (True, False):
+                    astar = grid_a_star(grid, start, goal, diagonal)
+                    jps = jump_point_search(grid, start, goal, diagonal)
+                    self.assertEqual(astar is None, jps is None)
+                    if astar is None:
+                        continue
+                    self.assertTrue(math.isclose(path_cost(astar), path_cost(jps)))
+                    self.assertLegalPath(grid, astar, start, goal, diagonal)
+                    self.assertLegalPath(grid, jps, start, goal, diagonal)
+
+    def test_matches_dict_a_star(self):
+        grid = OccupancyGrid.from_rows(MAP)
+        for diagonal in (True, False):
+            graph = to_dict_graph(grid, diagonal)
+            expected = a_star((0, 0), (6, 9), graph, lambda node, goal: 0)
+            path = jump_point_search(grid, (0, 0), (6, 9), diagonal)
+            self.assertTrue(math.isclose(path_cost(path), path_cost(expected)))
+
+    def test_start_is_goal(self):
+        grid = OccupancyGrid.from_rows(MAP)
+        self.assertEqual(grid_a_star(grid, (2, 2), (2, 2)), [(2, 2)])
+        self.assertEqual(jump_point_search(grid, (2, 2), (2, 2)), [(2, 2)])
+
+    def test_blocked_or_unreachable(self):
+        grid = OccupancyGrid.from_rows(["..#..", "..#..", "..#.."])
+        for search in (grid_a_star, jump_point_search):
+            self.assertIsNone(search(grid, (0, 0), (0, 4)))
+            self.assertIsNone(search(grid, (0, 0), (1, 2)))
+
+    def test_corner_cutting_forbidden(self):
+        grid = OccupancyGrid.from_rows([".#", "#."])
+        for search in (grid_a_star, jump_point_search):
+            self.assertIsNone(search(grid, (0, 0), (1, 1), diagonal=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Johnson's Algorithm (All-Pairs Shortest Paths on Sparse Graphs)
+
+Description:
+Johnson's algorithm handles negative edge weights (but no negative cycles)
+while keeping Dijkstra's speed on sparse graphs:
+
+1. Add a virtual vertex q with a 0-weight edge to every vertex and run
+   `bellman_ford` from q. The resulting distances h(v) are "potentials".
+2. Reweight every edge u -> v to w'(u, v) = w(u, v) + h(u) - h(v), which is
+   never negative, and leaves shortest paths unchanged.
+3. Run `dijkstra` from every source on the reweighted graph and undo the
+   reweighting: d(s, v) = d'(s, v) - h(s) + h(v).
+
+Results are yielded one source at a time instead of being collected into a
+V x V matrix, and the per-source Dijkstra runs can be spread over a process
+pool (each worker receives the reweighted CSR graph once).
+
+Time Complexity: O(V * E + V * (V + E) log V)
+Space Complexity: O(V + E) for the graph, plus O(V) per yielded source
+"""
+
+from array import array
+from multiprocessing import Pool
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from algorithms.graph.bellman_ford.python.bellman_ford import bellman_ford
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra_csr
+
+INF = float("inf")
+
+
+def johnson(graph, sources=None, processes=1, vertices=None):
+    """
+    All-pairs shortest paths, streamed per source.
+
+    :param graph: list of (u, v, w) edges as accepted by `bellman_ford`,
+                  or a CSRGraph
+    :param sources: optional iterable of source nodes (default: every node)
+    :param processes: 1 runs every Dijkstra in this process; a larger number
+                      (or None for one per CPU) uses a multiprocessing Pool
+    :param vertices: optional iterable of extra nodes for an edge list, so
+                     isolated vertices are included
+    :return: generator of (source, distances) pairs, where distances maps
+             every node to its shortest distance from source (inf if
+             unreachable), in the order of `sources`
+    :raises ValueError: if the graph contains a negative weight cycle
+    """
+    csr = (
+        graph
+        if isinstance(graph, CSRGraph)
+        else CSRGraph.from_edges(graph, nodes=vertices)
+    )
+    reweighted, potential = reweight(csr)
+    if sources is None:
+        source_ids = range(csr.num_nodes)
+    else:
+        source_ids = [csr.index_of(s) for s in sources]
+
+    if processes == 1:
+        for s in source_ids:
+            yield csr.label_of(s), _distances_from(reweighted, potential, s)
+        return
+
+    with Pool(processes, _init_worker, (reweighted, potential)) as pool:
+        results = pool.imap(_worker_distances_from, source_ids, chunksize=16)
+        for s, distances in zip(source_ids, results):
+            yield csr.label_of(s), distances
+
+
+def reweight(csr):
+    """
+    Compute Bellman-Ford potentials from a virtual source and return
+    (reweighted CSRGraph with non-negative weights, potentials array).
+    """
+    n = csr.num_nodes
+    virtual = n  # one id past the real nodes
+    edges = list(csr.edges())
+    edges.extend((virtual, v, 0) for v in range(n))
+    h = bellman_ford(edges, virtual)
+    potential = array("d", (h[v] for v in range(n)))
+
+    weights = array("d", csr.weights)
+    offsets, targets = csr.offsets, csr.targets
+    for u in range(n):
+        hu = potential[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            # Clamp tiny negative float noise; exact arithmetic gives >= 0
+            weights[i] = max(0.0, weights[i] + hu - potential[targets[i]])
+    return CSRGraph(offsets, targets, weights, csr.labels), potential
+
+
+def _distances_from(reweighted, potential, s):
+    """Dijkstra on the reweighted graph, mapped back to original distances."""
+    dist, _, _ = dijkstra_csr(reweighted, {s: 0})
+    hs = potential[s]
+    label = reweighted.label_of
+    return {
+        label(v): d - hs + potential[v] if d < INF else INF for v, d in enumerate(dist)
+    }
+
+
+# State shared with each pool worker, set once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(reweighted, potential):
+    _WORKER["graph"] = reweighted
+    _WORKER["potential"] = potential
+
+
+def _worker_distances_from(s):
+    return _distances_from(_WORKER["graph"], _WORKER["potential"], s)
+
+
+# Example runnable block
+if __name__ == "__main__":
+    edges = [
+        ("A", "B", -2),
+        ("B", "C", 3),
+        ("A", "C", 4),
+        ("C", "D", -1),
+        ("D", "A", 5),
+        ("B", "D", 7),
+    ]
+    for source, distances in johnson(edges):
+        print(f"From {source}: {distances}")
@@ -0,0 +1,65 @@
+"""
+Unit tests for Johnson's all-pairs shortest paths.
+
+Tests cover:
+- Agreement with Bellman-Ford from every source on graphs with negative edges
+- Isolated vertices, source subsets and CSR input
+- Process pool execution
+- Negative cycle detection
+"""
+
+import random
+import unittest
+
+from johnson import johnson
+from algorithms.graph.bellman_ford.python.bellman_ford import bellman_ford
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+
+def random_edges(n, m, seed):
+    """Random edges with negative weights but no negative cycle (potentials)."""
+    rng = random.Random(seed)
+    potential = [rng.randint(0, 15) for _ in range(n)]
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(0, 10) + potential[u] - potential[v]))
+    return edges
+
+
+class TestJohnson(unittest.TestCase):
+    """Test cases for the johnson generator."""
+
+    def check(self, edges, results):
+        for source, distances in results:
+            expected = bellman_ford(edges + [(source, source, 0)], source)
+            for node, d in expected.items():
+                self.assertEqual(distances[node], d, (source, node))
+
+    def test_matches_bellman_ford(self):
+        for seed in range(3):
+            edges = random_edges(30, 90, seed)
+            self.check(edges, johnson(edges))
+
+    def test_process_pool(self):
+        edges = random_edges(40, 120, 9)
+        sequential = list(johnson(edges))
+        self.assertEqual(list(johnson(edges, processes=2)), sequential)
+
+    def test_sources_vertices_and_csr(self):
+        edges = [("a", "b", -1), ("b", "c", 2)]
+        results = dict(johnson(edges, sources=["a", "c"], vertices=["z"]))
+        self.assertEqual(list(results), ["a", "c"])
+        self.assertEqual(results["a"], {"z": float("inf"), "a": 0, "b": -1, "c": 1})
+        csr = CSRGraph.from_edges(edges)
+        self.assertEqual(dict(johnson(csr))["a"], {"a": 0, "b": -1, "c": 1})
+
+    def test_negative_cycle(self):
+        edges = [(0, 1, 1), (1, 2, -1), (2, 0, -1)]
+        with self.assertRaises(ValueError):
+            list(johnson(edges))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,36 @@
-from data_structures.UnionFind.python.union_find import UnionFind
 """
 Kruskal's Algorithm Implementation in Python
 
 Finds the Minimum Spanning Tree (MST) of a connected, undirected,
 weighted graph. Uses Union-Find (Disjoint Set) to detect cycles efficiently.
 
+`kruskal_external` handles edge sets larger than memory: edges are read from
+an iterator or a binary edge file in runs of `run_size`, each run is sorted
+and written to a temporary file, and the runs are lazily k-way merged
+(external merge sort) straight into the union-find, which stops reading as
+soon as n - 1 edges have been accepted. At most `fan_in` runs are merged at
+once: with more runs than that, groups of them are first merged into longer
+runs in extra passes, so open files and read buffers stay bounded.
+
+`filter_kruskal` avoids sorting edges that can never be used: like
+quicksort it splits the edges around a random pivot weight, solves the
+lighter half first, then drops heavier edges whose endpoints are already
+connected before recursing into them. Only small parts are ever sorted.
+
 """
 
+import heapq
+import os
+import random
+import struct
+import tempfile
+from itertools import chain, islice
+
+from data_structures.UnionFind.python.union_find import UnionFind
+
+# Binary edge record: float64 weight, int32 u, int32 v (16 bytes, little-endian)
+EDGE_RECORD = struct.Struct("<dii")
+
 
 def kruskal(n, edges):
     """
@@ -25,23 +49,197 @@ def kruskal(n, edges):
         Space Complexity: O(V + E)
     """
     edges.sort()
+    return kruskal_sorted(n, edges)
+
+
+def kruskal_external(n, edges, run_size=1_000_000, tmpdir=None, fan_in=64):
+    """
+    Kruskal's Algorithm over edges that do not fit in memory.
+
+    Parameters:
+        n (int): Number of vertices (0-indexed: 0 to n-1)
+        edges: iterable of (weight, u, v) tuples, or the path of a binary
+               edge file written by `write_edge_file`
+        run_size (int): edges sorted in memory at a time; one run is held
+                        while sorting, and merging reads every run through a
+                        buffer of about run_size / fan_in edges
+        tmpdir (str): directory for the temporary sorted runs
+                      (default: the system temp directory)
+        fan_in (int): most runs merged (and files open) at once
+
+    Returns:
+        mst, total_weight as returned by `kruskal`
 
+    Overall Complexity:
+        Time Complexity: O(E log E); every edge is written to and read back
+                         from disk once per merge pass, and there are
+                         about log(E / run_size) / log(fan_in) passes
+        Space Complexity: O(V + run_size) memory, O(E) temporary disk
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if isinstance(edges, (str, os.PathLike)):
+        edges = read_edge_file(edges)
+    edges = iter(edges)
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as run_dir:
+        first = sorted(islice(edges, run_size))
+        following = next(edges, None)
+        if following is None:
+            return kruskal_sorted(n, first)  # everything fit in one run
+
+        # Spill every run before the next one is read, so only one is held
+        runs = [_write_run(run_dir, 0, first)]
+        first = None
+        edges = chain([following], edges)
+        while True:
+            run = sorted(islice(edges, run_size))
+            if not run:
+                break
+            runs.append(_write_run(run_dir, len(runs), run))
+            run = None
+
+        buffer_records = max(1024, run_size // fan_in)
+        runs = _merge_passes(run_dir, runs, fan_in, buffer_records)
+        readers = [read_edge_file(path, buffer_records) for path in runs]
+        try:
+            return kruskal_sorted(n, heapq.merge(*readers))
+        finally:
+            for reader in readers:
+                reader.close()  # release run files left open by an early stop
+
+
+def _merge_passes(run_dir, runs, fan_in, buffer_records):
+    """Merge groups of `fan_in` runs into longer runs until <= fan_in remain."""
+    index = len(runs)
+    while len(runs) > fan_in:
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            readers = [read_edge_file(path, buffer_records) for path in group]
+            merged.append(_write_run(run_dir, index, heapq.merge(*readers)))
+            index += 1
+            for path in group:
+                os.remove(path)
+        runs = merged
+    return runs
+
+
+def kruskal_sorted(n, sorted_edges):
+    """
+    Kruskal's main loop over (weight, u, v) edges already in ascending
+    order. Consumes the iterable lazily and stops at n - 1 accepted edges.
+    """
     uf = UnionFind(n)
     mst = []
     total_weight = 0
-
-    for weight, u, v in edges:
+    for weight, u, v in sorted_edges:
         if uf.union(u, v):
             mst.append((u, v, weight))
             total_weight += weight
+            if len(mst) == n - 1:
+                break
+
+    _warn_if_disconnected(n, mst)
+    return mst, total_weight
 
+
+def filter_kruskal(n, edges, threshold=1024, seed=None):
+    """
+    Filter-Kruskal: Kruskal's Algorithm with quicksort-style partitioning.
+
+    Parameters:
+        n (int): Number of vertices (0-indexed: 0 to n-1)
+        edges (list of tuples): Each edge as (weight, u, v); not modified
+        threshold (int): parts with at most this many edges are sorted
+                         directly instead of partitioned further
+        seed: optional seed for the random pivot choice
+
+    Returns:
+        mst, total_weight as returned by `kruskal` (the same tree)
+
+    Overall Complexity:
+        Time Complexity: O(E + V log V log(E / V)) expected on random graphs,
+                         O(E log E) worst case
+        Space Complexity: O(V + E)
+    """
+    rng = random.Random(seed)
+    uf = UnionFind(n)
+    find = uf.find
+    mst = []
+    total_weight = 0
+
+    # Explicit stack of (edges, needs_filter) parts, lightest part on top
+    stack = [(edges, False)]
+    while stack and len(mst) < n - 1:
+        part, needs_filter = stack.pop()
+        if needs_filter:
+            part = [e for e in part if find(e[1]) != find(e[2])]
+        if len(part) > threshold:
+            pivot = rng.choice(part)[0]
+            light = [e for e in part if e[0] <= pivot]
+            if len(light) < len(part):
+                stack.append(([e for e in part if e[0] > pivot], True))
+                stack.append((light, False))
+                continue
+        for weight, u, v in sorted(part):
+            if uf.union(u, v):
+                mst.append((u, v, weight))
+                total_weight += weight
+                if len(mst) == n - 1:
+                    break
+
+    _warn_if_disconnected(n, mst)
+    return mst, total_weight
+
+
+def _warn_if_disconnected(n, mst):
     if len(mst) != n - 1:
         print(
             "Warning: The graph is not connected; MST may not include all "
             "vertices."
         )
 
-    return mst, total_weight
+
+def write_edge_file(path, edges):
+    """
+    Write (weight, u, v) edges as binary EDGE_RECORD records.
+    Returns the number of edges written.
+    """
+    count = 0
+    pack = EDGE_RECORD.pack
+    with open(path, "wb") as f:
+        it = iter(edges)
+        while True:
+            chunk = list(islice(it, 65536))
+            if not chunk:
+                break
+            f.write(b"".join(pack(w, u, v) for w, u, v in chunk))
+            count += len(chunk)
+    return count
+
+
+def read_edge_file(path, buffer_records=65536):
+    """Yield (weight, u, v) edges from a binary edge file, reading in blocks."""
+    block = buffer_records * EDGE_RECORD.size
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(block)
+            if not data:
+                break
+            if len(data) % EDGE_RECORD.size:
+                raise ValueError(f"{path}: truncated edge record")
+            yield from EDGE_RECORD.iter_unpack(data)
+
+
+def _write_run(run_dir, index, run):
+    """Write one sorted run to its own file and return the path."""
+    path = os.path.join(run_dir, f"run{index:06d}.bin")
+    write_edge_file(path, run)
+    return path
 
 
 if __name__ == "__main__":
@@ -62,3 +260,14 @@ if __name__ == "__main__":
         print(f"{u} -- {v} == {w}")
 
     print("Total weight of MST:", total_weight)
+
+    # Same graph through the external-memory path: a binary edge file sorted
+    # in runs of 2 edges and merged back from disk
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "edges.bin")
+        write_edge_file(path, edges)
+        mst, total_weight = kruskal_external(n, path, run_size=2)
+    print("External-memory MST weight:", total_weight)
+
+    mst, total_weight = filter_kruskal(n, edges, threshold=2)
+    print("Filter-Kruskal MST weight:", total_weight)
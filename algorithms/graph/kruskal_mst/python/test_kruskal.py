@@ -0,0 +1,139 @@
+"""
+Unit tests for Kruskal's MST, in memory and with external-memory sorting.
+
+Tests cover:
+- The in-memory kruskal on a small graph
+- kruskal_external matching kruskal for iterators and binary edge files
+- Bounded merge fan-in with more runs than fit in one merge
+- Early stop once n - 1 edges are accepted
+- The binary edge file round trip
+- filter_kruskal returning the same tree as kruskal
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from algorithms.graph.kruskal_mst.python import kruskal as kruskal_module
+from algorithms.graph.kruskal_mst.python.kruskal import (
+    filter_kruskal,
+    kruskal,
+    kruskal_external,
+    kruskal_sorted,
+    read_edge_file,
+    write_edge_file,
+)
+
+
+def random_edges(n, m, seed):
+    """Connected random graph: a random spanning path plus m extra edges."""
+    rng = random.Random(seed)
+    order = list(range(n))
+    rng.shuffle(order)
+    edges = [(rng.randint(1, 100), u, v) for u, v in zip(order, order[1:])]
+    edges += [
+        (rng.randint(1, 100), rng.randrange(n), rng.randrange(n)) for _ in range(m)
+    ]
+    return edges
+
+
+class TestKruskal(unittest.TestCase):
+    """Test cases for the in-memory and external-memory variants."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_sample_graph(self):
+        edges = [(1, 0, 1), (3, 0, 2), (3, 1, 2), (6, 1, 3), (2, 2, 3)]
+        mst, total = kruskal(4, edges)
+        self.assertEqual(total, 6)
+        self.assertEqual(sorted(mst), [(0, 1, 1), (0, 2, 3), (2, 3, 2)])
+
+    def test_external_from_iterator(self):
+        edges = random_edges(200, 1500, seed=1)
+        expected = kruskal(200, list(edges))
+        for run_size in (50, 10_000):
+            result = kruskal_external(
+                200, iter(edges), run_size=run_size, tmpdir=self.tmp.name
+            )
+            self.assertEqual(result, expected)
+        self.assertEqual(os.listdir(self.tmp.name), [])  # runs are removed
+
+    def test_external_from_file(self):
+        edges = random_edges(300, 2000, seed=2)
+        path = os.path.join(self.tmp.name, "edges.bin")
+        self.assertEqual(write_edge_file(path, edges), len(edges))
+        self.assertEqual(
+            list(read_edge_file(path, buffer_records=7)),
+            [(float(w), u, v) for w, u, v in edges],
+        )
+
+        mst, total = kruskal_external(300, path, run_size=128)
+        _, expected_total = kruskal(300, list(edges))
+        self.assertEqual(len(mst), 299)
+        self.assertEqual(total, expected_total)
+
+    def test_external_bounded_fan_in(self):
+        edges = random_edges(300, 3000, seed=3)
+        expected = kruskal(300, list(edges))
+        widths = []
+        merge = kruskal_module.heapq.merge
+
+        def recording_merge(*iterables):
+            widths.append(len(iterables))
+            return merge(*iterables)
+
+        with mock.patch.object(kruskal_module.heapq, "merge", recording_merge):
+            result = kruskal_external(
+                300, iter(edges), run_size=10, tmpdir=self.tmp.name, fan_in=4
+            )
+        self.assertEqual(result, expected)
+        self.assertGreater(len(widths), 1)  # 330 runs need several passes
+        self.assertLessEqual(max(widths), 4)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        with self.assertRaises(ValueError):
+            kruskal_external(300, iter(edges), fan_in=1)
+
+    def test_stops_after_spanning_tree(self):
+        def sorted_stream():
+            for i in range(1, 10):
+                yield (i, i - 1, i)
+            raise AssertionError("read past the spanning tree")
+
+        mst, total = kruskal_sorted(10, sorted_stream())
+        self.assertEqual(len(mst), 9)
+        self.assertEqual(total, sum(range(1, 10)))
+
+    def test_truncated_file(self):
+        path = os.path.join(self.tmp.name, "bad.bin")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 20)
+        with self.assertRaises(ValueError):
+            list(read_edge_file(path))
+
+
+class TestFilterKruskal(unittest.TestCase):
+    """Filter-Kruskal must pick exactly the edges kruskal picks."""
+
+    def test_matches_kruskal(self):
+        for seed in range(4):
+            edges = random_edges(300, 3000, seed)
+            original = list(edges)
+            expected = kruskal(300, list(edges))
+            result = filter_kruskal(300, edges, threshold=32, seed=seed)
+            self.assertEqual(sorted(result[0]), sorted(expected[0]))
+            self.assertEqual(result[1], expected[1])
+            self.assertEqual(edges, original)  # input left untouched
+
+    def test_equal_weights(self):
+        edges = [(1, u, v) for u in range(30) for v in range(u + 1, 30)]
+        mst, total = filter_kruskal(30, edges, threshold=4)
+        self.assertEqual(total, 29)
+        self.assertEqual(sorted(mst), sorted(kruskal(30, list(edges))[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
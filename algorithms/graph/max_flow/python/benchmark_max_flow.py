@@ -0,0 +1,108 @@
+"""
+Benchmark: Dinic and push-relabel vs Edmonds-Karp
+
+Description:
+Builds bipartite assignment networks (unit capacities, the shape used for
+matching problems) and random capacity-planning networks, then times
+`FlowNetwork.max_flow` with every algorithm on the same network, checking
+that all of them find the same flow value. Network construction is timed
+separately, since it is shared by all algorithms.
+
+Usage (from the repository root):
+    python -m algorithms.graph.max_flow.python.benchmark_max_flow
+    python -m algorithms.graph.max_flow.python.benchmark_max_flow \
+        --bipartite 2000 20000 --random 5000 50000 --skip-edmonds-karp-above 100000
+"""
+
+import argparse
+import random
+import time
+
+from algorithms.graph.max_flow.python.max_flow import ALGORITHMS, FlowNetwork
+
+
+def bipartite_network(n, rng, degree=3):
+    """Source -> n workers -> n jobs -> sink, each worker able to do `degree` jobs."""
+    graph = {"s": {}, "t": {}}
+    for i in range(n):
+        graph["s"][("w", i)] = 1
+        graph[("w", i)] = {("j", j): 1 for j in rng.sample(range(n), min(degree, n))}
+    for j in range(n):
+        graph[("j", j)] = {"t": 1}
+    return graph, "s", "t"
+
+
+def random_network(n, rng, avg_degree=6):
+    """Directed random graph with capacities 1..100 between nodes 0 and n - 1."""
+    graph = {u: {} for u in range(n)}
+    for _ in range(n * avg_degree):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(1, 100)
+    return graph, 0, n - 1
+
+
+def run_case(name, graph, source, sink, skip_edmonds_karp_above):
+    """Build the network once, time every algorithm and print one result row."""
+    start = time.perf_counter()
+    network = FlowNetwork(graph)
+    build_time = time.perf_counter() - start
+
+    times = {}
+    values = set()
+    for algorithm in ALGORITHMS:
+        if algorithm == "edmonds_karp" and len(network.head) > skip_edmonds_karp_above:
+            continue
+        start = time.perf_counter()
+        values.add(network.max_flow(source, sink, algorithm))
+        times[algorithm] = time.perf_counter() - start
+    if len(values) != 1:
+        raise AssertionError(f"{name}: algorithms disagree on the flow value {values}")
+
+    baseline = times.get("edmonds_karp")
+    columns = []
+    for algorithm, seconds in times.items():
+        speedup = f" ({baseline / seconds:5.1f}x)" if baseline and seconds else ""
+        columns.append(f"{algorithm}={seconds:8.3f}s{speedup}")
+    print(
+        f"{name:<18} V={network.num_nodes:<8} arcs={len(network.head):<9} "
+        f"flow={values.pop():<10g} build={build_time:6.2f}s " + " ".join(columns)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--bipartite",
+        type=int,
+        nargs="*",
+        default=[500, 2000],
+        help="workers (= jobs) per assignment network",
+    )
+    parser.add_argument(
+        "--random",
+        type=int,
+        nargs="*",
+        default=[1000, 5000],
+        help="random network sizes",
+    )
+    parser.add_argument(
+        "--skip-edmonds-karp-above",
+        type=int,
+        default=200_000,
+        help="skip the slow baseline on networks with more arcs than this",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for n in args.bipartite:
+        run_case(
+            f"bipartite n={n}", *bipartite_network(n, rng), args.skip_edmonds_karp_above
+        )
+    for n in args.random:
+        run_case(f"random n={n}", *random_network(n, rng), args.skip_edmonds_karp_above)
+
+
+if __name__ == "__main__":
+    main()
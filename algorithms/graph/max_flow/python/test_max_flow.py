@@ -0,0 +1,207 @@
+"""
+Unit tests for the max-flow / min-cut engine.
+
+Tests cover:
+- The textbook network for every algorithm
+- Random networks: all algorithms agree with a brute-force minimum cut
+- Returned flows respecting capacities and conservation
+- Min-cut edges summing to the flow value
+- Rounding residue ignored, but stranded excess rejected by push-relabel
+- Bipartite matching, undirected Graph input and parallel edges
+- Reusing one network for several source/sink pairs
+- Invalid input
+"""
+
+import random
+import unittest
+from itertools import combinations
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.Graph.python.graph_adjacency_list import Graph
+from algorithms.graph.max_flow.python.max_flow import (
+    ALGORITHMS,
+    FlowNetwork,
+    _PushRelabel,
+    max_flow,
+    min_cut,
+)
+
+CLRS = {
+    "s": {"a": 16, "c": 13},
+    "a": {"b": 12},
+    "b": {"c": 9, "t": 20},
+    "c": {"a": 4, "d": 14},
+    "d": {"b": 7, "t": 4},
+    "t": {},
+}
+
+
+def random_network(n, m, rng, max_capacity=10):
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph[u][v] = rng.randint(0, max_capacity)
+    return graph
+
+
+def brute_force_min_cut(graph, s, t):
+    others = [u for u in graph if u not in (s, t)]
+    best = float("inf")
+    for k in range(len(others) + 1):
+        for chosen in combinations(others, k):
+            side = {s, *chosen}
+            cut = sum(w for u in side for v, w in graph[u].items() if v not in side)
+            best = min(best, cut)
+    return best
+
+
+class TestMaxFlow(unittest.TestCase):
+
+    def assertValidFlow(self, graph, network, s, t, value):
+        flows = network.flows()
+        balance = {u: 0 for u in graph}
+        for (u, v), f in flows.items():
+            self.assertLessEqual(f, graph[u][v] + 1e-9)
+            balance[u] -= f
+            balance[v] += f
+        for u, b in balance.items():
+            if u == s:
+                self.assertAlmostEqual(b, -value)
+            elif u == t:
+                self.assertAlmostEqual(b, value)
+            else:
+                self.assertAlmostEqual(b, 0)
+
+    def test_textbook_network(self):
+        network = FlowNetwork(CLRS)
+        for algorithm in ALGORITHMS:
+            with self.subTest(algorithm=algorithm):
+                self.assertEqual(network.max_flow("s", "t", algorithm), 23)
+                self.assertValidFlow(CLRS, network, "s", "t", 23)
+                side, cut = network.min_cut()
+                self.assertIn("s", side)
+                self.assertNotIn("t", side)
+                self.assertEqual(sum(c for _, _, c in cut), 23)
+
+    def test_random_networks_match_brute_force(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            graph = random_network(8, rng.randint(5, 30), rng)
+            expected = brute_force_min_cut(graph, 0, 7)
+            network = FlowNetwork(graph)
+            for algorithm in ALGORITHMS:
+                value = network.max_flow(0, 7, algorithm)
+                self.assertEqual(value, expected, algorithm)
+                self.assertValidFlow(graph, network, 0, 7, value)
+                side, cut = network.min_cut()
+                self.assertEqual(sum(c for _, _, c in cut), value)
+                self.assertTrue(all(u in side and v not in side for u, v, _ in cut))
+
+    def test_larger_random_networks_agree(self):
+        rng = random.Random(9)
+        for _ in range(10):
+            graph = random_network(150, 900, rng, max_capacity=50)
+            values = {a: max_flow(graph, 0, 149, a) for a in ALGORITHMS}
+            self.assertEqual(len(set(values.values())), 1, values)
+
+    def test_fractional_capacities(self):
+        graph = {
+            "s": {"a": 0.5, "b": 1.25},
+            "a": {"t": 1.0},
+            "b": {"a": 0.75, "t": 0.5},
+        }
+        for algorithm in ALGORITHMS:
+            self.assertAlmostEqual(max_flow(graph, "s", "t", algorithm), 1.5)
+
+        # Excess left on a node as pure rounding residue (3.76 + 1 - 3.76 - 1
+        # is not exactly 0) has nowhere to go and must not break push-relabel
+        edges = [
+            (0, 11, 1),
+            (4, 0, 15),
+            (11, 16, 13),
+            (15, 27, 18),
+            (15, 5, 1),
+            (16, 25, 4),
+            (20, 4, 2.295932234457908),
+            (23, 20, 1),
+            (23, 5, 3.7626130037804706),
+            (25, 13, 1),
+            (27, 23, 16),
+        ]
+        graph = {u: {} for u in range(28)}
+        for u, v, w in edges:
+            graph[u][v] = w
+        network = FlowNetwork(graph)
+        for algorithm in ALGORITHMS:
+            self.assertAlmostEqual(network.max_flow(15, 13, algorithm), 1)
+
+    def test_push_relabel_rejects_stranded_excess(self):
+        # Node 2 has no arcs at all, so excess there cannot be real flow
+        network = FlowNetwork({0: {1: 1.0}, 2: {}})
+        engine = _PushRelabel(network, 0, 1)
+        engine.limit = 3
+        engine._global_relabel()
+        engine.excess[2] = 0.5
+        with self.assertRaises(RuntimeError):
+            engine._relabel(2)
+
+    def test_bipartite_matching(self):
+        rng = random.Random(2)
+        left, right = 40, 40
+        graph = {"s": {}, "t": {}}
+        for i in range(left):
+            graph["s"][("L", i)] = 1
+            graph[("L", i)] = {("R", j): 1 for j in rng.sample(range(right), 2)}
+        for j in range(right):
+            graph[("R", j)] = {"t": 1}
+        values = {a: max_flow(graph, "s", "t", a) for a in ALGORITHMS}
+        self.assertEqual(len(set(values.values())), 1)
+        network = FlowNetwork(graph)
+        network.max_flow("s", "t")
+        matched = [(u, v) for (u, v) in network.flows() if u != "s" and v != "t"]
+        self.assertEqual(len(matched), values["dinic"])
+        self.assertEqual(len({v for _, v in matched}), len(matched))
+
+    def test_undirected_graph_and_parallel_edges(self):
+        g = Graph()
+        g.add_edge("a", "b", weight=3)
+        g.add_edge("b", "c", weight=2)
+        g.add_edge("a", "c", weight=1)
+        self.assertEqual(max_flow(g, "a", "c"), 3)
+        self.assertEqual(max_flow(g, "c", "a"), 3)
+
+        parallel = CSRGraph.from_edges([(0, 1, 2), (0, 1, 3), (1, 2, 10), (1, 1, 7)])
+        self.assertEqual(max_flow(parallel, 0, 2, "push_relabel"), 5)
+        network = FlowNetwork(parallel)
+        network.max_flow(0, 2)
+        self.assertEqual(network.flows()[(0, 1)], 5)
+
+    def test_reuse_and_disconnected(self):
+        network = FlowNetwork(CLRS)
+        self.assertEqual(network.max_flow("a", "t"), 12)
+        self.assertEqual(network.max_flow("s", "t"), 23)
+        self.assertEqual(network.max_flow("t", "s"), 0)
+        side, cut = network.min_cut()
+        self.assertEqual((side, cut), ({"t"}, []))
+
+        value, side, cut = min_cut(CLRS, "c", "b")
+        self.assertEqual(value, 11)  # 4 via a, 7 via d
+        self.assertEqual(sum(c for _, _, c in cut), 11)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            FlowNetwork({"a": {"b": -1}})
+        network = FlowNetwork(CLRS)
+        with self.assertRaises(ValueError):
+            network.min_cut()
+        with self.assertRaises(ValueError):
+            network.max_flow("s", "s")
+        with self.assertRaises(ValueError):
+            network.max_flow("s", "t", algorithm="ford_fulkerson")
+        with self.assertRaises(KeyError):
+            network.max_flow("s", "nowhere")
+
+
+if __name__ == "__main__":
+    unittest.main()
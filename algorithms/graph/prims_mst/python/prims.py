@@ -11,10 +11,31 @@ Time Complexity:
 
 Space Complexity:
     O(V + E) — for storing adjacency list and visited nodes.
+
+The graph may also be passed as a CSRGraph
+(data_structures/Graph/python/csr_graph.py) storing both edge directions.
+
+Variants:
+    prims_mst_indexed — keeps one heap entry per vertex in an IndexedMinHeap
+        and lowers its key in place (decrease-key) instead of pushing every
+        incident edge: O(E log_d V) time, O(V) heap size.
+    prims_mst_dense — for adjacency matrices of (near-)complete graphs: a
+        key array is scanned with NumPy argmin each step, O(V^2) time, which
+        is optimal when E ~ V^2. Falls back to plain lists without NumPy.
 """
 
 import heapq
 
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.heap.python.min_heap import IndexedMinHeap
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; prims_mst_dense falls back to lists.
+    np = None
+
+INF = float("inf")
+
 
 def prims_mst(graph, start=0):
     """
@@ -31,6 +52,8 @@ def prims_mst(graph, start=0):
         total_weight (int): Total weight of the MST
         mst_edges (list): List of edges (u, v, weight) included in MST
     """
+    if isinstance(graph, CSRGraph):
+        return _prims_mst_csr(graph, start)
 
     visited = set()  # Track visited nodes
     min_heap = [(0, start, -1)]  # (weight, vertex, parent)
@@ -59,6 +82,172 @@ def prims_mst(graph, start=0):
     return total_weight, mst_edges
 
 
+def _prims_mst_csr(graph, start):
+    """Prim's algorithm over a CSRGraph, tracking visited ids in a bytearray."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    visited = bytearray(graph.num_nodes)
+    min_heap = [(0, graph.index_of(start), -1)]
+    total_weight = 0
+    mst_edges = []
+    label = graph.label_of
+
+    while min_heap:
+        weight, u, parent = heapq.heappop(min_heap)
+        if visited[u]:
+            continue
+
+        visited[u] = 1
+        total_weight += weight
+        if parent != -1:
+            mst_edges.append((label(parent), label(u), weight))
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            if not visited[v]:
+                heapq.heappush(min_heap, (weights[i], v, u))
+
+    return total_weight, mst_edges
+
+
+def prims_mst_indexed(graph, start=0):
+    """
+    Prim's Algorithm with an indexed heap holding one entry per vertex.
+
+    Parameters and return value are the same as `prims_mst`; a CSRGraph is
+    also accepted.
+    """
+    if isinstance(graph, CSRGraph):
+        return _prims_mst_indexed_csr(graph, start)
+
+    heap = IndexedMinHeap()
+    heap.insert(start, 0)
+    parent = {start: -1}
+    visited = set()
+    total_weight = 0
+    mst_edges = []
+
+    while heap:
+        u, weight = heap.extract_min()
+        visited.add(u)
+        total_weight += weight
+        if parent[u] != -1:
+            mst_edges.append((parent[u], u, weight))
+
+        for v, w in graph.get(u, []):
+            # insert() lowers v's key only if w is an improvement
+            if v not in visited and heap.insert(v, w):
+                parent[v] = u
+
+    return total_weight, mst_edges
+
+
+def _prims_mst_indexed_csr(graph, start):
+    """Indexed-heap Prim's over a CSRGraph's integer ids."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    visited = bytearray(graph.num_nodes)
+    parent = {}
+    heap = IndexedMinHeap()
+    heap.insert(graph.index_of(start), 0)
+    total_weight = 0
+    mst_edges = []
+    label = graph.label_of
+
+    while heap:
+        u, weight = heap.extract_min()
+        visited[u] = 1
+        total_weight += weight
+        if u in parent:
+            mst_edges.append((label(parent.pop(u)), label(u), weight))
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            if not visited[v] and heap.insert(v, weights[i]):
+                parent[v] = u
+
+    return total_weight, mst_edges
+
+
+def prims_mst_dense(matrix, start=0):
+    """
+    Prim's Algorithm over a V x V adjacency matrix in O(V^2).
+
+    Parameters:
+        matrix: list of lists or NumPy array; matrix[u][v] is the weight of
+                edge u -- v, None or float('inf') where there is no edge
+                (the diagonal is ignored)
+        start (int): Starting vertex (default = 0)
+
+    Returns:
+        total_weight, mst_edges as in `prims_mst` (weights are floats on the
+        NumPy path). If the graph is disconnected, only the start vertex's
+        component is spanned.
+    """
+    if np is None:
+        return _prims_mst_dense_python(matrix, start)
+
+    if isinstance(matrix, np.ndarray):
+        weights = matrix.astype(np.float64, copy=False)
+    else:
+        weights = np.array(
+            [[INF if w is None else w for w in row] for row in matrix], dtype=np.float64
+        )
+    n = len(weights)
+    key = np.full(n, INF)
+    parent = np.full(n, -1, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    key[start] = 0
+    total_weight = 0
+    mst_edges = []
+
+    for _ in range(n):
+        u = int(np.argmin(key))
+        if key[u] == INF:
+            break  # remaining vertices are unreachable
+        weight = float(key[u])
+        total_weight += weight
+        if parent[u] != -1:
+            mst_edges.append((int(parent[u]), u, weight))
+        in_tree[u] = True
+        key[u] = INF  # never selected again
+
+        row = weights[u]
+        better = (row < key) & ~in_tree
+        key[better] = row[better]
+        parent[better] = u
+
+    return total_weight, mst_edges
+
+
+def _prims_mst_dense_python(matrix, start):
+    """Pure Python O(V^2) fallback for prims_mst_dense."""
+    n = len(matrix)
+    key = [INF] * n
+    parent = [-1] * n
+    in_tree = [False] * n
+    key[start] = 0
+    total_weight = 0
+    mst_edges = []
+
+    for _ in range(n):
+        u, best = -1, INF
+        for v in range(n):
+            if not in_tree[v] and key[v] < best:
+                u, best = v, key[v]
+        if u == -1:
+            break  # remaining vertices are unreachable
+        total_weight += key[u]
+        if parent[u] != -1:
+            mst_edges.append((parent[u], u, key[u]))
+        in_tree[u] = True
+
+        for v, w in enumerate(matrix[u]):
+            if w is not None and not in_tree[v] and w < key[v]:
+                key[v] = w
+                parent[v] = u
+
+    return total_weight, mst_edges
+
+
 # Example runnable block
 if __name__ == "__main__":
     # Example graph (undirected)
@@ -77,3 +266,14 @@ if __name__ == "__main__":
         print(f"{u} -- {v}  weight: {w}")
 
     print(f"\nTotal weight of MST: {total_weight}")
+
+    total_weight, _ = prims_mst_indexed(graph, start=0)
+    print(f"Total weight (indexed heap): {total_weight}")
+
+    # The same graph as an adjacency matrix (None = no edge)
+    matrix = [[None] * len(graph) for _ in graph]
+    for u, edges in graph.items():
+        for v, w in edges:
+            matrix[u][v] = w
+    total_weight, _ = prims_mst_dense(matrix, start=0)
+    print(f"Total weight (dense matrix): {total_weight}")
@@ -0,0 +1,96 @@
+"""
+Unit tests for Prim's MST variants.
+
+Tests cover:
+- prims_mst, prims_mst_indexed and prims_mst_dense agreeing on the total
+  weight of random graphs (dict, CSRGraph and matrix inputs)
+- The pure Python dense fallback
+- Disconnected graphs spanning only the start component
+"""
+
+import random
+import unittest
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from algorithms.graph.prims_mst.python import prims
+from algorithms.graph.prims_mst.python.prims import (
+    prims_mst,
+    prims_mst_dense,
+    prims_mst_indexed,
+)
+
+GRAPH = {
+    0: [(1, 2), (3, 6)],
+    1: [(0, 2), (2, 3), (3, 8), (4, 5)],
+    2: [(1, 3), (4, 7)],
+    3: [(0, 6), (1, 8), (4, 9)],
+    4: [(1, 5), (2, 7), (3, 9)],
+}
+
+
+def random_graph(n, density, seed):
+    """Random connected undirected graph as (adjacency dict, matrix)."""
+    rng = random.Random(seed)
+    matrix = [[None] * n for _ in range(n)]
+    for u in range(n):
+        for v in range(u + 1, n):
+            if v == u + 1 or rng.random() < density:
+                matrix[u][v] = matrix[v][u] = rng.randint(1, 50)
+    graph = {
+        u: [(v, w) for v, w in enumerate(row) if w is not None]
+        for u, row in enumerate(matrix)
+    }
+    return graph, matrix
+
+
+def is_spanning_tree(n, edges):
+    seen = {edges[0][0]} if edges else set()
+    for u, v, _ in edges:
+        if v in seen:
+            return False
+        seen.add(v)
+    return len(edges) == n - 1
+
+
+class TestPrims(unittest.TestCase):
+    """Test cases for the heap, indexed-heap and dense-matrix variants."""
+
+    def test_example(self):
+        expected = prims_mst(GRAPH)[0]
+        self.assertEqual(expected, 16)
+        self.assertEqual(prims_mst_indexed(GRAPH), prims_mst(GRAPH))
+
+    def test_variants_agree(self):
+        for seed, density in ((0, 0.1), (1, 0.9)):
+            graph, matrix = random_graph(60, density, seed)
+            expected = prims_mst(graph)[0]
+
+            for result in (
+                prims_mst_indexed(graph),
+                prims_mst_indexed(CSRGraph.from_adjacency(graph)),
+                prims_mst_dense(matrix),
+            ):
+                self.assertEqual(result[0], expected)
+                self.assertTrue(is_spanning_tree(60, result[1]))
+
+    def test_dense_python_fallback(self):
+        graph, matrix = random_graph(30, 0.5, seed=3)
+        saved, prims.np = prims.np, None
+        try:
+            total, edges = prims_mst_dense(matrix, start=5)
+        finally:
+            prims.np = saved
+        self.assertEqual(total, prims_mst(graph, 5)[0])
+        self.assertTrue(is_spanning_tree(30, edges))
+
+    def test_disconnected(self):
+        inf = float("inf")
+        matrix = [[0, 1, inf], [1, 0, inf], [inf, inf, 0]]
+        self.assertEqual(prims_mst_dense(matrix), (1.0, [(0, 1, 1.0)]))
+        self.assertEqual(
+            prims_mst_indexed({0: [(1, 1)], 1: [(0, 1)], 2: []}), (1, [(0, 1, 1)])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,282 @@
+"""
+Strongly Connected Components, Topological Sort and Condensation
+
+Description:
+A strongly connected component (SCC) is a maximal set of nodes that can all
+reach each other. Contracting every SCC to a single node (the condensation)
+always leaves a DAG, which can then be topologically sorted.
+
+All algorithms here run over a CSRGraph's integer ids with flat typed arrays
+(one int per node for each piece of state) and explicit stacks instead of
+recursion, so multi-million node graphs neither hit Python's recursion limit
+nor allocate an object per node. Any Graph, adjacency dict or CSRGraph is
+accepted (converted once with `CSRGraph.from_graph`).
+
+- Tarjan: one DFS; each node gets a discovery index and a low-link (lowest
+  index reachable through its DFS subtree and one back edge). A node whose
+  low-link equals its own index is the root of an SCC, which is popped off
+  the node stack.
+- Kosaraju: a DFS records finish order; a second pass over the reversed
+  graph, in reverse finish order, collects one SCC per search.
+- Kahn: repeatedly removes nodes of in-degree zero; if some nodes are never
+  removed, the graph has a cycle.
+
+Both SCC algorithms number components in topological order of the
+condensation: every edge goes from a component to itself or a later one.
+
+Time Complexity: O(V + E) for every function
+Space Complexity: O(V) besides the graph (Kosaraju also builds the reverse)
+"""
+
+from array import array
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+
+
+def component_ids(graph, algorithm="tarjan"):
+    """
+    Label every node id of `graph` with its SCC number.
+
+    :param graph: CSRGraph (or anything accepted by CSRGraph.from_graph;
+                  ids then follow that conversion's node order)
+    :param algorithm: "tarjan" or "kosaraju"
+    :return: (components, count) where components is an array('i') mapping
+             node id -> component number in 0..count-1, in topological order
+    """
+    csr = CSRGraph.from_graph(graph)
+    if algorithm == "tarjan":
+        return _tarjan(csr)
+    if algorithm == "kosaraju":
+        return _kosaraju(csr)
+    raise ValueError(
+        f"Unknown algorithm {algorithm!r}; expected 'tarjan' or 'kosaraju'"
+    )
+
+
+def strongly_connected_components(graph, algorithm="tarjan"):
+    """
+    Return the SCCs as lists of node labels, in topological order (no edge
+    leads from a component to an earlier one).
+    """
+    csr = CSRGraph.from_graph(graph)
+    components, count = component_ids(csr, algorithm)
+    groups = [[] for _ in range(count)]
+    label = csr.label_of
+    for node, component in enumerate(components):
+        groups[component].append(label(node))
+    return groups
+
+
+def tarjan_scc(graph):
+    """Strongly connected components using iterative Tarjan."""
+    return strongly_connected_components(graph, "tarjan")
+
+
+def kosaraju_scc(graph):
+    """Strongly connected components using iterative Kosaraju."""
+    return strongly_connected_components(graph, "kosaraju")
+
+
+def _tarjan(csr):
+    offsets, targets = csr.offsets, csr.targets
+    n = csr.num_nodes
+    index = array("i", [-1]) * n
+    low = array("i", [0]) * n
+    on_stack = bytearray(n)
+    next_edge = array("q", offsets)  # per-node cursor into its edge slice
+    components = array("i", [-1]) * n
+    stack = array("i")  # nodes of not yet completed components
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call = array("i", [root])  # explicit DFS call stack
+
+        while call:
+            v = call[-1]
+            i = next_edge[v]
+            if i < offsets[v + 1]:
+                next_edge[v] = i + 1
+                w = targets[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call.append(w)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            call.pop()
+            if call and low[v] < low[call[-1]]:
+                low[call[-1]] = low[v]
+            if low[v] == index[v]:
+                _pop_component(stack, on_stack, components, v, count)
+                count += 1
+
+    # Tarjan completes sink components first; flip to topological order
+    last = count - 1
+    for node in range(n):
+        components[node] = last - components[node]
+    return components, count
+
+
+def _pop_component(stack, on_stack, components, root, number):
+    """Pop the nodes above and including `root` into component `number`."""
+    while True:
+        w = stack.pop()
+        on_stack[w] = 0
+        components[w] = number
+        if w == root:
+            return
+
+
+def _kosaraju(csr):
+    finished = _finish_order(csr)
+
+    # Latest finisher first on the reverse graph; each search is one SCC
+    reverse = csr.reverse()
+    r_offsets, r_targets = reverse.offsets, reverse.targets
+    components = array("i", [-1]) * csr.num_nodes
+    count = 0
+    for root in reversed(finished):
+        if components[root] != -1:
+            continue
+        components[root] = count
+        stack = array("i", [root])
+        while stack:
+            v = stack.pop()
+            start, end = r_offsets[v], r_offsets[v + 1]
+            for w in r_targets[start:end]:
+                if components[w] == -1:
+                    components[w] = count
+                    stack.append(w)
+        count += 1
+    return components, count
+
+
+def _finish_order(csr):
+    """Node ids in the order an iterative DFS finishes them."""
+    offsets, targets = csr.offsets, csr.targets
+    n = csr.num_nodes
+    visited = bytearray(n)
+    next_edge = array("q", offsets)
+    finished = array("i")
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        call = array("i", [root])
+        while call:
+            v = call[-1]
+            i = next_edge[v]
+            if i < offsets[v + 1]:
+                next_edge[v] = i + 1
+                w = targets[i]
+                if not visited[w]:
+                    visited[w] = 1
+                    call.append(w)
+            else:
+                call.pop()
+                finished.append(v)
+    return finished
+
+
+def topological_sort(graph):
+    """
+    Kahn's algorithm.
+
+    :param graph: Graph, adjacency dict or CSRGraph (a DAG)
+    :return: list of node labels such that every edge u -> v has u before v
+    :raises ValueError: if the graph contains a cycle
+    """
+    csr = CSRGraph.from_graph(graph)
+    order = _kahn(csr)
+    if len(order) < csr.num_nodes:
+        raise ValueError("Graph contains a cycle; no topological order exists")
+    label = csr.label_of
+    return [label(node) for node in order]
+
+
+def _kahn(csr):
+    """Node ids in Kahn order; shorter than V if there is a cycle."""
+    offsets, targets = csr.offsets, csr.targets
+    in_degree = array("i", [0]) * csr.num_nodes
+    for v in targets:
+        in_degree[v] += 1
+    order = array("i", (v for v in range(csr.num_nodes) if in_degree[v] == 0))
+    head = 0  # `order` doubles as the FIFO queue
+    while head < len(order):
+        u = order[head]
+        head += 1
+        start, end = offsets[u], offsets[u + 1]
+        for v in targets[start:end]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order.append(v)
+    return order
+
+
+def condensation(graph, algorithm="tarjan"):
+    """
+    Contract every SCC into one node.
+
+    :return: (dag, components) where dag is a CSRGraph over component
+             numbers 0..C-1 (already in topological order, so every edge
+             goes from a lower to a higher number) keeping the minimum
+             weight of the parallel edges between two components, and
+             components[i] lists the labels in component i
+    """
+    csr = CSRGraph.from_graph(graph)
+    comp, count = component_ids(csr, algorithm)
+    lightest = {}
+    for u, v, w in csr.edges():
+        cu, cv = comp[u], comp[v]
+        if cu != cv:
+            key = cu * count + cv
+            if w < lightest.get(key, float("inf")):
+                lightest[key] = w
+    sources = array("i")
+    dag_targets = array("i")
+    weights = array("d")
+    for key, w in lightest.items():
+        cu, cv = divmod(key, count)
+        sources.append(cu)
+        dag_targets.append(cv)
+        weights.append(w)
+    dag = CSRGraph.from_arrays(sources, dag_targets, weights, count)
+
+    components = [[] for _ in range(count)]
+    label = csr.label_of
+    for node, c in enumerate(comp):
+        components[c].append(label(node))
+    return dag, components
+
+
+# Example runnable block
+if __name__ == "__main__":
+    deps = {
+        "app": ["lib", "log"],
+        "lib": ["core", "util"],
+        "util": ["core", "lib"],  # lib <-> util cycle
+        "log": ["core"],
+        "core": [],
+    }
+    print("Tarjan SCCs:  ", tarjan_scc(deps))
+    print("Kosaraju SCCs:", kosaraju_scc(deps))
+
+    dag, components = condensation(deps)
+    print("Condensation:", components)
+    print("Build order:", [components[c] for c in topological_sort(dag)])
+
+    try:
+        topological_sort(deps)
+    except ValueError as e:
+        print("Error:", e)
@@ -0,0 +1,173 @@
+"""
+Unit tests for SCC, topological sort and condensation.
+
+Tests cover:
+- Tarjan and Kosaraju agreeing with a reachability-based reference
+- Component numbering in topological order
+- Deep graphs (long paths / cycles) without hitting the recursion limit
+- Kahn's topological sort and cycle detection
+- Condensation edges, weights and acyclicity
+- Graph, dict and CSRGraph inputs
+"""
+
+import random
+import sys
+import unittest
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.Graph.python.graph_adjacency_list import Graph
+from algorithms.graph.strongly_connected_components.python.scc import (
+    component_ids,
+    condensation,
+    kosaraju_scc,
+    strongly_connected_components,
+    tarjan_scc,
+    topological_sort,
+)
+
+
+def random_graph(n, m, rng):
+    graph = {u: {} for u in range(n)}
+    for _ in range(m):
+        graph[rng.randrange(n)][rng.randrange(n)] = rng.randint(1, 9)
+    return graph
+
+
+def reachable(graph, start):
+    seen = {start}
+    stack = [start]
+    while stack:
+        for v in graph[stack.pop()]:
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return seen
+
+
+def reference_components(graph):
+    reach = {u: reachable(graph, u) for u in graph}
+    return {frozenset(v for v in reach[u] if u in reach[v]) for u in graph}
+
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+
+    def test_small_graph(self):
+        graph = {1: [2], 2: [3], 3: [1, 4], 4: [5], 5: [4], 6: []}
+        for scc in (tarjan_scc, kosaraju_scc):
+            components = scc(graph)
+            self.assertEqual(
+                {frozenset(c) for c in components},
+                {frozenset({1, 2, 3}), frozenset({4, 5}), frozenset({6})},
+            )
+
+    def test_matches_reference_on_random_graphs(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            graph = random_graph(40, rng.randint(20, 120), rng)
+            expected = reference_components(graph)
+            for algorithm in ("tarjan", "kosaraju"):
+                components = strongly_connected_components(graph, algorithm)
+                self.assertEqual({frozenset(c) for c in components}, expected)
+                self.assertEqual(sum(map(len, components)), len(graph))
+
+    def test_components_numbered_in_topological_order(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            csr = CSRGraph.from_graph(random_graph(50, 90, rng))
+            for algorithm in ("tarjan", "kosaraju"):
+                comp, count = component_ids(csr, algorithm)
+                self.assertEqual(set(comp), set(range(count)))
+                for u, v, _ in csr.edges():
+                    self.assertLessEqual(comp[u], comp[v])
+
+    def test_deep_graph_does_not_recurse(self):
+        n = sys.getrecursionlimit() * 20
+        path = CSRGraph.from_edges(
+            [(i, i + 1, 1) for i in range(n - 1)], nodes=range(n)
+        )
+        cycle = CSRGraph.from_edges([(i, (i + 1) % n, 1) for i in range(n)])
+        for algorithm in ("tarjan", "kosaraju"):
+            self.assertEqual(component_ids(path, algorithm)[1], n)
+            comp, count = component_ids(cycle, algorithm)
+            self.assertEqual(count, 1)
+            self.assertEqual(set(comp), {0})
+
+    def test_accepts_graph_class(self):
+        g = Graph()
+        g.add_edge("a", "b", directed=True)
+        g.add_edge("b", "a", directed=True)
+        g.add_edge("b", "c", directed=True)
+        self.assertEqual([sorted(c) for c in tarjan_scc(g)], [["a", "b"], ["c"]])
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            component_ids({0: []}, "dfs")
+
+
+class TestTopologicalSort(unittest.TestCase):
+
+    def test_orders_every_edge(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            n = 60
+            rank = list(range(n))
+            rng.shuffle(rank)
+            graph = {u: {} for u in range(n)}
+            for _ in range(150):
+                a, b = rng.sample(range(n), 2)
+                u, v = (a, b) if rank[a] < rank[b] else (b, a)
+                graph[u][v] = 1
+            order = topological_sort(graph)
+            self.assertEqual(sorted(order), list(range(n)))
+            position = {node: i for i, node in enumerate(order)}
+            for u in graph:
+                for v in graph[u]:
+                    self.assertLess(position[u], position[v])
+
+    def test_cycle_raises(self):
+        with self.assertRaises(ValueError):
+            topological_sort({"a": ["b"], "b": ["c"], "c": ["a"]})
+        with self.assertRaises(ValueError):
+            topological_sort({"a": ["a"]})
+
+
+class TestCondensation(unittest.TestCase):
+
+    def test_condensation_edges(self):
+        graph = {
+            "a": {"b": 5},
+            "b": {"a": 1, "c": 4},
+            "c": {"d": 2},
+            "d": {"c": 1},
+            "e": {"c": 3},
+        }
+        dag, components = condensation(graph)
+        self.assertEqual(
+            {frozenset(c) for c in components},
+            {frozenset("ab"), frozenset("cd"), frozenset("e")},
+        )
+        which = {label: i for i, c in enumerate(components) for label in c}
+        edges = {(u, v): w for u, v, w in dag.edges()}
+        self.assertEqual(
+            edges, {(which["a"], which["c"]): 4.0, (which["e"], which["c"]): 3.0}
+        )
+
+    def test_keeps_lightest_parallel_edge_and_is_acyclic(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            graph = random_graph(40, 100, rng)
+            dag, components = condensation(graph, algorithm="kosaraju")
+            which = {label: i for i, c in enumerate(components) for label in c}
+            lightest = {}
+            for u in graph:
+                for v, w in graph[u].items():
+                    key = (which[u], which[v])
+                    if key[0] != key[1]:
+                        lightest[key] = min(w, lightest.get(key, w))
+            self.assertEqual({(u, v): w for u, v, w in dag.edges()}, lightest)
+            self.assertEqual(len(topological_sort(dag)), len(components))
+            self.assertTrue(all(u < v for u, v, _ in dag.edges()))
+
+
+if __name__ == "__main__":
+    unittest.main()
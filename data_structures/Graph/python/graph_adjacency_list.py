@@ -9,16 +9,20 @@ Time Complexity:
 - add_vertex: O(1)
 - add_edge: O(1)
 - print_graph: O(V + E) where V is the number of vertices and E is the number of edges.
+- freeze: O(V + E), produces a compact CSRGraph (see csr_graph.py).
 
 Space Complexity: O(V + E) for storing the graph.
 """
 
+
 class Graph:
     """Graph represented using an adjacency list."""
 
     def __init__(self):
         # Initialize an empty dictionary to store adjacency lists
         self.graph = {}
+        # Edge weights, kept parallel to the neighbor lists in self.graph
+        self.weights = {}
 
     def add_vertex(self, vertex):
         """
@@ -27,15 +31,17 @@ class Graph:
         """
         if vertex not in self.graph:
             self.graph[vertex] = []
+            self.weights[vertex] = []
         else:
             print(f"Vertex '{vertex}' already exists!")
 
-    def add_edge(self, vertex1, vertex2, directed=False):
+    def add_edge(self, vertex1, vertex2, directed=False, weight=1):
         """
         Adds an edge between two vertices.
         :param vertex1: The starting vertex.
         :param vertex2: The ending vertex.
         :param directed: If False, creates an undirected edge (default).
+        :param weight: Edge weight used once the graph is frozen (default 1).
         """
         # Add missing vertices automatically
         if vertex1 not in self.graph:
@@ -45,10 +51,31 @@ class Graph:
 
         # Add the edge from vertex1 to vertex2
         self.graph[vertex1].append(vertex2)
+        self.weights[vertex1].append(weight)
 
         # If undirected, also add the reverse connection
         if not directed:
             self.graph[vertex2].append(vertex1)
+            self.weights[vertex2].append(weight)
+
+    def freeze(self):
+        """
+        Returns an immutable CSRGraph snapshot of this graph.
+
+        Vertex labels are interned to integer ids in insertion order and all
+        edges are packed into flat typed arrays, which every algorithm in
+        algorithms/graph accepts directly.
+        """
+        # Imported here so this file still runs as a standalone script
+        from data_structures.Graph.python.csr_graph import CSRGraph
+
+        def edges():
+            for vertex, neighbors in self.graph.items():
+                yield from zip(
+                    [vertex] * len(neighbors), neighbors, self.weights[vertex]
+                )
+
+        return CSRGraph.from_edges(edges(), directed=True, nodes=self.graph)
 
     def print_graph(self):
         """Prints the adjacency list of the graph."""
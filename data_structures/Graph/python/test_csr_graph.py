@@ -0,0 +1,120 @@
+"""
+Unit tests for the CSRGraph compact graph representation.
+
+Tests cover:
+- Construction from edge lists and from every adjacency shape in the repo
+- Label interning and the identity (integer labels) fast path
+- Freezing a Graph into CSR form
+- Graph algorithms accepting a CSRGraph directly
+"""
+
+import unittest
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.Graph.python.graph_adjacency_list import Graph
+from algorithms.graph.a_star.python.a_star import a_star
+from algorithms.graph.bellman_ford.python.bellman_ford import bellman_ford
+from algorithms.graph.bfs.python.bfs import bfs_traversal, bfs_with_levels
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+from algorithms.graph.prims_mst.python.prims import prims_mst
+
+ROAD = {
+    "A": {"B": 4, "C": 2},
+    "B": {"A": 4, "C": 1, "D": 5},
+    "C": {"A": 2, "B": 1, "D": 8, "E": 10},
+    "D": {"B": 5, "C": 8, "E": 2, "Z": 6},
+    "E": {"C": 10, "D": 2, "Z": 3},
+    "Z": {"D": 6, "E": 3},
+}
+
+
+class TestCSRGraph(unittest.TestCase):
+    """Test cases for building and querying a CSRGraph."""
+
+    def test_from_edges_interns_labels(self):
+        csr = CSRGraph.from_edges([("x", "y", 2), ("y", "z", 3), ("x", "z", 7)])
+        self.assertEqual(csr.num_nodes, 3)
+        self.assertEqual(csr.num_edges, 3)
+        self.assertEqual(csr.node_labels(), ["x", "y", "z"])
+        x = csr.index_of("x")
+        neighbors = {csr.label_of(v): w for v, w in csr.neighbors(x)}
+        self.assertEqual(neighbors, {"y": 2, "z": 7})
+
+    def test_integer_labels_skip_interning_table(self):
+        csr = CSRGraph.from_edges([(0, 1), (1, 2)], directed=False)
+        self.assertIsNone(csr.labels)
+        self.assertEqual(csr.index_of(2), 2)
+        self.assertEqual(csr.num_edges, 4)
+        self.assertEqual(sorted(v for v, _ in csr.neighbors(1)), [0, 2])
+        with self.assertRaises(KeyError):
+            csr.index_of(3)
+
+    def test_adjacency_shapes_round_trip(self):
+        self.assertEqual(CSRGraph.from_adjacency(ROAD).to_adjacency(), ROAD)
+
+        prims_shape = {0: [(1, 2)], 1: [(0, 2), (2, 3)], 2: [(1, 3)]}
+        csr = CSRGraph.from_adjacency(prims_shape)
+        self.assertEqual(csr.to_adjacency(), {0: {1: 2}, 1: {0: 2, 2: 3}, 2: {1: 3}})
+
+        bfs_shape = {"A": ["B"], "B": ["C"]}  # C only appears as a neighbor
+        csr = CSRGraph.from_adjacency(bfs_shape)
+        self.assertEqual(csr.to_adjacency(), {"A": {"B": 1}, "B": {"C": 1}, "C": {}})
+
+    def test_reverse(self):
+        csr = CSRGraph.from_edges([("a", "b", 1), ("a", "c", 2), ("b", "c", 3)])
+        rev = csr.reverse()
+        self.assertEqual(
+            rev.to_adjacency(), {"a": {}, "b": {"a": 1}, "c": {"a": 2, "b": 3}}
+        )
+        self.assertIs(rev.reverse(), csr)
+
+    def test_freeze_graph(self):
+        g = Graph()
+        g.add_edge("A", "B", weight=3)
+        g.add_edge("B", "C", directed=True, weight=5)
+        g.add_vertex("D")
+        csr = g.freeze()
+        self.assertEqual(
+            csr.to_adjacency(),
+            {"A": {"B": 3}, "B": {"A": 3, "C": 5}, "C": {}, "D": {}},
+        )
+        self.assertIs(CSRGraph.from_graph(csr), csr)
+
+    def test_inconsistent_arrays_rejected(self):
+        with self.assertRaises(ValueError):
+            CSRGraph([0, 2], [1], [1.0])
+
+
+class TestAlgorithmsAcceptCSR(unittest.TestCase):
+    """Every graph algorithm gives the same answer on dict and CSR input."""
+
+    def setUp(self):
+        self.csr = CSRGraph.from_adjacency(ROAD)
+
+    def test_dijkstra(self):
+        self.assertEqual(dijkstra(self.csr, "A"), dijkstra(ROAD, "A"))
+
+    def test_bellman_ford(self):
+        edges = [(u, v, w) for u in ROAD for v, w in ROAD[u].items()]
+        self.assertEqual(bellman_ford(self.csr, "A"), bellman_ford(edges, "A"))
+
+    def test_a_star(self):
+        def zero(node, goal):
+            return 0
+
+        self.assertEqual(a_star("A", "Z", self.csr, zero), a_star("A", "Z", ROAD, zero))
+
+    def test_prims_mst(self):
+        prims_shape = {u: list(nbrs.items()) for u, nbrs in ROAD.items()}
+        self.assertEqual(prims_mst(self.csr, "A"), prims_mst(prims_shape, "A"))
+
+    def test_bfs(self):
+        adjacency = {u: list(nbrs) for u, nbrs in ROAD.items()}
+        self.assertEqual(bfs_traversal(self.csr, "A"), bfs_traversal(adjacency, "A"))
+        self.assertEqual(
+            bfs_with_levels(self.csr, "A"), bfs_with_levels(adjacency, "A")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Unit tests for the bulk graph loaders and the binary CSR format.
+
+Tests cover:
+- Text edge lists: comments, optional weights, ragged lines, chunk boundaries
+- CSV files with positional and named columns
+- Integer-id loading without an interning table
+- Binary round trips, both memory-mapped and copied
+- String labels decoded lazily, without building the label index at open
+- Algorithms running directly on a memory-mapped graph
+- Rejection of malformed binary files
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from data_structures.Graph.python.csr_graph import CSRGraph
+from data_structures.Graph.python.graph_io import (
+    load_binary,
+    read_csv,
+    read_edge_list,
+    save_binary,
+)
+from algorithms.graph.dijkstra.python.dijkstra import dijkstra
+
+
+def adjacency(graph):
+    return {
+        u: sorted(neighbors.items()) for u, neighbors in graph.to_adjacency().items()
+    }
+
+
+class GraphIOTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self._tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def path(self, name):
+        return os.path.join(self._tmp.name, name)
+
+
+class TestReadEdgeList(GraphIOTestCase):
+
+    def test_weights_comments_and_blank_lines(self):
+        path = self.write("g.txt", "# u v w\nA B 4\n\nA C 2.5\n  # indented\nC A 1\n")
+        graph = read_edge_list(path)
+        self.assertEqual(
+            adjacency(graph),
+            {"A": [("B", 4.0), ("C", 2.5)], "B": [], "C": [("A", 1.0)]},
+        )
+
+    def test_missing_weights_and_ragged_lines(self):
+        graph = read_edge_list(self.write("g.txt", "a b\nb c\n"))
+        self.assertEqual(list(graph.weights), [1.0, 1.0])
+        graph = read_edge_list(self.write("r.txt", "a b 3\nb c\n"))
+        self.assertEqual(
+            adjacency(graph), {"a": [("b", 3.0)], "b": [("c", 1.0)], "c": []}
+        )
+
+    def test_undirected_and_delimiter(self):
+        graph = read_edge_list(
+            self.write("g.txt", "x;y;2\n"), directed=False, delimiter=";"
+        )
+        self.assertEqual(adjacency(graph), {"x": [("y", 2.0)], "y": [("x", 2.0)]})
+
+    def test_ragged_block_with_regular_token_count(self):
+        # 9 tokens over 3 lines, like a regular 3-column block
+        path = self.write("r.txt", "a b 2\nc d\ne f 3 extra\n")
+        self.assertEqual(
+            adjacency(read_edge_list(path)),
+            {
+                "a": [("b", 2.0)],
+                "b": [],
+                "c": [("d", 1.0)],
+                "d": [],
+                "e": [("f", 3.0)],
+                "f": [],
+            },
+        )
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("g.txt", "a b\nc d e f\ng\n"))
+
+    def test_bad_line(self):
+        with self.assertRaises(ValueError):
+            read_edge_list(self.write("g.txt", "a b\nlonely\nc d e f\n"))
+
+    def test_small_chunks_match_from_edges(self):
+        rng = random.Random(1)
+        edges = [
+            (f"n{rng.randrange(300)}", f"n{rng.randrange(300)}", rng.randint(1, 9))
+            for _ in range(2000)
+        ]
+        path = self.write("g.txt", "".join(f"{u} {v} {w}\n" for u, v, w in edges))
+        expected = CSRGraph.from_edges(edges)
+        for chunk_size in (7, 100, 1 << 20):
+            graph = read_edge_list(path, chunk_size=chunk_size)
+            self.assertEqual(adjacency(graph), adjacency(expected))
+
+    def test_integer_ids(self):
+        graph = read_edge_list(self.write("g.txt", "0 3\n3 1\n"), integer_ids=True)
+        self.assertIsNone(graph.labels)
+        self.assertEqual(graph.num_nodes, 4)
+        self.assertEqual(dijkstra(graph, 0), {0: 0, 1: 2.0, 2: float("inf"), 3: 1.0})
+
+    def test_empty_file(self):
+        graph = read_edge_list(self.write("g.txt", "# nothing\n"))
+        self.assertEqual((graph.num_nodes, graph.num_edges), (0, 0))
+
+
+class TestReadCSV(GraphIOTestCase):
+
+    def test_named_columns(self):
+        path = self.write("g.csv", 'km,from,to\n4,"Main St, 1",B\n2,B,C\n\n')
+        graph = read_csv(path, source="from", target="to", weight="km", header=True)
+        self.assertEqual(
+            adjacency(graph),
+            {"Main St, 1": [("B", 4.0)], "B": [("C", 2.0)], "C": []},
+        )
+
+    def test_positional_columns_in_chunks(self):
+        rows = "".join(f"{i},{(i * 7) % 50}\n" for i in range(50))
+        path = self.write("g.csv", rows)
+        graph = read_csv(path, integer_ids=True, chunk_rows=8, directed=False)
+        self.assertEqual(graph.num_nodes, 50)
+        self.assertEqual(graph.num_edges, 100)
+
+    def test_unknown_column(self):
+        path = self.write("g.csv", "a,b\n1,2\n")
+        with self.assertRaises(ValueError):
+            read_csv(path, source="src", header=True)
+
+
+class TestBinaryFormat(GraphIOTestCase):
+
+    def test_round_trip_with_labels(self):
+        graph = CSRGraph.from_adjacency(
+            {(0, 0): {(0, 1): 1.5}, (0, 1): {(1, 1): 2}, (1, 1): {}, "hub": {(0, 0): 3}}
+        )
+        path = self.path("g.csr")
+        self.assertEqual(save_binary(graph, path), os.path.getsize(path))
+        for use_mmap in (True, False):
+            loaded = load_binary(path, use_mmap=use_mmap)
+            self.assertEqual(list(loaded.labels), graph.labels)
+            self.assertEqual(adjacency(loaded), adjacency(graph))
+
+    def test_string_labels_are_decoded_lazily(self):
+        path = self.write("g.txt", "Zürich Genève 2\nGenève Bern 1.5\nBern Zürich 3\n")
+        graph = read_edge_list(path)
+        binary_path = self.path("g.csr")
+        save_binary(graph, binary_path)
+        loaded = load_binary(binary_path)
+        self.assertIsNone(loaded._index)  # nothing decoded yet
+        self.assertEqual(loaded.label_of(1), "Genève")
+        self.assertEqual(loaded.labels[-1], "Bern")
+        self.assertEqual(loaded.labels[0:2], ["Zürich", "Genève"])
+        self.assertEqual(loaded.index_of("Bern"), 2)
+        self.assertIn("Zürich", loaded)
+        self.assertEqual(adjacency(loaded), adjacency(graph))
+        with self.assertRaises(IndexError):
+            loaded.labels[3]
+
+    def test_mapped_graph_runs_algorithms(self):
+        rng = random.Random(3)
+        edges = [
+            (rng.randrange(200), rng.randrange(200), rng.randint(1, 50))
+            for _ in range(1500)
+        ]
+        graph = CSRGraph.from_edges(edges, nodes=range(200))
+        path = self.path("g.csr")
+        save_binary(graph, path)
+        loaded = load_binary(path)
+        self.assertIsNone(loaded.labels)
+        self.assertIsInstance(loaded.targets, memoryview)
+        self.assertEqual(dijkstra(loaded, 0), dijkstra(graph, 0))
+        self.assertEqual(adjacency(loaded.reverse()), adjacency(graph.reverse()))
+
+    def test_odd_edge_count_is_padded(self):
+        graph = CSRGraph.from_edges([(0, 1, 0.5), (1, 2, 1.5), (2, 0, 2.5)])
+        path = self.path("g.csr")
+        save_binary(graph, path)
+        self.assertEqual(list(load_binary(path).weights), [0.5, 1.5, 2.5])
+
+    def test_rejects_bad_files(self):
+        bad_magic = self.write("bad.csr", "x" * 64)
+        with self.assertRaises(ValueError):
+            load_binary(bad_magic)
+
+        path = self.path("g.csr")
+        save_binary(CSRGraph.from_edges([(0, 1, 1.0)]), path)
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:-4])
+        with self.assertRaises(ValueError):
+            load_binary(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
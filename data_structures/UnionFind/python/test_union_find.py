@@ -0,0 +1,100 @@
+"""
+Unit tests for UnionFind and LabeledUnionFind.
+
+Tests cover:
+- union/find/connected and component counting
+- Batched union_many/find_many agreeing with single operations
+- Label interning for non-integer elements
+- Kruskal's MST, which is built on UnionFind
+"""
+
+import random
+import unittest
+
+from data_structures.UnionFind.python.union_find import LabeledUnionFind, UnionFind
+from algorithms.graph.kruskal_mst.python.kruskal import kruskal
+
+
+class TestUnionFind(unittest.TestCase):
+    """Test cases for the integer, array-backed UnionFind."""
+
+    def test_union_and_find(self):
+        uf = UnionFind(6)
+        self.assertEqual(uf.num_components, 6)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(1, 2))
+        self.assertFalse(uf.union(0, 2))
+        self.assertTrue(uf.connected(0, 2))
+        self.assertFalse(uf.connected(0, 3))
+        self.assertEqual(uf.component_size(2), 3)
+        self.assertEqual(uf.num_components, 4)
+        self.assertEqual(uf.find(0), uf.find(2))
+
+    def test_add_grows(self):
+        uf = UnionFind()
+        a, b = uf.add(), uf.add()
+        self.assertEqual((a, b), (0, 1))
+        uf.union(a, b)
+        self.assertEqual(len(uf), 2)
+        self.assertEqual(uf.num_components, 1)
+
+    def test_batched_matches_single(self):
+        rng = random.Random(7)
+        n = 500
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(400)]
+
+        single = UnionFind(n)
+        merges = sum(single.union(a, b) for a, b in pairs)
+        batched = UnionFind(n)
+        self.assertEqual(batched.union_many(pairs), merges)
+        self.assertEqual(batched.num_components, single.num_components)
+
+        roots = batched.find_many(range(n))
+        for a in range(0, n, 7):
+            for b in range(0, n, 11):
+                self.assertEqual(roots[a] == roots[b], single.connected(a, b))
+
+    def test_paths_are_flattened(self):
+        uf = UnionFind(1000)
+        # Force a long chain, then check find shortens it
+        for x in range(999):
+            uf.parent[x] = x + 1
+        self.assertEqual(uf.find(0), 999)
+        self.assertLess(sum(1 for x in range(1000) if uf.parent[x] == x + 1), 999)
+
+    def test_components(self):
+        uf = UnionFind(5)
+        uf.union_many([(0, 4), (1, 2)])
+        groups = sorted(sorted(members) for members in uf.components().values())
+        self.assertEqual(groups, [[0, 4], [1, 2], [3]])
+
+
+class TestLabeledUnionFind(unittest.TestCase):
+    """Test cases for the label-interning wrapper."""
+
+    def test_labels(self):
+        uf = LabeledUnionFind(["x"])
+        self.assertEqual(uf.union_many([("a", "b"), ("b", "c"), ("d", "e")]), 3)
+        self.assertTrue(uf.connected("a", "c"))
+        self.assertFalse(uf.connected("a", "e"))
+        self.assertFalse(uf.connected("a", "unknown"))
+        self.assertEqual(uf.num_components, 3)
+        self.assertEqual(len(uf), 6)
+        self.assertEqual(uf.find_many(["a", "c"]), [uf.find("b")] * 2)
+        self.assertEqual(uf.component_size("e"), 2)
+        groups = sorted(sorted(m) for m in uf.components().values())
+        self.assertEqual(groups, [["a", "b", "c"], ["d", "e"], ["x"]])
+
+
+class TestKruskal(unittest.TestCase):
+    """Kruskal's MST uses UnionFind for cycle detection."""
+
+    def test_sample_graph(self):
+        edges = [(1, 0, 1), (3, 0, 2), (3, 1, 2), (6, 1, 3), (2, 2, 3)]
+        mst, total = kruskal(4, edges)
+        self.assertEqual(total, 6)
+        self.assertEqual(len(mst), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# File: data_structures/UnionFind/python/union_find.py
+
+"""
+Union-Find (Disjoint Set Union) Implementation in Python
+
+Keeps a partition of the elements 0..n-1 into disjoint sets and answers
+"are a and b in the same set?" while sets are merged.
+
+Storage is two flat `array('i')` buffers (parent and set size, 4 bytes per
+element each) instead of one Python object per element, so tens of millions
+of elements fit in memory.
+
+- find uses path halving: every visited node is re-pointed to its
+  grandparent, flattening the tree without a second pass or recursion.
+- union attaches the smaller set's root under the larger one (union by size).
+
+Together they give an amortized O(α(n)) cost per operation, where α is the
+inverse Ackermann function (at most 4 for any practical n).
+
+Time Complexity:
+- find(x), union(a, b), connected(a, b): O(α(n)) amortized
+- union_many / find_many over k items: O(k α(n))
+
+Space Complexity: O(n)
+
+LabeledUnionFind (below) wraps UnionFind for hashable, non-integer elements
+by interning each label to an integer id on first use.
+"""
+
+from array import array
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1 with array-backed storage."""
+
+    def __init__(self, n=0):
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.num_components = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self):
+        """Add a new singleton element and return its id."""
+        x = len(self.parent)
+        self.parent.append(x)
+        self.size.append(1)
+        self.num_components += 1
+        return x
+
+    def find(self, x):
+        """Return the representative (root) of the set containing x."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        """
+        Merge the sets containing a and b.
+        Returns True if they were separate, False if already connected.
+        """
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.num_components -= 1
+        return True
+
+    def connected(self, a, b):
+        """Return True if a and b are in the same set."""
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x):
+        """Number of elements in the set containing x."""
+        return self.size[self.find(x)]
+
+    def union_many(self, pairs):
+        """
+        Union every (a, b) pair of an iterable (e.g. `zip(us, vs)` over two
+        arrays). Finds are inlined so the per-pair cost is a tight loop
+        without method calls. Returns the number of merges performed.
+        """
+        parent, size = self.parent, self.size
+        merged = 0
+        for a, b in pairs:
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            merged += 1
+        self.num_components -= merged
+        return merged
+
+    def find_many(self, xs):
+        """Return an `array('i')` with the representative of every x in xs."""
+        parent = self.parent
+        roots = array("i")
+        append = roots.append
+        for x in xs:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            append(x)
+        return roots
+
+    def components(self):
+        """Return {root: [members]} for every set."""
+        groups = {}
+        for x, root in enumerate(self.find_many(range(len(self.parent)))):
+            groups.setdefault(root, []).append(x)
+        return groups
+
+    def __str__(self):
+        return f"UnionFind({len(self)} elements, {self.num_components} sets)"
+
+
+class LabeledUnionFind:
+    """
+    Union-Find over arbitrary hashable labels. Labels are interned to ids of
+    an inner UnionFind the first time they are seen, so storage stays
+    array-backed apart from the label table itself.
+    """
+
+    def __init__(self, labels=()):
+        self._uf = UnionFind()
+        self._index = {}  # label -> id
+        self._labels = []  # id -> label
+        for label in labels:
+            self._id(label)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __contains__(self, label):
+        return label in self._index
+
+    @property
+    def num_components(self):
+        return self._uf.num_components
+
+    def _id(self, label):
+        """Return the id of `label`, adding it as a singleton if new."""
+        x = self._index.get(label)
+        if x is None:
+            x = self._uf.add()
+            self._index[label] = x
+            self._labels.append(label)
+        return x
+
+    def add(self, label):
+        """Add `label` as a singleton set (no-op if already present)."""
+        self._id(label)
+
+    def find(self, label):
+        """Return the representative label of the set containing `label`."""
+        return self._labels[self._uf.find(self._index[label])]
+
+    def union(self, a, b):
+        """Merge the sets containing a and b; returns True if they were separate."""
+        return self._uf.union(self._id(a), self._id(b))
+
+    def connected(self, a, b):
+        """Return True if a and b are in the same set (unknown labels never are)."""
+        if a not in self._index or b not in self._index:
+            return a == b
+        return self._uf.connected(self._index[a], self._index[b])
+
+    def component_size(self, label):
+        return self._uf.component_size(self._index[label])
+
+    def union_many(self, pairs):
+        """Union every (a, b) pair of labels; returns the number of merges."""
+        intern = self._id
+        return self._uf.union_many((intern(a), intern(b)) for a, b in pairs)
+
+    def find_many(self, labels):
+        """Return the representative label of every label in `labels`."""
+        index, names = self._index, self._labels
+        return [names[root] for root in self._uf.find_many(index[x] for x in labels)]
+
+    def components(self):
+        """Return {representative label: [member labels]} for every set."""
+        names = self._labels
+        return {
+            names[root]: [names[x] for x in members]
+            for root, members in self._uf.components().items()
+        }
+
+
+if __name__ == "__main__":
+    uf = UnionFind(8)
+    print("Initial:", uf)
+    print("union(0, 1):", uf.union(0, 1))
+    print("union(2, 3):", uf.union(2, 3))
+    print("union(1, 3):", uf.union(1, 3))
+    print("union(0, 2):", uf.union(0, 2), "(already connected)")
+    print("Merged by union_many:", uf.union_many(zip([4, 5], [5, 6])))
+    print("connected(0, 3):", uf.connected(0, 3))
+    print("connected(0, 4):", uf.connected(0, 4))
+    print("Roots:", list(uf.find_many(range(8))))
+    print("Components:", uf.components())
+    print(uf)
+
+    friends = LabeledUnionFind()
+    friends.union_many([("ann", "bob"), ("bob", "cat"), ("dan", "eve")])
+    print("\nann ~ cat:", friends.connected("ann", "cat"))
+    print("ann ~ eve:", friends.connected("ann", "eve"))
+    print("Groups:", friends.components())
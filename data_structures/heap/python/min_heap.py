@@ -11,6 +11,11 @@ Time Complexity:
 - get_min(): O(1)
 - extract_min(): O(log n)
 
+IndexedMinHeap (below) is a d-ary variant holding one (item, key) entry per
+item with a position index, which adds:
+- decrease_key(item, key): O(log_d n)
+- `item in heap`: O(1)
+
 Space Complexity: O(n)
 """
 
@@ -87,6 +92,125 @@ class MinHeap:
         return str(self.heap)
 
 
+class IndexedMinHeap:
+    """
+    d-ary min-heap of (item, key) pairs supporting true decrease-key.
+
+    Each item appears at most once; a dict maps item -> slot so its key can be
+    lowered in place instead of pushing a duplicate entry (as a lazy `heapq`
+    does). A wider node (arity 4 by default) makes the tree shallower, which
+    suits workloads like Dijkstra that do many more decrease-keys than pops.
+    """
+
+    def __init__(self, arity=4):
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2")
+        self.arity = arity
+        self._items = []  # items in heap order
+        self._keys = []  # keys parallel to self._items
+        self._position = {}  # item -> index in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def is_empty(self):
+        """Return True if the heap holds no items."""
+        return not self._items
+
+    def key_of(self, item):
+        """Return the current key of `item` (KeyError if absent)."""
+        return self._keys[self._position[item]]
+
+    def insert(self, item, key):
+        """
+        Insert `item` with `key`, or lower its key if it is already present
+        with a larger one. Returns True if the heap changed.
+        """
+        index = self._position.get(item)
+        if index is None:
+            self._items.append(item)
+            self._keys.append(key)
+            self._sift_up(len(self._items) - 1)
+            return True
+        if key < self._keys[index]:
+            self._keys[index] = key
+            self._sift_up(index)
+            return True
+        return False
+
+    def decrease_key(self, item, key):
+        """Lower the key of an item already in the heap."""
+        index = self._position[item]
+        if key > self._keys[index]:
+            raise ValueError("New key is larger than the current key")
+        self._keys[index] = key
+        self._sift_up(index)
+
+    def get_min(self):
+        """Return the (item, key) pair with the smallest key without removing it."""
+        if not self._items:
+            return None
+        return self._items[0], self._keys[0]
+
+    def extract_min(self):
+        """Remove and return the (item, key) pair with the smallest key."""
+        if not self._items:
+            return None
+        items, keys = self._items, self._keys
+        top = items[0], keys[0]
+        del self._position[items[0]]
+
+        # Move the last entry to the root and heapify down
+        last_item, last_key = items.pop(), keys.pop()
+        if items:
+            items[0], keys[0] = last_item, last_key
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, index):
+        """Move the entry at `index` up until its parent's key is not larger."""
+        items, keys, position = self._items, self._keys, self._position
+        item, key = items[index], keys[index]
+        while index > 0:
+            parent = (index - 1) // self.arity
+            if keys[parent] <= key:
+                break
+            items[index], keys[index] = items[parent], keys[parent]
+            position[items[index]] = index
+            index = parent
+        items[index], keys[index] = item, key
+        position[item] = index
+
+    def _sift_down(self, index):
+        """Move the entry at `index` down below any child with a smaller key."""
+        items, keys, position = self._items, self._keys, self._position
+        size, arity = len(items), self.arity
+        item, key = items[index], keys[index]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            # Find the smallest of the (up to `arity`) children
+            child, child_key = first, keys[first]
+            for c in range(first + 1, min(first + arity, size)):
+                if keys[c] < child_key:
+                    child, child_key = c, keys[c]
+            if child_key >= key:
+                break
+            items[index], keys[index] = items[child], child_key
+            position[items[index]] = index
+            index = child
+        items[index], keys[index] = item, key
+        position[item] = index
+
+    def __str__(self):
+        """String representation of the heap."""
+        return str(list(zip(self._items, self._keys)))
+
+
 # ---------------------------
 # Runnable Example Block
 # ---------------------------
@@ -104,3 +228,12 @@ if __name__ == "__main__":
     print("\nExtracting elements:")
     while heap.get_min() is not None:
         print(f"Extracted: {heap.extract_min()} | Current Heap: {heap}")
+
+    print("\nIndexed Min-Heap Example Run\n")
+    indexed = IndexedMinHeap(arity=4)
+    for task, priority in [("a", 10), ("b", 5), ("c", 7)]:
+        indexed.insert(task, priority)
+    indexed.decrease_key("a", 1)
+    print("After decreasing 'a' to 1:", indexed)
+    while not indexed.is_empty():
+        print("Extracted:", indexed.extract_min())
@@ -0,0 +1,63 @@
+"""
+Unit tests for MinHeap and IndexedMinHeap.
+"""
+
+import random
+import unittest
+
+from min_heap import IndexedMinHeap, MinHeap
+
+
+class TestMinHeap(unittest.TestCase):
+    """Test cases for the binary MinHeap."""
+
+    def test_extracts_in_sorted_order(self):
+        heap = MinHeap()
+        for num in [10, 5, 3, 2, 8]:
+            heap.insert(num)
+        self.assertEqual([heap.extract_min() for _ in range(5)], [2, 3, 5, 8, 10])
+        self.assertIsNone(heap.extract_min())
+
+
+class TestIndexedMinHeap(unittest.TestCase):
+    """Test cases for the d-ary IndexedMinHeap with decrease-key."""
+
+    def test_one_entry_per_item(self):
+        heap = IndexedMinHeap()
+        self.assertTrue(heap.insert("a", 5))
+        self.assertFalse(heap.insert("a", 9))  # larger key is ignored
+        self.assertTrue(heap.insert("a", 1))  # smaller key decreases
+        self.assertEqual(len(heap), 1)
+        self.assertEqual(heap.extract_min(), ("a", 1))
+        self.assertIsNone(heap.extract_min())
+
+    def test_decrease_key(self):
+        heap = IndexedMinHeap(arity=2)
+        for item, key in [("x", 10), ("y", 20), ("z", 30)]:
+            heap.insert(item, key)
+        heap.decrease_key("z", 1)
+        self.assertEqual(heap.get_min(), ("z", 1))
+        self.assertIn("y", heap)
+        with self.assertRaises(ValueError):
+            heap.decrease_key("y", 25)
+
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            IndexedMinHeap(arity=1)
+
+    def test_random_operations_match_sorting(self):
+        rng = random.Random(7)
+        for arity in (2, 3, 4, 8):
+            heap = IndexedMinHeap(arity=arity)
+            best = {}
+            for _ in range(500):
+                item, key = rng.randrange(100), rng.randrange(1000)
+                heap.insert(item, key)
+                best[item] = min(key, best.get(item, key))
+            popped = [heap.extract_min() for _ in range(len(heap))]
+            self.assertEqual(sorted(popped, key=lambda p: p[1]), popped)
+            self.assertEqual(dict(popped), best)
+
+
+if __name__ == "__main__":
+    unittest.main()